@@ -1,20 +1,48 @@
 from __future__ import annotations
+from nord_skc import startup   # первым: отсчёт времени запуска
+import os
 import sys
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
-from nord_skc.config import load_config
+from nord_skc.config import config_service
+from nord_skc.recorder import recover_all
 from nord_skc.ui.main_window import MainWindow
 
 def main() -> int:
-    cfg = load_config("config.yaml")
+    startup.mark("imports")
+    # config.yaml разбирается один раз; окна берут настройки из кэша сервиса
+    svc = config_service("config.yaml")
+    cfg = svc.config
+    startup.mark("config")
+    # записи, оборванные падением/выключением, — восстанавливаем до целой строки
+    recover_all("records")
+    startup.mark("recover")
     app = QApplication(sys.argv)
     with open("nord_skc/ui/style.qss", encoding="utf-8") as f:
         app.setStyleSheet(f.read())
+    startup.mark("qt")
 
     w = MainWindow(cfg)
     w.resize(1400, 800)
+    startup.mark("main_window")
+
+    report_path = os.environ.get(startup.ENV_REPORT)
+
+    def on_first_paint():
+        startup.mark("first_paint")
+        print(startup.report.summary(), flush=True)
+        if report_path:
+            startup.report.export_json(report_path)
+            # закрываем уже после отрисовки, не изнутри paintEvent
+            QTimer.singleShot(0, w.close)
+            QTimer.singleShot(0, app.quit)
+
+    w.first_painted.connect(on_first_paint)
     w.show()
 
-    return app.exec()
+    code = app.exec()
+    svc.close()   # отложенные сохранения настроек — на диск
+    return code
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Стоимость кадра AssetWindow.tick в зависимости от длины истории и числа каналов
+(offscreen Qt: QT_QPA_PLATFORM=offscreen ставится автоматически) и отдельно —
+плиток значений на 120 каналах в зависимости от того, сколько показаний изменилось.
+
+Поток опроса окна останавливается сразу после создания: в кадр подаётся ровно
+одна новая точка: запись в хранилище (это делает поток опроса) + _ingest + _render
+(то, что делает tick).
+
+    python benchmarks/bench_asset_window.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+from common import best_of, require
+
+from nord_skc.config import AppConfig, AssetConfig
+from nord_skc.drivers.base import BaseDriver
+from nord_skc.model import ReadResult
+
+
+class _IdleDriver(BaseDriver):
+    """Драйвер без данных: окну нужен драйвер, но точки в бенчмарке подаются напрямую."""
+
+    def connect(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def read_once(self) -> ReadResult:
+        return ReadResult(ok=True, values={})
+
+
+def _app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    require("PySide6")
+    require("pyqtgraph")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def bench_tick(history: int, channels: int, frames: int) -> float:
+    """Среднее время кадра, мс."""
+    app = _app()
+    from nord_skc.ui.asset_window import AssetWindow
+
+    cfg = AppConfig(name="bench", poll_hz=1, history_seconds=history, render_fps=1)
+    # хранилище общее на процесс: у каждого замера свой агрегат
+    asset = AssetConfig(id=f"B-{history}-{channels}", fleet_no=1, plate="", type="bench", ip="", extra={})
+    w = AssetWindow(cfg, asset, _IdleDriver(), config_path=os.devnull)
+    w.timer.stop()
+    w.worker.stop(timeout=1.0)
+    w.resize(1200, 800)
+    w.show()
+    app.processEvents()
+
+    names: List[str] = [f"ch{i:02d}" for i in range(channels)]
+    t0 = time.time() - history
+    first = {k: 0.0 for k in names}
+    w.history.append(t0, first)
+    w._ingest([(t0, ReadResult(ok=True, values=first))])
+    for i in range(1, history):
+        w.history.append(t0 + i, {k: float((i + j) % 100) for j, k in enumerate(names)})
+    w._render()
+    app.processEvents()
+
+    step = [history]
+
+    def frame():
+        ts = t0 + step[0]
+        step[0] += 1
+        values = {k: float(ts % 100) for k in names}
+        w.history.append(ts, values)
+        w._ingest([(ts, ReadResult(ok=True, values=values))])
+        w._render()
+
+    try:
+        return best_of(frame, repeat=3, number=frames) * 1e3
+    finally:
+        w.stop_acquisition()
+        w.close()
+        w.deleteLater()
+        app.processEvents()
+        w.store.drop(asset.id)
+
+
+def bench_tiles(channels: int, frames: int, changed: int) -> float:
+    """Кадр плиток значений (set_values + отрисовка), мс: из channels меняется changed."""
+    app = _app()
+    from nord_skc.ui.value_grid import ValueGridArea
+
+    area = ValueGridArea(max_rows=3)
+    area.resize(1200, 220)
+    area.show()
+    names = [f"tag{i:03d}" for i in range(channels)]
+    area.grid.set_values({k: 0.0 for k in names})
+    app.processEvents()
+
+    step = [0]
+
+    def frame():
+        step[0] += 1
+        n = step[0]
+        area.grid.set_values({k: float(n if i < changed else 0) for i, k in enumerate(names)})
+        app.processEvents()
+
+    try:
+        return best_of(frame, repeat=3, number=frames) * 1e3
+    finally:
+        area.close()
+        area.deleteLater()
+        app.processEvents()
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    histories = (1_000, 10_000) if quick else (1_000, 10_000, 100_000)
+    for history in histories:
+        for channels in (4, 12, 48):
+            out[f"tick_h{history}_c{channels}_ms"] = bench_tick(history, channels, 5 if quick else 20)
+    for changed in (0, 10, 120):
+        out[f"tiles_c120_changed{changed}_ms"] = bench_tiles(120, 20 if quick else 100, changed)
+    return out
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
+    sys.stdout.flush()
+    # завершение PySide6 + pyqtgraph на выходе интерпретатора бывает нестабильным
+    os._exit(0)
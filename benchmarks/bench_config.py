@@ -0,0 +1,58 @@
+"""
+Время load_config: config.yaml репозитория и синтетический флот на 500 агрегатов
+(S7 с тегами и SERVA вперемешку, с ui-настройками линий); настройки линий
+при открытии окна — из кэша ConfigService, без чтения файла.
+
+    python benchmarks/bench_config.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from typing import Dict
+
+import yaml
+
+from common import ROOT, best_of
+
+from nord_skc.config import ConfigService, load_config
+
+
+def make_fleet(n_assets: int) -> dict:
+    assets = []
+    for i in range(n_assets):
+        # новые словари на каждый агрегат: иначе safe_dump свернёт их в YAML-ссылки
+        tags = {f"tag{t:02d}": {"db": 1, "start": 4 * t, "size": 4, "dtype": "REAL"} for t in range(40)}
+        series = {k: {"visible": True, "color": "#ff00aa"} for k in tags}
+        a = {"id": f"F-{i:03d}", "fleet_no": i, "plate": "", "ip": f"10.0.{i // 250}.{i % 250}"}
+        if i % 2:
+            a.update(type="serva_tcp", port=6565, field_names=[], vendor="SERVA")
+        else:
+            a.update(type="siemens_s7", rack=0, slot=1, tags=tags, vendor="JEREH", ui={"series": series})
+        assets.append(a)
+    return {"app": {"name": "bench", "poll_hz": 1, "history_seconds": 900}, "assets": assets}
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    repo_cfg = os.path.join(ROOT, "config.yaml")
+    if os.path.exists(repo_cfg):
+        out["load_repo_config_ms"] = best_of(lambda: load_config(repo_cfg), number=5) * 1e3
+
+    n = 100 if quick else 500
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "fleet.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(make_fleet(n), f, allow_unicode=True, sort_keys=False)
+        out[f"load_fleet{n}_ms"] = best_of(lambda: load_config(path), repeat=3) * 1e3
+        out[f"fleet{n}_kb"] = os.path.getsize(path) / 1e3
+
+        svc = ConfigService(path, watch=False)
+        out["ui_series_us"] = best_of(lambda: svc.ui_series("F-000"), number=100) * 1e6
+    return out
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
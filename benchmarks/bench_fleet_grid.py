@@ -0,0 +1,88 @@
+"""
+Главное окно на большом флоте: создание MainWindow до первой отрисовки сетки,
+перерисовка видимой части и поиск (offscreen Qt).
+
+Агрегаты — типа replay: фоновая проверка связи их не трогает, меряется только UI.
+
+    python benchmarks/bench_fleet_grid.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Dict
+
+from common import best_of, require
+
+from nord_skc.config import AppConfig, AssetConfig, Config
+
+
+def _app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    require("PySide6")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def _fleet(n: int) -> Config:
+    app = AppConfig(name="bench", poll_hz=1, history_seconds=60, health_check_s=0)
+    vendors = ("jereh", "serva")
+    assets = [
+        AssetConfig(
+            id=f"F-{i:04d}", fleet_no=i, plate=f"А{i:03d}ВС 1{i % 90:02d}", type="replay", ip="",
+            extra={"vendor": vendors[i % 2]},
+        )
+        for i in range(1, n + 1)
+    ]
+    return Config(app=app, assets=assets)
+
+
+def bench_fleet(n: int, repeat: int) -> Dict[str, float]:
+    app = _app()
+    from nord_skc.ui.main_window import MainWindow
+
+    cfg = _fleet(n)
+    windows = []
+
+    def build():
+        w = MainWindow(cfg)
+        w.resize(1400, 800)
+        w.show()
+        app.processEvents()
+        windows.append(w)
+
+    build_s = best_of(build, repeat=repeat)
+    w = windows[-1]
+    for old in windows[:-1]:
+        old.close()
+
+    view = w.fleet_view.viewport()
+    repaint_s = best_of(view.repaint, repeat=repeat, number=5)
+
+    def search():
+        w.search.setText("1")
+        w.search.setText("")
+
+    search_s = best_of(search, repeat=repeat) / 2
+    w.close()
+    app.processEvents()
+    return {
+        f"first_paint_{n}_ms": build_s * 1e3,
+        f"repaint_{n}_ms": repaint_s * 1e3,
+        f"search_{n}_ms": search_s * 1e3,
+    }
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for n in (13, 300) if quick else (13, 300, 1000):
+        out.update(bench_fleet(n, 3 if quick else 5))
+    return out
+
+
+if __name__ == "__main__":
+    t = time.perf_counter()
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
+    print(f"{time.perf_counter() - t:.1f} s", file=sys.stderr)
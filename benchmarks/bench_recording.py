@@ -0,0 +1,58 @@
+"""
+Запись сессии: append() всех точек + save (finalize) для 1M точек, CSV и .nskc.
+
+append_per_s — сколько точек в секунду принимает append() (это цена для GUI);
+finalize_ms — сколько ждёт «Сохранить» после последней точки;
+total_s — от первой точки до готового файла.
+
+    python benchmarks/bench_recording.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from common import ROOT  # noqa: F401  (корень репозитория в sys.path)
+
+from nord_skc.recorder import FORMATS, SessionRecorder
+
+CHANNELS = [f"field_{i:02d}" for i in range(1, 13)]
+
+
+def bench_format(fmt: str, n: int) -> Dict[str, float]:
+    t0 = time.time()
+    rows = [{k: float((i + j) % 1000) * 0.125 for j, k in enumerate(CHANNELS)} for i in range(1000)]
+
+    with tempfile.TemporaryDirectory() as d:
+        rec = SessionRecorder(os.path.join(d, f"bench.{fmt}"), CHANNELS, fmt=fmt)
+        t = time.perf_counter()
+        for i in range(n):
+            rec.append(t0 + i * 0.01, rows[i % 1000])
+        t_append = time.perf_counter() - t
+        t1 = time.perf_counter()
+        path = rec.finalize()
+        t_finalize = time.perf_counter() - t1
+        size = os.path.getsize(path)
+
+    return {
+        f"{fmt}_append_per_s": n / t_append,
+        f"{fmt}_finalize_ms": t_finalize * 1e3,
+        f"{fmt}_total_s": t_append + t_finalize,
+        f"{fmt}_file_mb": size / 1e6,
+    }
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    n = 100_000 if quick else 1_000_000
+    out: Dict[str, float] = {"samples": float(n)}
+    for fmt in FORMATS:
+        out.update(bench_format(fmt, n))
+    return out
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
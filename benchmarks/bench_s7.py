@@ -0,0 +1,97 @@
+"""
+Siemens S7:
+- _parse_value и S7ReadPlan.decode (разбор значений, без сети): 500 тегов REAL/INT/DINT
+  и 500 тегов всех типов (BOOL по битам, BYTE/WORD/DWORD, LREAL, TIME, STRING)
+- SiemensS7Driver.read_once против локального snap7-сервера (jereh_fake.FakePlc)
+  при разном числе тегов
+
+    python benchmarks/bench_s7.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import time
+from typing import Dict
+
+from common import Skip, best_of, free_port, require
+
+
+def bench_parse(n: int) -> Dict[str, float]:
+    require("snap7")
+    from nord_skc.drivers.s7_plan import S7ReadPlan
+    from nord_skc.drivers.siemens_s7 import _parse_value
+    from jereh_fake import ALL_KINDS, synthetic_tags
+
+    raw_real = struct.pack(">f", 12.5)
+    raw_int = struct.pack(">h", -42)
+    raw_dint = struct.pack(">i", 123456)
+
+    def parse():
+        for _ in range(n):
+            _parse_value(raw_real, "REAL")
+            _parse_value(raw_int, "INT")
+            _parse_value(raw_dint, "DINT")
+
+    def decode_rate(tags: dict) -> float:
+        plan = S7ReadPlan(tags, pdu_size=960)
+        raws = [bytes(b.size) for b in plan.blocks]
+        texts: Dict[str, str] = {}
+
+        def decode():
+            plan.decode(raws, texts)
+
+        return len(tags) / best_of(decode, number=50)
+
+    return {
+        "parse_value_per_s": 3 * n / best_of(parse),
+        "plan_decode_500_tags_per_s": decode_rate(synthetic_tags(500)),
+        "plan_decode_500_all_types_per_s": decode_rate(synthetic_tags(500, kinds=ALL_KINDS)),
+    }
+
+
+def bench_read_once(n_tags: int, reads: int, all_types: bool = False) -> Dict[str, float]:
+    require("snap7")
+    from jereh_fake import ALL_KINDS, KINDS, FakePlc, make_tags, synthetic_tags
+    from nord_skc.drivers.siemens_s7 import SiemensS7Driver
+
+    tags = synthetic_tags(n_tags, kinds=ALL_KINDS if all_types else KINDS)
+    key = f"{n_tags}_all_types" if all_types else f"{n_tags}_tags"
+    port = free_port()
+    plc = FakePlc("127.0.0.1", port, make_tags(tags, seed=1), min_db_size=0, rate_hz=10.0)
+    try:
+        plc.start()
+    except Exception as e:
+        raise Skip(f"snap7 server did not start: {e}")
+
+    drv = SiemensS7Driver("127.0.0.1", 0, 1, tags, port=port)
+    try:
+        drv.connect()
+        rr = drv.read_once()
+        assert rr.ok and len(rr.values) + len(rr.texts) == n_tags, rr.error
+        t = time.perf_counter()
+        for _ in range(reads):
+            drv.read_once()
+        total = time.perf_counter() - t
+        blocks = len(drv._plan.blocks)
+    finally:
+        drv.close()
+        plc.stop()
+    return {
+        f"read_once_{key}_per_s": reads / total,
+        f"read_once_{key}_ms": total / reads * 1e3,
+        f"read_once_{key}_blocks": float(blocks),
+    }
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    out = bench_parse(2000 if quick else 20000)
+    for n_tags in (10, 100, 500):
+        out.update(bench_read_once(n_tags, 50 if quick else 500))
+    out.update(bench_read_once(500, 50 if quick else 500, all_types=True))
+    return out
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
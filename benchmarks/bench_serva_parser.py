@@ -0,0 +1,89 @@
+"""
+Микро-бенчмарк разбора кадров SERVA: старый построчный разбор
+(bytearray + del + split + float) против ServaFrameParser.
+
+    python benchmarks/bench_serva_parser.py [кадров]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nord_skc.drivers.serva_parser import ServaFrameParser  # noqa: E402
+from nord_skc.drivers.serva_tcp import parse_reply  # noqa: E402
+
+FIELDS = [f"field_{i:02d}" for i in range(1, 13)]
+
+
+def make_stream(n_frames: int) -> bytes:
+    lines = []
+    for i in range(n_frames):
+        v = i % 1000
+        lines.append(
+            f"R2R2PF,J65,2024-01-01 12:00:00,{v * 0.001:.3f},0.000,0.000,0.000,0.000,"
+            f"{22 + v * 0.001:.3f},0.010,17.117,15.940,0.000,17.322,0.001,07\r\n"
+        )
+    return "".join(lines).encode("ascii")
+
+
+def legacy(stream: bytes, chunk: int) -> int:
+    """Как было в ServaTcpDriver: _recv_line_crlf + parse_reply на каждую строку."""
+    rx = bytearray()
+    n = 0
+    for off in range(0, len(stream), chunk):
+        rx.extend(stream[off:off + chunk])
+        while True:
+            idx = rx.find(b"\r\n")
+            if idx < 0:
+                break
+            line = bytes(rx[:idx])
+            del rx[:idx + 2]
+            rr = parse_reply(line.decode("ascii", errors="ignore"), FIELDS)
+            n += rr.ok
+    return n
+
+
+def parser(stream: bytes, chunk: int) -> int:
+    p = ServaFrameParser()
+    n = 0
+    for off in range(0, len(stream), chunk):
+        p.feed(stream[off:off + chunk])
+        rows, _ = p.decode_frames()
+        n += len(rows)
+    return n
+
+
+def _fps(fn, stream: bytes, chunk: int, n_frames: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        got = fn(stream, chunk)
+        best = min(best, time.perf_counter() - t)
+        assert got == n_frames, (fn.__name__, got)
+    return n_frames / best
+
+
+def run(n_frames: int = 20000) -> Dict[str, float]:
+    stream = make_stream(n_frames)
+    out: Dict[str, float] = {}
+    # 4096 — обычный recv(), 65536 — много кадров накопилось в сокете
+    for chunk in (4096, 65536):
+        out[f"legacy_fps_chunk{chunk}"] = _fps(legacy, stream, chunk, n_frames)
+        out[f"parser_fps_chunk{chunk}"] = _fps(parser, stream, chunk, n_frames)
+        out[f"speedup_chunk{chunk}"] = out[f"parser_fps_chunk{chunk}"] / out[f"legacy_fps_chunk{chunk}"]
+    return out
+
+
+def main(argv: List[str]) -> int:
+    n = int(argv[0]) if argv else 20000
+    print(json.dumps(run(n), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
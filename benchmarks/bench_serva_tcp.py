@@ -0,0 +1,117 @@
+"""
+ServaTcpDriver по настоящему TCP против симулятора (кадры serva_loadgen.Unit):
+- poll: read_once() — $HELLO -> одна строка, запросов в секунду и задержка
+- stream: read_batch() — симулятор шлёт кадры без пауз, кадров в секунду
+
+    python benchmarks/bench_serva_tcp.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import socket
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from common import free_port, percentile
+
+from nord_skc.drivers.serva_tcp import HELLO, ServaTcpDriver
+from serva_loadgen import Unit
+
+
+def _unit() -> Unit:
+    return Unit(no=1, host="127.0.0.1", port=0, seed=1, waves=["sine", "ramp", "square", "noise"])
+
+
+class _Server:
+    """Симулятор в потоке: poll — строка на каждый $HELLO, stream — все кадры сразу."""
+
+    def __init__(self, mode: str, frames: List[bytes]):
+        self.mode = mode
+        self.frames = frames
+        self.port = free_port()
+        self._srv = socket.create_server(("127.0.0.1", self.port))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        conn, _ = self._srv.accept()
+        with conn:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            i = 0
+            streamed = False
+            while True:
+                try:
+                    data = conn.recv(1024)
+                except OSError:
+                    return
+                if not data:
+                    return
+                if self.mode == "poll":
+                    for _ in range(data.count(HELLO)):
+                        conn.sendall(self.frames[i % len(self.frames)])
+                        i += 1
+                elif not streamed:
+                    conn.sendall(b"".join(self.frames))
+                    streamed = True
+
+    def close(self) -> None:
+        self._srv.close()
+
+
+def bench_poll(n: int) -> Dict[str, float]:
+    unit = _unit()
+    t0 = time.time()
+    srv = _Server("poll", [unit.frame(t0 + i * 0.01) for i in range(100)])
+    drv = ServaTcpDriver("127.0.0.1", srv.port, timeout_s=5.0)
+    drv.connect()
+    drv.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    lat: List[float] = []
+    try:
+        t = time.perf_counter()
+        for _ in range(n):
+            t1 = time.perf_counter()
+            rr = drv.read_once()
+            lat.append(time.perf_counter() - t1)
+            assert rr.ok, rr.error
+        total = time.perf_counter() - t
+    finally:
+        drv.close()
+        srv.close()
+    return {
+        "poll_read_once_per_s": n / total,
+        "poll_p50_ms": percentile(lat, 50) * 1e3,
+        "poll_p99_ms": percentile(lat, 99) * 1e3,
+    }
+
+
+def bench_stream(n: int) -> Dict[str, float]:
+    unit = _unit()
+    t0 = time.time()
+    srv = _Server("stream", [unit.frame(t0 + i * 0.01) for i in range(n)])
+    drv = ServaTcpDriver("127.0.0.1", srv.port, timeout_s=5.0, stream=True, keepalive_s=60.0)
+    got = 0
+    try:
+        t = time.perf_counter()
+        drv.connect()
+        while got < n:
+            batch = drv.read_batch()
+            assert batch[-1][1].ok, batch[-1][1].error
+            got += len(batch)
+        total = time.perf_counter() - t
+    finally:
+        drv.close()
+        srv.close()
+    return {"stream_frames_per_s": got / total}
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    out.update(bench_poll(500 if quick else 5000))
+    out.update(bench_stream(20000 if quick else 200000))
+    return out
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
@@ -0,0 +1,49 @@
+"""
+Время холодного запуска app.py до первой отрисовки сетки флотов
+(offscreen Qt, отдельный процесс на каждый замер, отчёт — nord_skc/startup.py).
+
+    python benchmarks/bench_startup.py [--quick]
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+from common import ROOT, Skip, require
+
+
+def _once(path: str) -> Dict[str, float]:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", NSKC_STARTUP_REPORT=path)
+    subprocess.run(
+        [sys.executable, "app.py"], cwd=ROOT, env=env, timeout=60,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    if not os.path.exists(path):
+        raise Skip("app.py did not report first paint")
+    with open(path, encoding="utf-8") as f:
+        d = json.load(f)
+    os.remove(path)
+    out = {"time_to_first_paint_ms": float(d["total_ms"])}
+    out.update({k: float(v) for k, v in d["steps"].items()})
+    return out
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    require("PySide6")
+    if not os.path.exists(os.path.join(ROOT, "config.yaml")):
+        raise Skip("no config.yaml")
+    runs: List[Dict[str, float]] = []
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(2 if quick else 5):
+            runs.append(_once(os.path.join(d, f"startup{i}.json")))
+    # лучший запуск (первый часто платит за холодный дисковый кэш)
+    best = min(runs, key=lambda r: r["time_to_first_paint_ms"])
+    return best
+
+
+if __name__ == "__main__":
+    print(json.dumps(run("--quick" in sys.argv[1:]), indent=2))
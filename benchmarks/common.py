@@ -0,0 +1,54 @@
+"""
+Общие помощники бенчмарков: замер времени, свободный порт, пропуск без зависимостей.
+
+Соглашение об именах метрик (по нему run.py --compare понимает, что лучше):
+  *_per_s, *_fps, speedup*  — больше лучше
+  *_ms, *_s                 — меньше лучше
+"""
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+class Skip(Exception):
+    """Бенчмарк нельзя выполнить в этом окружении (нет зависимости, порта и т.п.)."""
+
+
+def require(module: str):
+    """Импортирует модуль или пропускает бенчмарк."""
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError as e:
+        raise Skip(f"{module} is not available: {e}")
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """Лучшее время одного вызова fn (секунды) из repeat серий по number вызовов."""
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t) / number)
+    return best
+
+
+def percentile(samples: List[float], q: float) -> float:
+    s = sorted(samples)
+    if not s:
+        return float("nan")
+    return s[min(len(s) - 1, int(q / 100.0 * len(s)))]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
@@ -0,0 +1,157 @@
+"""
+Набор бенчмарков конвейера опрос -> отображение -> запись.
+
+    python benchmarks/run.py                       # всё, результат в benchmarks/results/<время>.json
+    python benchmarks/run.py --quick serva_tcp s7  # только выбранные, меньше данных
+    python benchmarks/run.py --out before.json
+    python benchmarks/run.py --compare before.json after.json
+
+Бенчмарк без нужной зависимости (PySide6, snap7) помечается как skipped, остальные выполняются.
+Упавший бенчмарк ("error" в результате) — код возврата 1, результат всё равно записывается.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from common import ROOT, Skip
+
+# имя -> модуль benchmarks/bench_<имя>.py с функцией run(quick) -> {метрика: число}
+BENCHES = ("serva_parser", "serva_tcp", "s7", "asset_window", "recording", "config", "startup",
+           "fleet_grid")
+
+HIGHER_IS_BETTER = ("_per_s", "_fps", "speedup")
+LOWER_IS_BETTER = ("_ms", "_s")
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return ""
+
+
+def _versions() -> Dict[str, str]:
+    out = {"python": platform.python_version()}
+    for mod in ("numpy", "yaml", "PySide6", "pyqtgraph", "snap7"):
+        try:
+            m = importlib.import_module(mod)
+            out[mod] = str(getattr(m, "__version__", "?"))
+        except ImportError:
+            pass
+    return out
+
+
+def run_bench(name: str, quick: bool) -> dict:
+    t = time.perf_counter()
+    try:
+        mod = importlib.import_module(f"bench_{name}")
+        if name == "serva_parser":
+            metrics = mod.run(5000 if quick else 20000)
+        else:
+            metrics = mod.run(quick)
+        res = {"metrics": metrics}
+    except Skip as e:
+        res = {"skipped": str(e)}
+    except ImportError as e:
+        res = {"skipped": f"import failed: {e}"}
+    except Exception as e:
+        traceback.print_exc()
+        res = {"error": f"{type(e).__name__}: {e}"}
+    res["elapsed_s"] = time.perf_counter() - t
+    return res
+
+
+def _direction(metric: str) -> int:
+    """+1 — больше лучше, -1 — меньше лучше, 0 — справочная величина."""
+    if any(metric.endswith(s) or metric.startswith(s) for s in HIGHER_IS_BETTER):
+        return 1
+    if any(metric.endswith(s) for s in LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+def compare(old_path: str, new_path: str, threshold: float = 0.10) -> int:
+    """Печатает изменения метрик; код возврата 1, если есть регрессия больше threshold."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)["results"]
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for name in BENCHES:
+        a = old.get(name, {}).get("metrics") or {}
+        b = new.get(name, {}).get("metrics") or {}
+        for metric in sorted(set(a) & set(b)):
+            d = _direction(metric)
+            if not d or not a[metric]:
+                continue
+            change = (b[metric] - a[metric]) / abs(a[metric])
+            worse = -change * d > threshold
+            regressions += worse
+            mark = "REGRESSION" if worse else ("better" if change * d > threshold else "")
+            print(f"{name:14s} {metric:32s} {a[metric]:14.4g} -> {b[metric]:14.4g} {change:+8.1%} {mark}")
+    print(f"regressions: {regressions}")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="NORD SKC benchmarks")
+    p.add_argument("benches", nargs="*", help=f"какие запускать (по умолчанию все: {', '.join(BENCHES)})")
+    p.add_argument("--quick", action="store_true", help="меньше данных (проверка, что всё работает)")
+    p.add_argument("--out", default="", help="файл результата (JSON)")
+    p.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="сравнить два файла результатов")
+    p.add_argument("--threshold", type=float, default=0.10, help="порог регрессии для --compare")
+    args = p.parse_args(argv)
+
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.threshold)
+
+    names = args.benches or list(BENCHES)
+    unknown = [n for n in names if n not in BENCHES]
+    if unknown:
+        p.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_rev": _git_rev(),
+        "platform": platform.platform(),
+        "versions": _versions(),
+        "quick": args.quick,
+        "results": {},
+    }
+    for name in names:
+        print(f"[bench] {name} …", flush=True)
+        res = run_bench(name, args.quick)
+        report["results"][name] = res
+        status = "skipped: " + res["skipped"] if "skipped" in res else res.get("error", "ok")
+        print(f"[bench] {name}: {status} ({res['elapsed_s']:.1f} s)", flush=True)
+
+    out = args.out
+    if not out:
+        out = os.path.join(ROOT, "benchmarks", "results", time.strftime("%Y%m%d-%H%M%S") + ".json")
+    d = os.path.dirname(out)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(out, flush=True)
+
+    failed = [n for n, r in report["results"].items() if "error" in r]
+    if failed:
+        print(f"[bench] failed: {', '.join(failed)}", flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,339 @@
+"""
+Симулятор JEREH (Siemens S7) на snap7.server.Server.
+
+DB-области раскладываются по блоку tags из config.yaml (как их читает SiemensS7Driver),
+значения меняются во времени с частотой --rate (REAL/LREAL/INT/DINT/BYTE/WORD/DWORD,
+BOOL по битам, TIME в мс, STRING — «STAGE n»).
+
+Примеры:
+    # теги агрегата F-01 из config.yaml, один PLC на порту 102
+    python jereh_fake.py --config config.yaml --asset F-01
+
+    # 20 PLC на портах 10200..10219, 500 синтетических тегов, 10 Гц, и config для приложения
+    python jereh_fake.py --instances 20 --base-port 10200 --tags 500 --rate 10 --write-config config_s7.yaml
+
+Порт 102 (стандартный S7) на Linux требует root; для нескольких экземпляров
+используйте свои порты и `port:` у агрегата в config.yaml.
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import math
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import yaml
+import snap7.server
+
+# размер STRING без явного size — тот же, что у плана чтения драйвера
+from nord_skc.drivers.s7_plan import STRING_SIZE
+
+try:
+    # python-snap7 >= 2
+    from snap7.type import SrvArea
+    _DB_AREA = SrvArea.DB
+    _SHARED_BYTEARRAY = True   # сервер хранит переданный bytearray без копии
+except ImportError:
+    # python-snap7 1.x (нативная библиотека читает память ctypes-массива)
+    from snap7.types import srvAreaDB as _DB_AREA
+    _SHARED_BYTEARRAY = False
+
+# Siemens S7: big-endian (STRING пакуется отдельно, см. Tag.pack)
+_FORMATS: Dict[str, struct.Struct] = {
+    "bool": struct.Struct(">B"),
+    "byte": struct.Struct(">B"),
+    "word": struct.Struct(">H"),
+    "dword": struct.Struct(">I"),
+    "int": struct.Struct(">h"),
+    "dint": struct.Struct(">i"),
+    "real": struct.Struct(">f"),
+    "lreal": struct.Struct(">d"),
+    "time": struct.Struct(">i"),
+}
+_LIMITS = {
+    "byte": (0, 255),
+    "word": (0, 65535),
+    "dword": (0, 2**32 - 1),
+    "int": (-32768, 32767),
+    "dint": (-2**31, 2**31 - 1),
+    "time": (-2**31, 2**31 - 1),
+}
+SYNTH_STRING_SIZE = 34   # синтетические теги: STRING[32], size пишется в тег явно
+
+DEMO_TAGS = {
+    "pressure": {"db": 1, "start": 0, "size": 4, "dtype": "REAL"},
+    "rate": {"db": 1, "start": 4, "size": 4, "dtype": "REAL"},
+    "rpm": {"db": 1, "start": 8, "size": 2, "dtype": "INT"},
+    "gear": {"db": 1, "start": 10, "size": 2, "dtype": "INT"},
+    "strokes": {"db": 1, "start": 12, "size": 4, "dtype": "DINT"},
+    "oil_temp": {"db": 2, "start": 0, "size": 4, "dtype": "REAL"},
+}
+
+
+def log(msg):
+    print(f"[JEREH FAKE] {msg}", flush=True)
+
+
+@dataclass
+class Tag:
+    name: str
+    db: int
+    start: int
+    dtype: str
+    st: Optional[struct.Struct]
+    offset: float
+    amplitude: float
+    period_s: float
+    phase: float
+    bit: int = 0
+    size: int = 0
+
+    def value(self, t: float) -> float:
+        if self.dtype in ("dint", "dword", "time"):
+            # счётчик (ходы плунжера, моточасы и т.п.): монотонно растёт
+            return self.offset + (t % 86400) / self.period_s * 10
+        if self.dtype == "bool":
+            return float(math.sin(2 * math.pi * (t / self.period_s + self.phase)) > 0)
+        return self.offset + self.amplitude * math.sin(2 * math.pi * (t / self.period_s + self.phase))
+
+    def pack(self, buf, t: float) -> None:
+        if self.dtype == "string":
+            raw = f"STAGE {int(t / self.period_s) % 20 + 1}".encode("latin-1")[: self.size - 2]
+            buf[self.start] = self.size - 2
+            buf[self.start + 1] = len(raw)
+            buf[self.start + 2 : self.start + 2 + len(raw)] = raw
+            return
+        v = self.value(t)
+        if self.dtype == "bool":
+            mask = 1 << self.bit
+            buf[self.start] = (buf[self.start] | mask) if v else (buf[self.start] & ~mask)
+            return
+        if self.dtype in _LIMITS:
+            lo, hi = _LIMITS[self.dtype]
+            v = min(hi, max(lo, int(v)))
+        self.st.pack_into(buf, self.start, v)
+
+    @property
+    def nbytes(self) -> int:
+        return self.size if self.dtype == "string" else self.st.size
+
+
+KINDS = ("REAL", "INT", "DINT")
+ALL_KINDS = ("REAL", "INT", "DINT", "BOOL", "BYTE", "WORD", "DWORD", "LREAL", "TIME", "STRING")
+
+
+def synthetic_tags(n: int, db: int = 1, kinds=KINDS) -> dict:
+    """n тегов подряд в одном DB, типы по кругу (BOOL — по 8 бит на байт)."""
+    tags = {}
+    pos = 0
+    bit = None   # BOOL: следующий свободный бит текущего байта
+    for i in range(n):
+        dtype = kinds[i % len(kinds)]
+        dt = dtype.lower()
+        if dt == "bool":
+            if bit is None or bit > 7:
+                bit, byte = 0, pos
+                pos += 1
+            tags[f"tag{i:03d}"] = {"db": db, "start": byte, "bit": bit, "dtype": dtype}
+            bit += 1
+            continue
+        size = SYNTH_STRING_SIZE if dt == "string" else _FORMATS[dt].size
+        if size > 1 and pos % 2:
+            pos += 1   # S7: всё, кроме BYTE/BOOL, с чётного адреса
+        tags[f"tag{i:03d}"] = {"db": db, "start": pos, "size": size, "dtype": dtype}
+        pos += size
+    return tags
+
+
+def layout_from_config(path: str, asset_id: str = "") -> dict:
+    """Теги первого (или указанного) siemens_s7-агрегата с непустым tags."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f) or {}
+    for a in raw.get("assets") or []:
+        if a.get("type") != "siemens_s7":
+            continue
+        if asset_id and str(a.get("id")) != asset_id:
+            continue
+        if a.get("tags"):
+            return dict(a["tags"])
+        if asset_id:
+            break
+    return {}
+
+
+def make_tags(tags: dict, seed: int) -> List[Tag]:
+    rng = random.Random(seed)
+    out: List[Tag] = []
+    for name, t in tags.items():
+        dtype = str(t["dtype"]).lower()
+        st = _FORMATS.get(dtype)
+        if st is None and dtype != "string":
+            raise SystemExit(f"unsupported dtype for {name}: {t['dtype']}")
+        out.append(
+            Tag(
+                name=str(name),
+                db=int(t["db"]),
+                start=int(t["start"]),
+                dtype=dtype,
+                st=st,
+                offset=rng.uniform(0, 100) if dtype in ("real", "lreal") else float(rng.randint(0, 200)),
+                amplitude=rng.uniform(1, 50),
+                period_s=rng.uniform(5, 60),
+                phase=rng.random(),
+                bit=int(t.get("bit", 0)),
+                size=int(t.get("size", STRING_SIZE)) if dtype == "string" else 0,
+            )
+        )
+    return out
+
+
+def db_sizes(tags: List[Tag], min_size: int) -> Dict[int, int]:
+    sizes: Dict[int, int] = {}
+    for t in tags:
+        sizes[t.db] = max(sizes.get(t.db, min_size), t.start + t.nbytes)
+    return sizes
+
+
+class FakePlc:
+    """Один snap7-сервер с DB-областями и потоком, обновляющим значения."""
+
+    def __init__(self, host: str, port: int, tags: List[Tag], min_db_size: int, rate_hz: float):
+        self.host = host
+        self.port = port
+        self.tags = tags
+        self.period_s = 1.0 / rate_hz
+        self.updates = 0
+
+        self.server = snap7.server.Server(log=False)
+        self.dbs: Dict[int, object] = {}
+        for db, size in db_sizes(tags, min_db_size).items():
+            buf = bytearray(size) if _SHARED_BYTEARRAY else (ctypes.c_uint8 * size)()
+            self.server.register_area(_DB_AREA, db, buf)
+            self.dbs[db] = buf
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"jereh-{port}", daemon=True)
+
+    def start(self) -> None:
+        self._update(time.time())
+        self.server.start_to(self.host, self.port)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.server.stop()
+        self.server.destroy()
+
+    def _update(self, t: float) -> None:
+        by_db: Dict[int, List[Tag]] = {}
+        for tag in self.tags:
+            by_db.setdefault(tag.db, []).append(tag)
+        for db, tags in by_db.items():
+            # клиент не увидит наполовину обновлённый DB
+            self.server.lock_area(_DB_AREA, db)
+            try:
+                buf = self.dbs[db]
+                for tag in tags:
+                    tag.pack(buf, t)
+            finally:
+                self.server.unlock_area(_DB_AREA, db)
+        self.updates += 1
+
+    def _run(self) -> None:
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            self._update(time.time())
+            next_t += self.period_s
+            delay = next_t - time.monotonic()
+            if delay < 0:
+                next_t = time.monotonic()
+                delay = 0.0
+            self._stop.wait(delay)
+
+
+def write_config(path: str, plcs: List[FakePlc], tags: dict, connect_host: Optional[str]) -> None:
+    """config.yaml для приложения: один siemens_s7-агрегат на каждый экземпляр."""
+    cfg = {
+        "app": {"name": "NORD SKC (S7 test)", "poll_hz": 1, "history_seconds": 900},
+        "assets": [
+            {
+                "id": f"J-{i + 1:03d}",
+                "fleet_no": i + 1,
+                "plate": "",
+                "type": "siemens_s7",
+                "ip": connect_host or ("127.0.0.1" if p.host in ("0.0.0.0", "") else p.host),
+                "port": p.port,
+                "rack": 0,
+                "slot": 1,
+                "vendor": "JEREH",
+                "tags": tags,
+            }
+            for i, p in enumerate(plcs)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(cfg, f, allow_unicode=True, sort_keys=False)
+    log(f"config written: {path} ({len(plcs)} assets)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Симулятор JEREH (Siemens S7, snap7 server)")
+    p.add_argument("--config", default="", help="взять раскладку тегов из config.yaml")
+    p.add_argument("--asset", default="", help="id агрегата в config (по умолчанию первый siemens_s7 с tags)")
+    p.add_argument("--tags", type=int, default=0, help="вместо config: N синтетических тегов в DB1")
+    p.add_argument("--all-types", action="store_true", help="синтетические теги всех типов, не только REAL/INT/DINT")
+    p.add_argument("--db-size", type=int, default=0, help="минимальный размер каждого DB, байт")
+    p.add_argument("--instances", type=int, default=1, help="сколько PLC поднять")
+    p.add_argument("--host", default="0.0.0.0")
+    p.add_argument("--base-port", type=int, default=102, help="порт первого PLC, далее +1")
+    p.add_argument("--rate", type=float, default=1.0, help="обновлений значений в секунду")
+    p.add_argument("--seed", type=int, default=1, help="зерно; у экземпляра i — seed + i")
+    p.add_argument("--write-config", default="", help="записать config.yaml для этих PLC")
+    p.add_argument("--connect-host", default="", help="адрес PLC в config (по умолчанию 127.0.0.1)")
+    args = p.parse_args(argv)
+
+    if args.rate <= 0:
+        raise SystemExit("--rate должен быть > 0")
+
+    if args.tags > 0:
+        tags = synthetic_tags(args.tags, kinds=ALL_KINDS if args.all_types else KINDS)
+    elif args.config:
+        tags = layout_from_config(args.config, args.asset)
+        if not tags:
+            log(f"no tags in {args.config}, using demo layout")
+            tags = dict(DEMO_TAGS)
+    else:
+        tags = dict(DEMO_TAGS)
+
+    plcs = [
+        FakePlc(args.host, args.base_port + i, make_tags(tags, args.seed + i), args.db_size, args.rate)
+        for i in range(args.instances)
+    ]
+    for plc in plcs:
+        plc.start()
+    sizes = ", ".join(f"DB{db}={n}B" for db, n in sorted(db_sizes(plcs[0].tags, args.db_size).items()))
+    log(f"{len(plcs)} PLC listening on {args.host}:{plcs[0].port}…{plcs[-1].port}, "
+        f"{len(tags)} tags ({sizes}), rate={args.rate} Hz")
+
+    if args.write_config:
+        write_config(args.write_config, plcs, tags, args.connect_host)
+
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for plc in plcs:
+            plc.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from nord_skc.drivers.base import BaseDriver
+from nord_skc.metrics import AssetMetrics
+from nord_skc.model import ReadResult
+from nord_skc.reconnect import Backoff, Reconnector
+from nord_skc.tsstore import TimeSeriesStore
+
+# (время получения, результат чтения)
+Batch = List[Tuple[float, ReadResult]]
+
+
+class AcquisitionWorker:
+    """
+    Фоновый опрос одного агрегата.
+
+    - поток владеет драйвером: connect/read_batch/close вызываются только из него
+    - опрос с частотой poll_hz
+    - готовые результаты складываются в ограниченную очередь, UI забирает их через drain()
+
+    Если UI не успевает забирать данные, самые старые результаты выбрасываются —
+    поток опроса никогда не ждёт GUI, а GUI никогда не ждёт сеть.
+
+    Связь ведёт Reconnector (nord_skc/reconnect.py): при ошибке связи драйвер
+    закрывается сразу, переподключение — с экспоненциальной паузой и джиттером.
+    Ожидание и connect() происходят только в этом потоке — плохой канал одного
+    агрегата не задерживает ни GUI, ни опрос остальных.
+
+    metrics — куда писать время connect/read, кадры, ошибки, переподключения
+    (драйвер получает тот же объект для времени разбора и принятых байт).
+
+    store — общее хранилище рядов (nord_skc/tsstore.py): удачные чтения пишутся туда
+    прямо из этого потока под именем name, поэтому данные переживают окно.
+    """
+
+    def __init__(
+        self,
+        driver: BaseDriver,
+        poll_hz: float,
+        maxsize: int = 4096,
+        name: str = "",
+        metrics: Optional[AssetMetrics] = None,
+        store: Optional[TimeSeriesStore] = None,
+    ):
+        self.driver = driver
+        self.period_s = 1.0 / max(0.001, float(poll_hz))
+        self.name = name or type(driver).__name__
+        self.metrics = metrics if metrics is not None else AssetMetrics(self.name)
+        self.link = Reconnector(Backoff(base_s=min(1.0, self.period_s), cap_s=30.0))
+        self._attempted = False
+        self.series = store.series(self.name) if store is not None else None
+        if getattr(driver, "metrics", None) is None:
+            driver.metrics = self.metrics
+
+        self._q: "queue.Queue[Tuple[float, ReadResult]]" = queue.Queue(maxsize=max(1, maxsize))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.dropped: int = 0
+
+    # ----------------- управление потоком -----------------
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"acq-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Останавливает опрос. Драйвер закрывается в потоке опроса."""
+        self._stop.set()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ----------------- обмен с UI -----------------
+    def drain(self) -> Batch:
+        """Забирает все накопленные результаты (не блокирует)."""
+        out: Batch = []
+        while True:
+            try:
+                out.append(self._q.get_nowait())
+            except queue.Empty:
+                return out
+
+    def _put(self, item: Tuple[float, ReadResult]) -> None:
+        while True:
+            try:
+                self._q.put_nowait(item)
+                return
+            except queue.Full:
+                # UI отстаёт — выбрасываем самый старый результат
+                try:
+                    self._q.get_nowait()
+                    self.dropped += 1
+                    self.metrics.dropped += 1
+                except queue.Empty:
+                    pass
+
+    # ----------------- опрос -----------------
+    def _connect(self) -> None:
+        t = time.perf_counter()
+        try:
+            self.driver.connect()
+        finally:
+            self.metrics.observe("connect", time.perf_counter() - t)
+
+    def _read_batch(self) -> Batch:
+        t = time.perf_counter()
+        try:
+            batch = self.driver.read_batch()
+        except Exception as e:
+            batch = [(time.time(), ReadResult(ok=False, values={}, error=str(e)))]
+        self.metrics.observe("read", time.perf_counter() - t)
+        return batch
+
+    def _close_driver(self) -> None:
+        try:
+            self.driver.close()
+        except Exception:
+            pass
+
+    def _poll(self) -> Batch:
+        """
+        Один такт: чтение, а если связи нет — попытка подключения,
+        когда истекла пауза backoff (до этого такт пустой, сеть не трогаем).
+        """
+        link = self.link
+        if not link.connected:
+            if not link.due():
+                return []
+            if self._attempted:
+                self.metrics.reconnects += 1
+            self._attempted = True
+            # старый сокет/клиент S7 закрываем до нового подключения
+            self._close_driver()
+            try:
+                self._connect()
+            except Exception as e:
+                err = str(e) or type(e).__name__
+                link.on_connect(err)
+                return [(time.time(), ReadResult(ok=False, values={}, error=err))]
+            link.on_connect(None)
+
+        batch = self._read_batch()
+        if batch:
+            rr = batch[-1][1]
+            if link.on_read(rr.ok, rr.error):
+                # полуживой сокет не держим: закрываем сразу, переподключение — по backoff
+                self._close_driver()
+        return batch
+
+    def _run(self) -> None:
+        # драйвер мог прийти уже подключённым (проверка связи / окно подключения)
+        if self.driver.is_connected():
+            self.link.on_connect(None)
+            self._attempted = True
+
+        next_t = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                batch = self._poll()
+                m = self.metrics
+                series = self.series
+                for item in batch:
+                    if item[1].ok:
+                        m.frames += 1
+                        if series is not None and item[1].values:
+                            series.append(item[0], item[1].values)
+                    else:
+                        m.errors += 1
+                    self._put(item)
+
+                # источник кончился (replay без loop) — ждём только stop()
+                if self.link.finished:
+                    self._stop.wait()
+                    continue
+
+                # потоковый драйвер сам ждёт кадры — пауза только добавила бы задержку
+                # (при ошибке паузу делаем, чтобы не крутить переподключение вхолостую)
+                if self.driver.streaming and batch and batch[-1][1].ok:
+                    next_t = time.monotonic()
+                    continue
+
+                # связи нет — спим до следующей попытки (stop() будит сразу)
+                if not self.link.connected:
+                    self._stop.wait(max(self.link.wait_s(), 0.01))
+                    next_t = time.monotonic()
+                    continue
+
+                next_t += self.period_s
+                delay = next_t - time.monotonic()
+                if delay < 0:
+                    # не успели (медленный ответ) — пропущенные такты не догоняем
+                    self.metrics.missed_polls += int(-delay / self.period_s)
+                    next_t = time.monotonic()
+                    delay = 0.0
+                self._stop.wait(delay)
+        finally:
+            try:
+                self.driver.close()
+            except Exception:
+                pass
@@ -0,0 +1,246 @@
+"""
+Сбор данных без GUI: python -m nord_skc.collector
+
+Для ПК/сервера записи: читает config.yaml, опрашивает выбранные агрегаты
+(FleetPoller — один asyncio-цикл, S7 в пуле потоков) и пишет каждую
+сессию в records/ тем же SessionRecorder, что и окно агрегата, с ротацией
+файлов по времени и размеру.
+
+Модуль не импортирует ни PySide6, ни pyqtgraph — работает на машине без Qt.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from nord_skc.config import AssetConfig, Config, load_config
+from nord_skc.fleet_poller import FleetPoller
+from nord_skc.model import ReadResult
+from nord_skc.recorder import FORMATS, SessionRecorder, recover_all
+
+# размер .part проверяется раз в столько точек (stat на каждую точку — лишний syscall)
+_SIZE_CHECK_EVERY = 500
+
+
+class AssetRecorder:
+    """
+    Запись одного агрегата с ротацией.
+
+    Новый файл начинается:
+    - когда текущему больше rotate_s секунд (по времени точек)
+    - когда .part вырос больше rotate_bytes
+    - когда у агрегата появились новые каналы (столбцы файла фиксируются при создании)
+    Старый файл завершается (finalize) в фоне — опрос не ждёт fsync.
+    """
+
+    def __init__(
+        self,
+        asset: AssetConfig,
+        directory: str,
+        fmt: str,
+        rotate_s: float,
+        rotate_bytes: int,
+        finisher: ThreadPoolExecutor,
+    ):
+        self.asset = asset
+        self.directory = directory
+        self.fmt = fmt
+        self.rotate_s = float(rotate_s)
+        self.rotate_bytes = int(rotate_bytes)
+        self.finisher = finisher
+
+        self.rec: Optional[SessionRecorder] = None
+        self.started_ts = 0.0
+        self.points = 0       # всего записано точек
+        self.errors = 0       # неудачных чтений
+        self.files: List[str] = []
+        self.last_error: Optional[str] = None
+
+    def append(self, ts: float, rr: ReadResult) -> None:
+        if not rr.ok:
+            self.errors += 1
+            self.last_error = rr.error
+            return
+        if not rr.values:
+            return
+        if self._need_rotate(ts, rr.values):
+            self.rotate()
+        if self.rec is None:
+            path = os.path.join(
+                self.directory,
+                f"{self.asset.id}_fleet{self.asset.fleet_no:02d}_{int(ts)}.{self.fmt}",
+            )
+            self.rec = SessionRecorder(path, sorted(rr.values.keys()), fmt=self.fmt)
+            self.started_ts = ts
+        self.rec.append(ts, {k: float(v) for k, v in rr.values.items()})
+        self.points += 1
+
+    def _need_rotate(self, ts: float, values: Dict[str, float]) -> bool:
+        rec = self.rec
+        if rec is None:
+            return False
+        if rec.error:
+            return True
+        if self.rotate_s > 0 and ts - self.started_ts >= self.rotate_s:
+            return True
+        if any(k not in rec.columns for k in values):
+            return True
+        if self.rotate_bytes > 0 and rec.count % _SIZE_CHECK_EVERY == 0:
+            try:
+                return os.path.getsize(rec.part_path) >= self.rotate_bytes
+            except OSError:
+                return False
+        return False
+
+    def rotate(self) -> None:
+        """Закрывает текущий файл (в фоне); следующая точка начнёт новый."""
+        rec, self.rec = self.rec, None
+        if rec is not None:
+            self.finisher.submit(self._finish, rec)
+
+    def _finish(self, rec: SessionRecorder) -> None:
+        try:
+            if rec.count:
+                self.files.append(rec.finalize())
+            else:
+                rec.discard()
+        except OSError as e:
+            # .part остаётся на диске — recover_all() подберёт его при следующем старте
+            print(f"{self.asset.id}: ошибка записи {rec.path}: {e}", file=sys.stderr, flush=True)
+
+
+class Collector:
+    """Опрос выбранных агрегатов и запись в records/ — пока не вызван stop()."""
+
+    def __init__(
+        self,
+        cfg: Config,
+        asset_ids: Optional[Iterable[str]] = None,
+        directory: str = "records",
+        fmt: Optional[str] = None,
+        rotate_s: float = 3600.0,
+        rotate_bytes: int = 0,
+        poll_hz: Optional[float] = None,
+        status_s: float = 60.0,
+    ):
+        fmt = (fmt or cfg.app.record_format).lower()
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown record format: {fmt}")
+        self.status_s = float(status_s)
+        self.poller = FleetPoller(cfg, on_result=self._on_result, asset_ids=asset_ids, poll_hz=poll_hz)
+        self._finisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rec-finish")
+        self._closed = False
+        self.recorders: Dict[str, AssetRecorder] = {
+            a.id: AssetRecorder(a, directory, fmt, rotate_s, rotate_bytes, self._finisher)
+            for a in self.poller.assets
+        }
+
+    def _on_result(self, asset_id: str, ts: float, rr: ReadResult) -> None:
+        r = self.recorders.get(asset_id)
+        if r is not None:
+            r.append(ts, rr)
+
+    async def run(self) -> None:
+        status = asyncio.ensure_future(self._report()) if self.status_s > 0 else None
+        try:
+            await self.poller.run()
+        finally:
+            if status is not None:
+                status.cancel()
+            self.close()
+
+    def stop(self) -> None:
+        """Можно вызывать из любого потока (и из обработчика сигнала)."""
+        self.poller.stop()
+
+    def close(self) -> None:
+        """Завершает все текущие файлы (ждёт fsync)."""
+        if self._closed:
+            return
+        self._closed = True
+        for r in self.recorders.values():
+            r.rotate()
+        self._finisher.shutdown(wait=True)
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.status_s)
+            print(self.status_line(), flush=True)
+
+    def status_line(self) -> str:
+        parts = []
+        for aid, r in self.recorders.items():
+            s = f"{aid} {r.points}"
+            if r.errors:
+                s += f"/err {r.errors}"
+            parts.append(s)
+        return f"{time.strftime('%H:%M:%S')} точек: " + ", ".join(parts)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m nord_skc.collector",
+        description="Сбор данных агрегатов в records/ без GUI",
+    )
+    p.add_argument("assets", nargs="*", help="id агрегатов (по умолчанию — все из конфига)")
+    p.add_argument("--config", default="config.yaml")
+    p.add_argument("--out", default="records", help="папка записей")
+    p.add_argument("--format", choices=FORMATS, default=None, help="по умолчанию app.record_format")
+    p.add_argument("--poll-hz", type=float, default=None, help="по умолчанию app.poll_hz")
+    p.add_argument("--rotate-min", type=float, default=60.0, help="новый файл каждые N минут (0 — нет)")
+    p.add_argument("--rotate-mb", type=float, default=0.0, help="новый файл при размере N МБ (0 — нет)")
+    p.add_argument("--status-s", type=float, default=60.0, help="строка статуса раз в N секунд (0 — нет)")
+    args = p.parse_args(argv)
+
+    cfg = load_config(args.config)
+    known = {a.id for a in cfg.assets}
+    missing = [a for a in args.assets if a not in known]
+    if missing:
+        print(f"нет в {args.config}: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    # записи, оборванные прошлым падением, — восстанавливаем до целой строки
+    # (живые .part окна агрегата в той же папке заблокированы и пропускаются)
+    for path in recover_all(args.out):
+        print(f"восстановлено: {path}", flush=True)
+
+    collector = Collector(
+        cfg,
+        asset_ids=args.assets or None,
+        directory=args.out,
+        fmt=args.format,
+        rotate_s=args.rotate_min * 60.0,
+        rotate_bytes=int(args.rotate_mb * 1024 * 1024),
+        poll_hz=args.poll_hz,
+        status_s=args.status_s,
+    )
+    print(
+        f"сбор: {len(collector.recorders)} агрегатов -> {args.out}/ "
+        f"({collector.poller.poll_hz:g} Гц, {args.format or cfg.app.record_format})",
+        flush=True,
+    )
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, collector.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: остаётся KeyboardInterrupt
+        await collector.run()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        collector.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,13 +1,29 @@
 from __future__ import annotations
+import copy
+import os
+import stat
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
+# libyaml в разы быстрее чистого Python — берём, если PyYAML собран с ним
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 @dataclass
 class AppConfig:
     name: str
     poll_hz: int
     history_seconds: int
+    decimation: str = "minmax"   # minmax | lttb | off — прореживание графиков
+    render_fps: int = 25         # потолок частоты перерисовки окна агрегата
+    record_format: str = "csv"   # csv | nskc — формат записи сессии
+    health_check_s: int = 60     # проверка связи с агрегатами: период, 0 — только при старте
+    health_budget_s: float = 2.0  # сколько максимум ждать ответа всех агрегатов
+    acquisition_processes: int = 0  # опрос в N отдельных процессах (procpool.py), 0 — потоки в GUI
 
 @dataclass
 class AssetConfig:
@@ -23,15 +39,18 @@ class Config:
     app: AppConfig
     assets: List[AssetConfig]
 
-def load_config(path: str) -> Config:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
-
-    app_raw = raw.get("app", {})
+def parse_config(raw: Dict[str, Any]) -> Config:
+    app_raw = raw.get("app", {}) or {}
     app = AppConfig(
         name=str(app_raw.get("name", "NORD SKC")),
         poll_hz=int(app_raw.get("poll_hz", 1)),
         history_seconds=int(app_raw.get("history_seconds", 900)),
+        decimation=str(app_raw.get("decimation", "minmax")).lower(),
+        render_fps=int(app_raw.get("render_fps", 25)),
+        record_format=str(app_raw.get("record_format", "csv")).lower(),
+        health_check_s=int(app_raw.get("health_check_s", 60)),
+        health_budget_s=float(app_raw.get("health_budget_s", 2.0)),
+        acquisition_processes=int(app_raw.get("acquisition_processes", 0)),
     )
 
     assets: List[AssetConfig] = []
@@ -42,9 +61,240 @@ def load_config(path: str) -> Config:
             fleet_no=int(a.pop("fleet_no", 0)),
             plate=str(a.pop("plate", "")),
             type=str(a.pop("type")),
-            ip=str(a.pop("ip")),
+            ip=str(a.pop("ip", "")),
             extra=a,   # всё остальное (порт, rack/slot, tags...)
         )
         assets.append(asset)
 
     return Config(app=app, assets=assets)
+
+def read_yaml(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
+def _file_mode(path: str) -> int:
+    """Права, которые должен получить файл: как у существующего, иначе — по umask, как у open()."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mask = os.umask(0)
+        os.umask(mask)
+        return 0o666 & ~mask
+
+def write_yaml_atomic(path: str, raw: Dict[str, Any]) -> None:
+    """Пишет во временный файл рядом и подменяет os.replace: читатель видит старый или новый файл целиком."""
+    d = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=d)
+    try:
+        # mkstemp создаёт файл 0600 — после replace config.yaml не должен сменить права
+        os.chmod(tmp, _file_mode(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(raw, f, Dumper=_Dumper, allow_unicode=True, sort_keys=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def load_config(path: str) -> Config:
+    return parse_config(read_yaml(path))
+
+
+# ----------------- сервис конфигурации -----------------
+UiSeries = Dict[str, Dict[str, Any]]   # {канал: {visible: bool, color: "#rrggbb"}}
+
+
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ConfigService:
+    """
+    Один разобранный config.yaml на процесс (config_service(path)).
+
+    - файл читается один раз (libyaml, если есть); config — типизированный вид,
+      ui_series() — настройки линий агрегата, без YAML на каждое окно
+    - фоновый поток раз в poll_s сверяет mtime/размер: файл поправили руками —
+      перечитываем (новые окна увидят правки без перезапуска)
+    - set_ui_series() меняет только переданные линии в памяти; запись на диск —
+      одна на пачку изменений, через save_delay_s после последнего,
+      атомарно (временный файл + os.replace)
+    - перед записью файл сверяется с диском: чужие правки не затираются,
+      наши несохранённые изменения накладываются поверх перечитанного
+    - файл на диске не разбирается (правят руками, ошибка в YAML) — запись
+      отказывается (OSError), изменения ждут, пока файл не исправят
+    """
+
+    def __init__(self, path: str, save_delay_s: float = 0.5, poll_s: float = 1.0, watch: bool = True):
+        self.path = path
+        self.save_delay_s = float(save_delay_s)
+        self.poll_s = float(poll_s)
+        self.error: Optional[str] = None     # последняя ошибка чтения/записи
+        self.invalid = False                 # файл на диске не разобрался — не перезаписываем
+
+        self._lock = threading.RLock()
+        self._raw: Dict[str, Any] = {}
+        self._ui: Dict[str, UiSeries] = {}
+        self._pending: Dict[str, UiSeries] = {}   # ещё не записанные изменения
+        self._changed_at = 0.0
+        self._sig: Optional[Tuple[int, int]] = None
+        self.config = parse_config({})
+        self._reload(strict=True)
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if watch:
+            self._thread = threading.Thread(target=self._run, name="config-watch", daemon=True)
+            self._thread.start()
+
+    # ----------------- чтение -----------------
+    def _reload(self, strict: bool = False) -> bool:
+        sig = _file_sig(self.path)
+        try:
+            raw = read_yaml(self.path)
+            cfg = parse_config(raw)
+        except (OSError, yaml.YAMLError, KeyError, TypeError, ValueError) as e:
+            if strict:
+                raise
+            # битый/недописанный чужой правкой файл — остаёмся на прошлой версии,
+            # но и записывать её поверх правки нельзя
+            self.error = str(e)
+            self.invalid = True
+            self._sig = sig
+            return False
+        ui: Dict[str, UiSeries] = {}
+        for a in raw.get("assets") or []:
+            series = ((a.get("ui") or {}).get("series") or {})
+            ui[str(a.get("id"))] = {str(k): dict(v or {}) for k, v in series.items()}
+        with self._lock:
+            self._raw, self.config, self._ui, self._sig = raw, cfg, ui, sig
+            # несохранённые изменения остаются в силе поверх новой версии файла
+            for aid, series in self._pending.items():
+                self._merge(aid, series)
+            self.error = None
+            self.invalid = False
+        return True
+
+    def ui_series(self, asset_id: str) -> UiSeries:
+        """Копия настроек линий агрегата (assets[].ui.series)."""
+        with self._lock:
+            return copy.deepcopy(self._ui.get(asset_id, {}))
+
+    def asset(self, asset_id: str) -> Optional[AssetConfig]:
+        for a in self.config.assets:
+            if a.id == asset_id:
+                return a
+        return None
+
+    # ----------------- запись -----------------
+    def _merge(self, asset_id: str, series: UiSeries) -> None:
+        cur = self._ui.setdefault(asset_id, {})
+        for k, v in series.items():
+            cur.setdefault(k, {}).update(v)
+        for a in self._raw.get("assets") or []:
+            if str(a.get("id")) != asset_id:
+                continue
+            ui = a.get("ui") or {}
+            raw_series = ui.get("series") or {}
+            for k, v in series.items():
+                raw_series.setdefault(k, {})
+                raw_series[k] = {**(raw_series[k] or {}), **v}
+            ui["series"] = raw_series
+            a["ui"] = ui
+            break
+
+    def set_ui_series(self, asset_id: str, series: UiSeries) -> None:
+        """
+        Меняет настройки переданных линий; на диск — отложенно (save_delay_s) и атомарно.
+        OSError — файл сейчас нельзя перезаписать: изменения остаются в очереди.
+        """
+        with self._lock:
+            pend = self._pending.setdefault(asset_id, {})
+            for k, v in series.items():
+                pend.setdefault(k, {}).update(v)
+            self._merge(asset_id, series)
+            self._changed_at = time.monotonic()
+            if self._thread is not None:
+                # запись будет в фоне — но о битом файле оператор должен узнать сейчас
+                self._check_file()
+                self._check_valid()
+                return
+        self.flush()
+
+    def _check_valid(self) -> None:
+        if self.invalid:
+            raise OSError(f"{self.path}: ошибка в файле, настройки не записаны ({self.error})")
+
+    def flush(self) -> None:
+        """
+        Записывает несохранённые изменения сейчас. OSError (нет записи, файл на диске
+        с ошибкой) — наружу, изменения остаются в очереди.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            # файл менялся снаружи после нашего чтения — сначала подтягиваем чужие правки
+            if _file_sig(self.path) != self._sig:
+                self._reload()
+            # файл поправили руками и он не разбирается: записать self._raw — стереть правку
+            self._check_valid()
+            try:
+                write_yaml_atomic(self.path, self._raw)
+            except OSError as e:
+                self.error = str(e)
+                raise
+            self._pending.clear()
+            self._sig = _file_sig(self.path)
+            self.error = None
+
+    # ----------------- фоновый поток -----------------
+    def _run(self) -> None:
+        next_poll = time.monotonic() + self.poll_s
+        while not self._stop.wait(min(0.1, self.poll_s)):
+            now = time.monotonic()
+            if self._pending and now - self._changed_at >= self.save_delay_s:
+                try:
+                    self.flush()
+                except OSError:
+                    self._changed_at = now   # повторим через save_delay_s
+            if now >= next_poll:
+                next_poll = now + self.poll_s
+                self._check_file()
+
+    def _check_file(self) -> None:
+        with self._lock:
+            if _file_sig(self.path) != self._sig:
+                self._reload()
+
+    def close(self) -> None:
+        """Останавливает наблюдение и дописывает отложенные изменения."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+        try:
+            self.flush()
+        except OSError:
+            pass
+
+
+_services: Dict[str, ConfigService] = {}
+_services_lock = threading.Lock()
+
+
+def config_service(path: str = "config.yaml") -> ConfigService:
+    """Сервис конфигурации для файла (создаётся и читает файл при первом обращении)."""
+    key = os.path.abspath(path)
+    with _services_lock:
+        s = _services.get(key)
+        if s is None:
+            s = _services[key] = ConfigService(path)
+        return s
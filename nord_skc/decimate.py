@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+Arrays = Tuple[np.ndarray, np.ndarray]
+
+METHODS = ("minmax", "lttb", "off")
+
+
+def clip_to_range(x: np.ndarray, y: np.ndarray, x0: float, x1: float) -> Arrays:
+    """
+    Оставляет точки внутри [x0, x1] плюс по одной снаружи с каждой стороны,
+    чтобы линия доходила до края графика. x должен быть отсортирован. Без копий.
+    """
+    i0 = max(0, int(np.searchsorted(x, x0, side="left")) - 1)
+    i1 = min(len(x), int(np.searchsorted(x, x1, side="right")) + 1)
+    return x[i0:i1], y[i0:i1]
+
+
+def minmax(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Arrays:
+    """
+    Min/max прореживание: в каждом из n_buckets интервалов остаются две точки —
+    минимум и максимум (в порядке времени). Пики не пропадают, на выходе
+    не больше 2 × n_buckets точек. NaN (разрывы) сохраняются только если весь
+    интервал — NaN.
+    """
+    n = len(y)
+    n_buckets = max(1, int(n_buckets))
+    if n <= 2 * n_buckets:
+        return x, y
+
+    per = -(-n // n_buckets)  # ceil
+    m = (n // per) * per
+
+    yb = y[:m].reshape(-1, per)
+    nan = np.isnan(yb)
+    imin = np.argmin(np.where(nan, np.inf, yb), axis=1)
+    imax = np.argmax(np.where(nan, -np.inf, yb), axis=1)
+
+    base = np.arange(0, m, per)
+    idx = np.empty(2 * len(base), dtype=np.intp)
+    idx[0::2] = base + np.minimum(imin, imax)
+    idx[1::2] = base + np.maximum(imin, imax)
+
+    if m < n:
+        tail = y[m:]
+        if np.isnan(tail).all():
+            t = np.array([m, n - 1], dtype=np.intp)
+        else:
+            a = m + int(np.nanargmin(tail))
+            b = m + int(np.nanargmax(tail))
+            t = np.array([min(a, b), max(a, b)], dtype=np.intp)
+        idx = np.concatenate([idx, t])
+
+    return x[idx], y[idx]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Arrays:
+    """
+    Largest-Triangle-Three-Buckets: n_out точек, визуально ближе к исходной кривой,
+    чем min/max, но дороже (цикл по интервалам). NaN отбрасываются.
+    """
+    ok = ~np.isnan(y)
+    if not ok.all():
+        x, y = x[ok], y[ok]
+
+    n = len(y)
+    n_out = max(3, int(n_out))
+    if n <= n_out:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # среднее следующего интервала (для последнего — последняя точка)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            cx = x[nlo:nhi].mean()
+            cy = y[nlo:nhi].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return x[idx], y[idx]
+
+
+def decimate(x: np.ndarray, y: np.ndarray, width_px: int, method: str = "minmax") -> Arrays:
+    """Прореживание под ширину графика в пикселях выбранным методом."""
+    if method == "lttb":
+        return lttb(x, y, width_px)
+    if method == "minmax":
+        return minmax(x, y, width_px)
+    return x, y
@@ -1,5 +1,42 @@
-from .base import BaseDriver
-from .siemens_s7 import SiemensS7Driver
-from .serva_tcp import ServaTcpDriver
+"""
+Драйверы агрегатов. Модули драйверов импортируются лениво, при первом обращении
+к имени (from nord_skc.drivers import SiemensS7Driver) или при создании драйвера
+через make_driver: импорт пакета не тянет snap7 и NumPy-разбор SERVA.
+"""
+from __future__ import annotations
 
-__all__ = ["BaseDriver", "SiemensS7Driver", "ServaTcpDriver"]
+import importlib
+from typing import Any
+
+from .base import AsyncDriver, BaseDriver
+from .factory import driver_types, make_async_driver, make_driver, register_driver
+
+# имя -> модуль, где оно определено
+_LAZY = {
+    "SiemensS7Driver": ".siemens_s7",
+    "ServaTcpDriver": ".serva_tcp",
+    "AsyncServaTcpDriver": ".serva_async",
+    "ReplayDriver": ".replay",
+}
+
+__all__ = [
+    "AsyncDriver",
+    "AsyncServaTcpDriver",
+    "BaseDriver",
+    "ReplayDriver",
+    "SiemensS7Driver",
+    "ServaTcpDriver",
+    "driver_types",
+    "make_async_driver",
+    "make_driver",
+    "register_driver",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
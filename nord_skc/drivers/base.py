@@ -1,17 +1,87 @@
 from __future__ import annotations
-from typing import Any
+import time
+from concurrent.futures import Executor
+from typing import Any, List, Optional, Tuple
 from nord_skc.model import ReadResult
 
 class BaseDriver:
+    # True — read_batch() сам ждёт данные от агрегата (потоковый режим),
+    # опросчику не нужно делать паузы между вызовами
+    streaming: bool = False
+
+    # nord_skc.metrics.AssetMetrics: драйвер пишет туда время разбора и принятые байты
+    metrics: Any = None
+
     def connect(self) -> None:
         raise NotImplementedError
 
     def close(self) -> None:
         raise NotImplementedError
 
+    def is_connected(self) -> bool:
+        """Есть ли живое подключение (тогда повторный connect() не нужен)."""
+        return False
+
     def read_once(self) -> ReadResult:
         raise NotImplementedError
 
+    def read_batch(self) -> List[Tuple[float, ReadResult]]:
+        """
+        Все новые точки с прошлого вызова: [(время получения, результат)].
+        По умолчанию — одно чтение; драйверы, которые получают несколько
+        точек за такт (проигрывание записи, потоковый режим), переопределяют.
+        """
+        return [(time.time(), self.read_once())]
+
     def write_command(self, name: str, value: Any) -> bool:
         # позже добавим команды управления
         return False
+
+
+class AsyncDriver:
+    """Тот же интерфейс, что и BaseDriver, но для asyncio (FleetPoller)."""
+
+    async def connect(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+    async def read_once(self) -> ReadResult:
+        raise NotImplementedError
+
+
+class ThreadedAsyncDriver(AsyncDriver):
+    """
+    Блокирующий драйвер (например, snap7) в asyncio: вызовы уходят в пул потоков.
+    Пока предыдущий вызов не вернулся (зависший db_read), новый не запускается —
+    иначе два потока работали бы с одним клиентом одновременно.
+    """
+
+    def __init__(self, driver: BaseDriver, executor: Optional[Executor] = None):
+        self.driver = driver
+        self.executor = executor
+        self._busy: Optional["asyncio.Future"] = None
+
+    async def _call(self, fn):
+        # asyncio нужен только FleetPoller — GUI его не импортирует
+        import asyncio
+
+        if self._busy is not None and not self._busy.done():
+            raise TimeoutError("previous call still running")
+        loop = asyncio.get_running_loop()
+        self._busy = loop.run_in_executor(self.executor, fn)
+        # shield: таймаут снаружи не должен "завершать" future, пока поток ещё работает
+        return await asyncio.shield(self._busy)
+
+    async def connect(self) -> None:
+        await self._call(self.driver.connect)
+
+    async def close(self) -> None:
+        try:
+            await self._call(self.driver.close)
+        except TimeoutError:
+            pass
+
+    async def read_once(self) -> ReadResult:
+        return await self._call(self.driver.read_once)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Union
+
+from nord_skc.config import AssetConfig
+from .base import AsyncDriver, BaseDriver, ThreadedAsyncDriver
+
+DriverFactory = Callable[[AssetConfig], BaseDriver]
+AsyncDriverFactory = Callable[[AssetConfig], AsyncDriver]
+
+# группа entry points для сторонних драйверов:
+#   [project.entry-points."nord_skc.drivers"]
+#   my_plc = "my_package.driver:make_driver"     # имя = type агрегата в config.yaml
+ENTRY_POINT_GROUP = "nord_skc.drivers"
+
+
+# ----------------- встроенные драйверы -----------------
+# Модуль драйвера импортируется только при создании первого драйвера этого типа:
+# snap7 (нативная библиотека) не грузится, пока во флоте нет JEREH.
+def _siemens_s7(a: AssetConfig) -> BaseDriver:
+    from .siemens_s7 import SiemensS7Driver
+
+    tags = a.extra.get("tags") or {}
+    return SiemensS7Driver(
+        ip=a.ip,
+        rack=int(a.extra.get("rack", 0)),
+        slot=int(a.extra.get("slot", 1)),
+        tags=tags,
+        port=int(a.extra.get("port", 102)),
+    )
+
+
+def _serva_tcp(a: AssetConfig) -> BaseDriver:
+    from .serva_tcp import ServaTcpDriver
+
+    return ServaTcpDriver(
+        ip=a.ip,
+        port=int(a.extra.get("port", 6565)),
+        timeout_s=float(a.extra.get("timeout_s", 2.0)),
+        field_names=list(a.extra.get("field_names") or []),
+        stream=bool(a.extra.get("stream", False)),
+        keepalive_s=float(a.extra.get("keepalive_s", 1.0)),
+    )
+
+
+def _serva_tcp_async(a: AssetConfig) -> AsyncDriver:
+    from .serva_async import AsyncServaTcpDriver
+
+    return AsyncServaTcpDriver(
+        ip=a.ip,
+        port=int(a.extra.get("port", 6565)),
+        timeout_s=float(a.extra.get("timeout_s", 2.0)),
+        field_names=list(a.extra.get("field_names") or []),
+    )
+
+
+def _replay(a: AssetConfig) -> BaseDriver:
+    from .replay import ReplayDriver
+
+    return ReplayDriver(
+        path=str(a.extra["path"]),
+        speed=float(a.extra.get("speed", 1.0)),
+        loop=bool(a.extra.get("loop", True)),
+    )
+
+
+# ----------------- реестр -----------------
+# type -> фабрика или строка "модуль:функция" (импортируется при первом обращении)
+_drivers: Dict[str, Union[DriverFactory, str]] = {
+    "siemens_s7": _siemens_s7,
+    "serva_tcp": _serva_tcp,
+    "replay": _replay,
+}
+_async_drivers: Dict[str, Union[AsyncDriverFactory, str]] = {
+    "serva_tcp": _serva_tcp_async,
+}
+_lock = threading.Lock()
+_entry_points_loaded = False
+
+
+def register_driver(
+    type_name: str,
+    factory: Union[DriverFactory, str],
+    async_factory: Union[AsyncDriverFactory, str, None] = None,
+) -> None:
+    """
+    Регистрирует тип агрегата. factory — callable(AssetConfig) -> BaseDriver
+    или "модуль:функция" (модуль импортируется при первом драйвере этого типа).
+    async_factory — нативный asyncio-драйвер для FleetPoller; без него — ThreadedAsyncDriver.
+    """
+    with _lock:
+        _drivers[type_name] = factory
+        if async_factory is not None:
+            _async_drivers[type_name] = async_factory
+
+
+def _resolve(f: Union[Callable, str]) -> Callable:
+    if callable(f):
+        return f
+    module, _, attr = f.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _load_entry_points() -> None:
+    """Драйверы из установленных пакетов; сами модули не импортируются до первого драйвера."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return
+    with _lock:
+        for ep in eps:
+            # встроенные типы плагином не перекрываются
+            _drivers.setdefault(ep.name, ep.value)
+
+
+def driver_types() -> List[str]:
+    _load_entry_points()
+    return sorted(_drivers)
+
+
+def _factory(type_name: str) -> DriverFactory:
+    f = _drivers.get(type_name)
+    if f is None:
+        _load_entry_points()
+        f = _drivers.get(type_name)
+    if f is None:
+        raise ValueError(f"Unknown asset type: {type_name}")
+    if not callable(f):
+        f = _resolve(f)
+        with _lock:
+            _drivers[type_name] = f
+    return f
+
+
+def make_driver(a: AssetConfig) -> BaseDriver:
+    """Создаёт драйвер по описанию агрегата из config.yaml (без подключения)."""
+    return _factory(a.type)(a)
+
+
+def make_async_driver(a: AssetConfig, executor: Optional[Executor] = None) -> AsyncDriver:
+    """
+    Драйвер для FleetPoller. У SERVA есть нативный asyncio-вариант,
+    остальные (snap7) работают в пуле потоков через ThreadedAsyncDriver.
+    """
+    f = _async_drivers.get(a.type)
+    if f is not None:
+        return _resolve(f)(a)
+    return ThreadedAsyncDriver(make_driver(a), executor=executor)
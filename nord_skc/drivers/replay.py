@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import csv
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from nord_skc.model import ReadResult
+from nord_skc.reconnect import END_OF_STREAM
+from .base import BaseDriver
+
+
+def load_recording(path: str) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """Читает запись (CSV или .nskc) целиком: (ts[n], каналы, data[n_channels, n])."""
+    if path.endswith(".nskc"):
+        from nord_skc.recfile import RecFileReader
+
+        with RecFileReader(path) as r:
+            ts, cols = r.range()
+            channels = list(r.channels)
+            data = np.array([cols[k] for k in channels], dtype=np.float64).reshape(len(channels), len(ts))
+            return np.array(ts, dtype=np.float64), channels, data
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        rows = csv.reader(f)
+        header = next(rows, None)
+        if not header or header[0] != "ts":
+            raise ValueError(f"not a recording: {path}")
+        channels = header[1:]
+        ts_l: List[float] = []
+        cols: List[List[float]] = [[] for _ in channels]
+        for row in rows:
+            if not row:
+                continue
+            ts_l.append(float(row[0]))
+            for i, col in enumerate(cols):
+                cell = row[i + 1] if i + 1 < len(row) else ""
+                col.append(float(cell) if cell else math.nan)
+
+    return np.array(ts_l, dtype=np.float64), channels, np.array(cols, dtype=np.float64).reshape(len(channels), len(ts_l))
+
+
+class ReplayDriver(BaseDriver):
+    """
+    Проигрывание записанной сессии (records/*.csv, *.nskc) через интерфейс драйвера —
+    реальные данные идут через AssetWindow, запись и весь конвейер, как с агрегата.
+
+    speed: 1.0 — реальное время, 10 / 100 — ускоренно, 0 — максимально быстро
+    (не больше max_batch точек за вызов, время точек — по записи, подряд с текущего момента).
+    read_batch() отдаёт точки, "наступившие" с прошлого вызова, но не больше max_batch:
+    если опрос не успевает за speed, более старые пропускаются (счётчик dropped,
+    в метриках — тоже dropped). read_once() — только самую свежую.
+
+    loop=False: после последней точки — ошибка END_OF_STREAM (для Reconnector — конец,
+    не обрыв), а connect() после close() продолжает с той же позиции, а не с начала.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = True, max_batch: int = 1000):
+        self.path = path
+        self.speed = float(speed)
+        self.loop = loop
+        self.max_batch = max(1, int(max_batch))
+
+        self._ts: Optional[np.ndarray] = None
+        self._channels: List[str] = []
+        self._data: Optional[np.ndarray] = None
+        self._pos = 0
+        self._wall0 = 0.0
+        self._rec0 = 0.0
+        self._shift = None           # speed <= 0: время точки = время в записи + _shift
+        self._last_out = -math.inf   # время последней отданной точки
+        self._step = 1.0             # типичный шаг записи: стык кругов при loop
+        self.dropped = 0             # точки, пропущенные из-за отставания
+
+    def connect(self) -> None:
+        ts, channels, data = load_recording(self.path)
+        if not len(ts):
+            raise ValueError(f"empty recording: {self.path}")
+        # без loop переподключение — не повод играть запись заново
+        resume = not self.loop and self._pos > 0
+        self._ts, self._channels, self._data = ts, channels, data
+        steps = np.diff(ts)
+        steps = steps[steps > 0]
+        self._step = float(np.median(steps)) if len(steps) else 1.0
+        if resume:
+            self._pos = min(self._pos, len(ts))
+            self._wall0 = time.time()
+            self._rec0 = float(ts[min(self._pos, len(ts) - 1)])
+            return
+        self._shift = None
+        self._rewind()
+
+    def close(self) -> None:
+        self._ts = None
+        self._data = None
+
+    def is_connected(self) -> bool:
+        return self._ts is not None
+
+    def _rewind(self) -> None:
+        assert self._ts is not None
+        self._pos = 0
+        self._wall0 = time.time()
+        self._rec0 = float(self._ts[0])
+        if self.speed <= 0:
+            # новый круг продолжает время прошлого, а не начинается заново
+            start = self._wall0 if self._shift is None else self._last_out + self._step
+            self._shift = start - self._rec0
+
+    def _sample(self, i: int) -> ReadResult:
+        assert self._data is not None
+        values: Dict[str, float] = {
+            k: v for k, v in zip(self._channels, self._data[:, i].tolist()) if v == v  # NaN — канала не было
+        }
+        return ReadResult(ok=True, values=values)
+
+    def _due(self) -> int:
+        """Индекс, до которого (не включая) точки уже должны быть отданы."""
+        assert self._ts is not None
+        n = len(self._ts)
+        if self.speed <= 0:
+            return min(n, self._pos + self.max_batch)
+        rec_now = self._rec0 + (time.time() - self._wall0) * self.speed
+        return int(np.searchsorted(self._ts, rec_now, side="right"))
+
+    def read_batch(self) -> List[Tuple[float, ReadResult]]:
+        if self._ts is None:
+            return [(time.time(), ReadResult(ok=False, values={}, error="not connected"))]
+
+        if self._pos >= len(self._ts):
+            if not self.loop:
+                return [(time.time(), ReadResult(ok=False, values={}, error=END_OF_STREAM))]
+            self._rewind()
+
+        end = self._due()
+        start = self._pos
+        if end - start > self.max_batch:
+            # не успеваем за скоростью — отдаём хвост, а не копим отставание
+            lost = end - self.max_batch - start
+            start = end - self.max_batch
+            self.dropped += lost
+            if self.metrics is not None:
+                self.metrics.dropped += lost
+        self._pos = max(self._pos, end)
+
+        out: List[Tuple[float, ReadResult]] = []
+        for i in range(start, end):
+            if self.speed > 0:
+                ts = self._wall0 + (float(self._ts[i]) - self._rec0) / self.speed
+            else:
+                ts = float(self._ts[i]) + self._shift
+            out.append((ts, self._sample(i)))
+        if out:
+            self._last_out = out[-1][0]
+        return out
+
+    def read_once(self) -> ReadResult:
+        batch = self.read_batch()
+        if not batch:
+            # новых точек ещё нет — повторяем последнюю отданную
+            if self._ts is not None and self._pos > 0:
+                return self._sample(self._pos - 1)
+            return ReadResult(ok=True, values={})
+        return batch[-1][1]
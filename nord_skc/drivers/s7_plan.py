@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Ответ на чтение: PDU минус заголовки S7 (18 байт). 240 — PDU по умолчанию у S7-300/1200.
+DEFAULT_PDU = 240
+PDU_OVERHEAD = 18
+
+# Siemens S7: big-endian. dtype -> код struct
+CODES: Dict[str, str] = {
+    "bool": "B",     # байт целиком, бит выделяется после unpack
+    "byte": "B",
+    "word": "H",
+    "dword": "I",
+    "int": "h",
+    "dint": "i",
+    "real": "f",
+    "lreal": "d",
+    "time": "i",     # мс со знаком -> секунды
+}
+# STRING: [макс. длина][текущая длина][символы]; size — 2 + макс. длина (по умолчанию STRING[254])
+STRING_SIZE = 256
+DTYPES = tuple(CODES) + ("string",)
+
+
+def dtype_size(dtype: str) -> int:
+    dt = dtype.lower()
+    if dt == "string":
+        return STRING_SIZE
+    code = CODES.get(dt)
+    if code is None:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    return struct.calcsize(">" + code)
+
+
+@dataclass
+class S7Tag:
+    name: str
+    db: int
+    start: int
+    size: int
+    dtype: str          # в нижнем регистре
+    bit: int = 0        # только BOOL
+
+    @classmethod
+    def parse(cls, name: str, t: dict) -> "S7Tag":
+        dtype = str(t["dtype"]).lower()
+        size = dtype_size(dtype)
+        if dtype == "string":
+            size = int(t.get("size", size))
+            if size < 3:
+                raise ValueError(f"{name}: STRING size must be >= 3")
+        else:
+            size = max(int(t.get("size", size)), size)
+        bit = int(t.get("bit", 0))
+        if not 0 <= bit <= 7:
+            raise ValueError(f"{name}: bit must be 0..7")
+        return cls(str(name), int(t["db"]), int(t["start"]), size, dtype, bit)
+
+
+def _code(t: S7Tag) -> str:
+    return f"{t.size}s" if t.dtype == "string" else CODES[t.dtype]
+
+
+def _string(b: bytes) -> str:
+    n = min(b[1], len(b) - 2)
+    return b[2 : 2 + n].decode("latin-1")
+
+
+class _Layout:
+    """
+    Один struct.Struct на (часть) блока: поля по возрастанию смещений, между ними — pad.
+    Числовые теги без пересчёта снимаются одним itemgetter, остальные (BOOL, TIME, STRING) — по списку.
+    """
+
+    def __init__(self, fields: List[Tuple[int, str]], tags: List[Tuple[S7Tag, int]]):
+        # слой начинается со своего первого поля: без лишнего pad в начале
+        self.offset = fields[0][0]
+        fmt, pos = [">"], self.offset
+        for offset, code in fields:
+            if offset > pos:
+                fmt.append(f"{offset - pos}x")
+            fmt.append(code)
+            pos = offset + struct.calcsize(">" + code)
+        self.st = struct.Struct("".join(fmt))
+
+        plain = [(t.name, i) for t, i in tags if t.dtype not in ("bool", "time", "string")]
+        self.names: Tuple[str, ...] = tuple(n for n, _ in plain)
+        idx = [i for _, i in plain]
+        self.get: Optional[Callable] = None
+        if idx and idx != list(range(len(fields))):
+            g = itemgetter(*idx)
+            self.get = g if len(idx) > 1 else (lambda vals, g=g: (g(vals),))
+        # (имя, индекс поля, dtype, бит)
+        self.special = [(t.name, i, t.dtype, t.bit) for t, i in tags if t.dtype in ("bool", "time", "string")]
+
+    def decode(self, raw: bytes, out: Dict[str, float], texts: Optional[Dict[str, str]]) -> None:
+        vals = self.st.unpack_from(raw, self.offset)
+        if self.names:
+            out.update(zip(self.names, map(float, vals if self.get is None else self.get(vals))))
+        for name, i, dtype, bit in self.special:
+            v = vals[i]
+            if dtype == "bool":
+                out[name] = float((v >> bit) & 1)
+            elif dtype == "time":
+                out[name] = v / 1000.0
+            elif texts is not None:
+                texts[name] = _string(v)
+
+
+@dataclass
+class ReadBlock:
+    """Один db_read: непрерывный диапазон DB и теги, которые из него декодируются."""
+    db: int
+    start: int
+    size: int
+    tags: List[S7Tag] = field(default_factory=list)
+    _layouts: Optional[List[_Layout]] = field(default=None, repr=False)
+
+    def compile(self) -> None:
+        """
+        Раскладывает теги блока в struct.Struct: обычно один на блок. Пересекающиеся
+        поля (два тега на одних байтах) уходят в следующий слой — ещё один unpack_from.
+        Биты одного байта делят одно поле.
+        """
+        fields = {(t.start - self.start, _code(t)) for t in self.tags}
+
+        # слои: поле идёт в первый слой, где оно не пересекается с предыдущим
+        layers: List[List[Tuple[int, str]]] = []
+        ends: List[int] = []
+        where: Dict[Tuple[int, str], Tuple[int, int]] = {}
+        for offset, code in sorted(fields):
+            size = struct.calcsize(">" + code)
+            for li, end in enumerate(ends):
+                if offset >= end:
+                    break
+            else:
+                li = len(layers)
+                layers.append([])
+                ends.append(0)
+            where[(offset, code)] = (li, len(layers[li]))
+            layers[li].append((offset, code))
+            ends[li] = offset + size
+
+        by_layer: List[List[Tuple[S7Tag, int]]] = [[] for _ in layers]
+        for t in self.tags:
+            li, i = where[(t.start - self.start, _code(t))]
+            by_layer[li].append((t, i))
+
+        self._layouts = [_Layout(flds, tags) for flds, tags in zip(layers, by_layer)]
+
+    def decode(self, raw: bytes, out: Dict[str, float], texts: Optional[Dict[str, str]] = None) -> None:
+        if self._layouts is None:
+            self.compile()
+        for lay in self._layouts:
+            lay.decode(raw, out, texts)
+
+
+class S7ReadPlan:
+    """
+    План чтения тегов S7: строится один раз из tags {name: {db,start,size,dtype[,bit]}}.
+
+    Соседние и перекрывающиеся теги одного DB склеиваются в блоки, пока блок
+    помещается в один PDU ответа, а "дырка" между тегами не больше max_gap байт
+    (лишние байты дешевле лишнего round trip). Каждый блок компилируется
+    в struct.Struct: на опросе — db_read и один unpack_from на блок.
+    """
+
+    def __init__(self, tags: dict, pdu_size: int = DEFAULT_PDU, max_gap: int = 32):
+        self.max_block = max(1, int(pdu_size) - PDU_OVERHEAD)
+        self.max_gap = max(0, int(max_gap))
+        self.blocks: List[ReadBlock] = self._build(tags or {})
+        self.nbytes = sum(b.size for b in self.blocks)
+        self.has_text = any(t.dtype == "string" for b in self.blocks for t in b.tags)
+
+    def _build(self, tags: dict) -> List[ReadBlock]:
+        items = [S7Tag.parse(name, t) for name, t in tags.items()]
+        items.sort(key=lambda t: (t.db, t.start))
+
+        blocks: List[ReadBlock] = []
+        cur: ReadBlock | None = None
+        for t in items:
+            end = t.start + t.size
+            if (
+                cur is not None
+                and cur.db == t.db
+                and t.start <= cur.start + cur.size + self.max_gap
+                and max(end, cur.start + cur.size) - cur.start <= self.max_block
+            ):
+                cur.size = max(end, cur.start + cur.size) - cur.start
+            else:
+                cur = ReadBlock(db=t.db, start=t.start, size=t.size)
+                blocks.append(cur)
+            cur.tags.append(t)
+        for b in blocks:
+            b.compile()
+        return blocks
+
+    def read_raw(self, client) -> List[bytes]:
+        """Только сеть: client.db_read на каждый блок."""
+        return [client.db_read(b.db, b.start, b.size) for b in self.blocks]
+
+    def decode(self, raws: List[bytes], texts: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+        """Числовые теги (BOOL — 0/1, TIME — секунды); STRING — в texts, если передан."""
+        values: Dict[str, float] = {}
+        for b, raw in zip(self.blocks, raws):
+            b.decode(raw, values, texts)
+        return values
+
+    def read(self, client, texts: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+        """Читает все блоки через snap7 client.db_read и декодирует теги."""
+        return self.decode(self.read_raw(client), texts)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+from nord_skc.model import ReadResult
+from .base import AsyncDriver
+from .serva_parser import ServaFrameParser
+from .serva_tcp import HELLO
+
+
+class AsyncServaTcpDriver(AsyncDriver):
+    """
+    Асинхронный вариант ServaTcpDriver (asyncio.open_connection).
+    Протокол тот же: запрос b"$HELLO" без CRLF, ответ — CSV строка до \r\n.
+    Таймауты накладывает вызывающий (FleetPoller) через asyncio.wait_for.
+
+    SERVA после $HELLO шлёт кадры сам, и между опросами они копятся в StreamReader.
+    read_once() забирает всё накопленное, разбирает ServaFrameParser (как синхронный
+    драйвер) и возвращает самый свежий кадр, а не самый старый из буфера.
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        port: int = 6565,
+        timeout_s: float = 2.0,
+        field_names: Optional[List[str]] = None,
+    ):
+        self.ip = ip
+        self.port = port
+        self.timeout_s = timeout_s
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._parser = ServaFrameParser()
+
+        # названия 12 каналов
+        self.field_names = field_names or [f"field_{i:02d}" for i in range(1, 13)]
+
+    async def connect(self) -> None:
+        await self.close()
+        self._parser.clear()
+        self._reader, self._writer = await asyncio.open_connection(
+            self.ip, self.port, limit=self._parser.max_size
+        )
+
+    async def close(self) -> None:
+        w = self._writer
+        self._reader = None
+        self._writer = None
+        if w is not None:
+            try:
+                w.close()
+                await w.wait_closed()
+            except Exception:
+                pass
+
+    async def read_once(self) -> ReadResult:
+        if self._reader is None or self._writer is None:
+            return ReadResult(ok=False, values={}, error="not connected")
+
+        try:
+            self._writer.write(HELLO)
+            await self._writer.drain()
+
+            parser = self._parser
+            while True:
+                # read() отдаёт сразу всё, что уже лежит в буфере; ждёт, только если он пуст
+                # (мусор без CRLF упрётся в max_size парсера — rx buffer overflow)
+                data = await self._reader.read(parser.max_size)
+                if not data:
+                    raise ConnectionError("remote closed connection")
+                parser.feed(data)
+                if parser.has_frame():
+                    break
+
+            rows, errors = parser.decode_frames()
+            if len(rows):
+                return ReadResult(ok=True, values=dict(zip(self.field_names, rows[-1].tolist())))
+            return ReadResult(ok=False, values={}, error=errors[0] if errors else "empty reply")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # поток байт рассинхронизирован — следующий read_once вернёт "not connected"
+            await self.close()
+            return ReadResult(ok=False, values={}, error=str(e))
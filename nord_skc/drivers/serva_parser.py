@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import warnings
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+N_FLOATS = 12
+_EMPTY = np.empty((0, N_FLOATS), dtype=np.float64)
+
+
+class ServaFrameParser:
+    """
+    Разбор потока SERVA без лишних копий.
+
+    - байты принимаются recv_into() прямо в свободный хвост буфера
+    - буфер не сдвигается на каждый кадр: есть курсор чтения, а уплотнение
+      (копия недочитанного хвоста в начало) происходит редко
+    - все накопленные кадры разбираются за один проход NumPy: числовые поля (3..14)
+      вырезаются маской и парсятся одним вызовом, без списков строк и float() на значение
+
+    Формат кадра: id, model, ts, 12 float, status.
+    """
+
+    def __init__(self, capacity: int = 64 * 1024, max_size: int = 1024 * 1024):
+        self.max_size = int(max_size)
+        self._buf = bytearray(max(256, int(capacity)))
+        self._mv = memoryview(self._buf)
+        self._rd = 0  # курсор чтения
+        self._wr = 0  # конец принятых данных
+
+    # ----------------- приём -----------------
+    def pending(self) -> int:
+        """Сколько принятых байт ещё не разобрано."""
+        return self._wr - self._rd
+
+    def clear(self) -> None:
+        self._rd = self._wr = 0
+
+    def _reserve(self, n: int) -> None:
+        """Гарантирует n свободных байт в хвосте буфера."""
+        if len(self._buf) - self._wr >= n:
+            return
+        live = self._wr - self._rd
+        if self._rd and live + n <= len(self._buf):
+            # уплотнение: одно копирование хвоста на много кадров
+            self._buf[:live] = bytes(self._mv[self._rd:self._wr])
+        else:
+            if live + n > self.max_size:
+                raise ValueError("rx buffer overflow")
+            size = len(self._buf)
+            while size < live + n:
+                size *= 2
+            new = bytearray(min(size, self.max_size))
+            new[:live] = self._mv[self._rd:self._wr]
+            self._mv.release()
+            self._buf = new
+            self._mv = memoryview(self._buf)
+        self._rd, self._wr = 0, live
+
+    def recv_from(self, sock, chunk: int = 4096) -> int:
+        """Читает из сокета прямо в буфер. 0 — соединение закрыто."""
+        self._reserve(chunk)
+        n = sock.recv_into(self._mv[self._wr:], len(self._buf) - self._wr)
+        self._wr += n
+        return n
+
+    def feed(self, data: bytes) -> None:
+        self._reserve(len(data))
+        self._buf[self._wr:self._wr + len(data)] = data
+        self._wr += len(data)
+
+    # ----------------- кадры -----------------
+    def has_frame(self) -> bool:
+        return self._buf.find(b"\r\n", self._rd, self._wr) >= 0
+
+    def next_line(self) -> Optional[str]:
+        """Одна строка без CRLF (для редких случаев и диагностики) или None."""
+        idx = self._buf.find(b"\r\n", self._rd, self._wr)
+        if idx < 0:
+            return None
+        line = str(self._mv[self._rd:idx], "ascii", errors="ignore")
+        self._rd = idx + 2
+        return line
+
+    def decode_frames(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        Разбирает все полные кадры в буфере.
+        Возвращает (values[k, 12] для корректных кадров, ошибки для некорректных).
+
+        Границы кадров и запятые ищутся векторно по всему накопленному участку,
+        числовые части кадров вырезаются маской и разбираются одним fromstring —
+        на кадр не приходится ни одной операции на уровне Python.
+        """
+        last = self._buf.rfind(b"\r\n", self._rd, self._wr)
+        if last < 0:
+            return _EMPTY, []
+        base = self._rd
+        self._rd = last + 2
+
+        arr = np.frombuffer(self._buf, dtype=np.uint8, count=last + 2 - base, offset=base)
+        eol = np.flatnonzero(arr == 10)            # '\n' из CRLF — конец каждого кадра
+        commas = np.flatnonzero(arr == 44)         # ','
+        line_start = np.empty_like(eol)
+        line_start[0] = 0
+        line_start[1:] = eol[:-1] + 1
+
+        n_before = np.searchsorted(commas, eol)    # запятых до конца кадра
+        first = np.searchsorted(commas, line_start)
+        count = n_before - first
+        empty = (eol - line_start) <= 1            # пустая строка ("\r\n")
+
+        good = count >= N_FLOATS + 3               # минимум 16 полей
+        errors = [
+            self._frame_error(base + int(s), base + int(e) - 1)
+            for s, e in zip(line_start[~good & ~empty], eol[~good & ~empty])
+        ]
+        if not good.any():
+            return _EMPTY, errors
+
+        g = first[good]
+        start = commas[g + 2] + 1                  # после 3-й запятой (id, model, ts)
+        end = commas[g + 2 + N_FLOATS] + 1         # до 15-й запятой включительно — разделитель
+
+        delta = np.zeros(len(arr) + 1, dtype=np.int32)
+        delta[start] += 1
+        delta[end] -= 1
+        joined = arr[np.cumsum(delta[:-1]) > 0].tobytes()[:-1]
+
+        n = len(start)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                flat = np.fromstring(joined, dtype=np.float64, sep=",")
+            if flat.size == N_FLOATS * n:
+                return flat.reshape(n, N_FLOATS), errors
+        except (ValueError, DeprecationWarning):
+            pass
+
+        # мусор в числах — разбираем по кадрам, чтобы отбросить только плохие
+        rows: List[List[float]] = []
+        for s, e in zip(start.tolist(), end.tolist()):
+            s, e = base + s, base + e - 1
+            try:
+                row = [float(x) for x in bytes(self._mv[s:e]).split(b",")]
+            except ValueError as ex:
+                errors.append(f"cannot parse floats: {ex}; line={self._text(s, e)}")
+                continue
+            if len(row) != N_FLOATS:
+                errors.append(f"unexpected float count: {len(row)}; line={self._text(s, e)}")
+                continue
+            rows.append(row)
+        if not rows:
+            return _EMPTY, errors
+        return np.array(rows, dtype=np.float64), errors
+
+    def _text(self, s: int, e: int) -> str:
+        return str(self._mv[s:min(e, s + 120)], "ascii", errors="ignore")
+
+    def _frame_error(self, s: int, e: int) -> str:
+        text = self._text(s, e).strip()
+        if not text:
+            return "empty reply"
+        fields = self._buf.count(b",", s, e) + 1
+        return f"bad reply (fields={fields}): {text}"
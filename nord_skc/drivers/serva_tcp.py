@@ -1,10 +1,41 @@
 from __future__ import annotations
 
+import select
 import socket
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from nord_skc.model import ReadResult
 from .base import BaseDriver
+from .serva_parser import ServaFrameParser
+
+
+HELLO = b"$HELLO"  # запрос данных, без CRLF (как в дампе)
+
+
+def parse_reply(line: str, field_names: List[str]) -> ReadResult:
+    """Разбирает одну строку ответа SERVA (без CRLF) в ReadResult."""
+    line = line.strip()
+    if not line:
+        return ReadResult(ok=False, values={}, error="empty reply")
+
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < 16:
+        return ReadResult(ok=False, values={}, error=f"bad reply (fields={len(parts)}): {line[:120]}")
+
+    # ожидаем: 0=id, 1=model, 2=ts, 3..14=12 float, 15=status
+    try:
+        nums = [float(x) for x in parts[3:15]]
+    except ValueError as e:
+        return ReadResult(ok=False, values={}, error=f"cannot parse floats: {e}; line={line[:120]}")
+
+    if len(nums) != 12:
+        return ReadResult(ok=False, values={}, error=f"unexpected float count: {len(nums)}; line={line[:120]}")
+
+    values: Dict[str, float] = dict(zip(field_names, nums))
+    return ReadResult(ok=True, values=values)
 
 
 class ServaTcpDriver(BaseDriver):
@@ -14,6 +45,12 @@ class ServaTcpDriver(BaseDriver):
       - запрос: b"$HELLO" (6 байт, без CRLF)
       - ответ: ASCII строка CSV, заканчивается \r\n
         полей обычно 16: id, model, timestamp, 12 float, status
+
+    stream=True — потоковый режим: после $HELLO агрегат сам шлёт строки,
+    драйвер только обновляет $HELLO раз в keepalive_s и забирает все кадры
+    по мере прихода (read_batch / frames). Время кадра — время приёма; если один recv
+    принёс несколько кадров, они раскладываются равномерно между прошлым и этим приёмом
+    (поле ts агрегата — с точностью до секунды, для 50 Гц не годится).
     """
 
     def __init__(
@@ -22,12 +59,19 @@ class ServaTcpDriver(BaseDriver):
         port: int = 6565,
         timeout_s: float = 2.0,
         field_names: Optional[List[str]] = None,
+        stream: bool = False,
+        keepalive_s: float = 1.0,
     ):
         self.ip = ip
         self.port = port
         self.timeout_s = timeout_s
         self.sock: socket.socket | None = None
-        self._rx = bytearray()
+        self._parser = ServaFrameParser()
+
+        self.streaming = bool(stream)
+        self.keepalive_s = float(keepalive_s)
+        self._last_hello = 0.0
+        self._last_rx = 0.0   # time.time() прошлого приёма (потоковый режим)
 
         # названия 12 каналов
         self.field_names = field_names or [f"field_{i:02d}" for i in range(1, 13)]
@@ -35,7 +79,10 @@ class ServaTcpDriver(BaseDriver):
     def connect(self) -> None:
         self.sock = socket.create_connection((self.ip, self.port), timeout=self.timeout_s)
         self.sock.settimeout(self.timeout_s)
-        self._rx.clear()
+        self._parser.clear()
+        self._last_rx = time.time()
+        if self.streaming:
+            self._send_hello()
 
     def close(self) -> None:
         if self.sock:
@@ -44,24 +91,30 @@ class ServaTcpDriver(BaseDriver):
             finally:
                 self.sock = None
 
-    def _recv_line_crlf(self) -> str:
-        """Читает одну строку, разделитель \r\n. Возвращает строку без CRLF."""
-        assert self.sock is not None
-
-        while True:
-            idx = self._rx.find(b"\r\n")
-            if idx >= 0:
-                line = bytes(self._rx[:idx])
-                del self._rx[:idx + 2]
-                return line.decode("ascii", errors="ignore")
+    def is_connected(self) -> bool:
+        return self.sock is not None
 
-            chunk = self.sock.recv(4096)
-            if not chunk:
+    def _recv_frames(self) -> None:
+        """Дочитывает из сокета, пока в буфере не появится хотя бы один полный кадр."""
+        assert self.sock is not None
+        while not self._parser.has_frame():
+            n = self._parser.recv_from(self.sock)
+            if not n:
                 raise ConnectionError("remote closed connection")
-            self._rx.extend(chunk)
+            if self.metrics is not None:
+                self.metrics.bytes_rx += n
+
+    def _decode(self) -> Tuple[np.ndarray, List[str]]:
+        if self.metrics is None:
+            return self._parser.decode_frames()
+        t = time.perf_counter()
+        out = self._parser.decode_frames()
+        self.metrics.observe("parse", time.perf_counter() - t)
+        return out
 
-            if len(self._rx) > 1024 * 1024:
-                raise ValueError("rx buffer overflow")
+    def _to_result(self, row: np.ndarray) -> ReadResult:
+        values: Dict[str, float] = dict(zip(self.field_names, row.tolist()))
+        return ReadResult(ok=True, values=values)
 
     def read_once(self) -> ReadResult:
         if not self.sock:
@@ -69,27 +122,78 @@ class ServaTcpDriver(BaseDriver):
 
         try:
             # ВАЖНО: без \r\n (как в дампе)
-            self.sock.sendall(b"$HELLO")
+            self.sock.sendall(HELLO)
 
-            line = self._recv_line_crlf().strip()
-            if not line:
-                return ReadResult(ok=False, values={}, error="empty reply")
+            self._recv_frames()
+            rows, errors = self._decode()
+            if len(rows):
+                # если агрегат успел прислать несколько строк — берём самую свежую
+                return self._to_result(rows[-1])
+            return ReadResult(ok=False, values={}, error=errors[0] if errors else "empty reply")
 
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) < 16:
-                return ReadResult(ok=False, values={}, error=f"bad reply (fields={len(parts)}): {line[:120]}")
-
-            # ожидаем: 0=id, 1=model, 2=ts, 3..14=12 float, 15=status
-            try:
-                nums = [float(x) for x in parts[3:15]]
-            except ValueError as e:
-                return ReadResult(ok=False, values={}, error=f"cannot parse floats: {e}; line={line[:120]}")
+        except Exception as e:
+            return ReadResult(ok=False, values={}, error=str(e))
 
-            if len(nums) != 12:
-                return ReadResult(ok=False, values={}, error=f"unexpected float count: {len(nums)}; line={line[:120]}")
+    # ----------------- потоковый режим -----------------
+    def _send_hello(self) -> None:
+        assert self.sock is not None
+        self.sock.sendall(HELLO)
+        self._last_hello = time.monotonic()
 
-            values: Dict[str, float] = dict(zip(self.field_names, nums))
-            return ReadResult(ok=True, values=values)
+    def _recv_batch(self) -> List[Tuple[float, ReadResult]]:
+        """Один recv + разбор всех кадров, которые он завершил."""
+        assert self.sock is not None
+        n = self._parser.recv_from(self.sock)
+        if not n:
+            raise ConnectionError("remote closed connection")
+        if self.metrics is not None:
+            self.metrics.bytes_rx += n
+        ts = time.time()
+        rows, errors = self._decode()
+        n = len(rows)
+        if n > 1:
+            # кадры копились с прошлого приёма: последний — сейчас, остальные раньше с равным шагом
+            step = max(0.0, ts - self._last_rx) / n
+            out = [(ts - (n - 1 - i) * step, self._to_result(r)) for i, r in enumerate(rows)]
+        else:
+            out = [(ts, self._to_result(r)) for r in rows]
+        self._last_rx = ts
+        if errors and not out:
+            out.append((ts, ReadResult(ok=False, values={}, error=errors[0])))
+        return out
+
+    def read_batch(self) -> List[Tuple[float, ReadResult]]:
+        if not self.streaming:
+            return super().read_batch()
+        if not self.sock:
+            return [(time.time(), ReadResult(ok=False, values={}, error="not connected"))]
 
+        out: List[Tuple[float, ReadResult]] = []
+        try:
+            deadline = time.monotonic() + self.timeout_s
+            while True:
+                now = time.monotonic()
+                if now - self._last_hello >= self.keepalive_s:
+                    self._send_hello()
+
+                # ждём данные, но не дольше, чем до следующего $HELLO или таймаута
+                wait = 0.0 if out else max(0.0, min(deadline, self._last_hello + self.keepalive_s) - now)
+                readable, _, _ = select.select([self.sock], [], [], wait)
+                if readable:
+                    out.extend(self._recv_batch())
+                    continue
+                if out:
+                    return out  # всё, что было в сокете, забрали
+                if time.monotonic() >= deadline:
+                    raise socket.timeout("timed out")
         except Exception as e:
-            return ReadResult(ok=False, values={}, error=str(e))
+            out.append((time.time(), ReadResult(ok=False, values={}, error=str(e))))
+            return out
+
+    def frames(self) -> Iterator[Tuple[float, ReadResult]]:
+        """Бесконечный поток кадров (stream=True) до close() или ошибки связи."""
+        while self.sock is not None:
+            batch = self.read_batch()
+            yield from batch
+            if batch and not batch[-1][1].ok:
+                return
@@ -1,32 +1,47 @@
 from __future__ import annotations
 from typing import Dict
 import struct
+import time
 
 import snap7
 from nord_skc.model import ReadResult
 from .base import BaseDriver
+from .s7_plan import CODES, DEFAULT_PDU, S7ReadPlan
 
 def _parse_value(raw: bytes, dtype: str) -> float:
+    """Одно значение без плана (BOOL — бит 0, STRING не поддерживается); на опросе — S7ReadPlan."""
+    code = CODES.get(dtype.lower())
+    if code is None:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    v = struct.unpack_from(">" + code, raw)[0]
     dt = dtype.lower()
-    # Siemens S7: REAL/INT big-endian
-    if dt == "real":
-        return float(struct.unpack(">f", raw)[0])
-    if dt == "int":
-        return float(struct.unpack(">h", raw)[0])
-    if dt == "dint":
-        return float(struct.unpack(">i", raw)[0])
-    raise ValueError(f"Unsupported dtype: {dtype}")
+    if dt == "bool":
+        return float(v & 1)
+    if dt == "time":
+        return v / 1000.0
+    return float(v)
 
 class SiemensS7Driver(BaseDriver):
-    def __init__(self, ip: str, rack: int, slot: int, tags: dict):
+    def __init__(self, ip: str, rack: int, slot: int, tags: dict, port: int = 102):
         self.ip = ip
         self.rack = rack
         self.slot = slot
+        self.port = port
         self.tags = tags  # {name: {db,start,size,dtype}}
         self.client = snap7.client.Client()
+        self.pdu_size = DEFAULT_PDU
+        self._plan: S7ReadPlan | None = None
 
     def connect(self) -> None:
-        self.client.connect(self.ip, self.rack, self.slot)
+        self.client.connect(self.ip, self.rack, self.slot, self.port)
+        # размер блока чтения зависит от согласованного PDU
+        try:
+            pdu = int(self.client.get_pdu_length())
+        except Exception:
+            pdu = DEFAULT_PDU
+        if pdu != self.pdu_size:
+            self.pdu_size = pdu
+            self._plan = None
 
     def close(self) -> None:
         try:
@@ -34,16 +49,27 @@ class SiemensS7Driver(BaseDriver):
         except Exception:
             pass
 
+    def is_connected(self) -> bool:
+        try:
+            return bool(self.client.get_connected())
+        except Exception:
+            return False
+
     def read_once(self) -> ReadResult:
         try:
-            values: Dict[str, float] = {}
-            for name, t in (self.tags or {}).items():
-                db = int(t["db"])
-                start = int(t["start"])
-                size = int(t["size"])
-                dtype = str(t["dtype"])
-                raw = self.client.db_read(db, start, size)
-                values[name] = _parse_value(raw, dtype)
-            return ReadResult(ok=True, values=values)
+            if self._plan is None:
+                self._plan = S7ReadPlan(self.tags or {}, pdu_size=self.pdu_size)
+            plan = self._plan
+            texts: Dict[str, str] = {}
+            m = self.metrics
+            if m is None:
+                values = plan.read(self.client, texts if plan.has_text else None)
+                return ReadResult(ok=True, values=values, texts=texts)
+            raws = plan.read_raw(self.client)
+            m.bytes_rx += plan.nbytes
+            t = time.perf_counter()
+            values = plan.decode(raws, texts if plan.has_text else None)
+            m.observe("parse", time.perf_counter() - t)
+            return ReadResult(ok=True, values=values, texts=texts)
         except Exception as e:
             return ReadResult(ok=False, values={}, error=str(e))
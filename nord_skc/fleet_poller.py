@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from nord_skc.config import AssetConfig, Config, load_config
+from nord_skc.drivers import AsyncDriver, make_async_driver
+from nord_skc.model import ReadResult
+from nord_skc.reconnect import Backoff, Reconnector
+
+# callback(asset_id, время получения, результат)
+ResultCallback = Callable[[str, float, ReadResult], None]
+
+
+class FleetPoller:
+    """
+    Опрос всех агрегатов из config.yaml одним asyncio-циклом.
+
+    - каждый агрегат — отдельная задача со своим таймаутом (extra.timeout_s),
+      мёртвый агрегат не задерживает опрос остальных
+    - SERVA опрашивается нативно через asyncio, S7 — через пул потоков
+    - при ошибке связи соединение закрывается и поднимается заново
+      с экспоненциальной паузой и джиттером (nord_skc/reconnect.py)
+    """
+
+    def __init__(
+        self,
+        cfg: Config,
+        on_result: Optional[ResultCallback] = None,
+        asset_ids: Optional[Iterable[str]] = None,
+        poll_hz: Optional[float] = None,
+    ):
+        self.cfg = cfg
+        self.on_result = on_result
+        self.poll_hz = float(poll_hz or cfg.app.poll_hz or 1)
+
+        wanted = set(asset_ids) if asset_ids is not None else None
+        self.assets: List[AssetConfig] = [
+            a for a in cfg.assets if wanted is None or a.id in wanted
+        ]
+
+        # последний результат по каждому агрегату
+        self.latest: Dict[str, Tuple[float, ReadResult]] = {}
+
+        self._stop: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # ----------------- управление -----------------
+    async def run(self) -> None:
+        """Опрашивает агрегаты до вызова stop()."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        # отдельный пул: зависший snap7 не должен занимать потоки default executor
+        n_threaded = sum(1 for a in self.assets if a.type != "serva_tcp")
+        executor = ThreadPoolExecutor(max_workers=max(1, n_threaded), thread_name_prefix="fleet-s7")
+        drivers = {a.id: make_async_driver(a, executor=executor) for a in self.assets}
+
+        try:
+            await asyncio.gather(*(self._poll_asset(a, drivers[a.id]) for a in self.assets))
+        finally:
+            await asyncio.gather(*(self._close(d) for d in drivers.values()))
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stop(self) -> None:
+        """Можно вызывать из любого потока."""
+        if self._loop is None or self._stop is None:
+            return
+        self._loop.call_soon_threadsafe(self._stop.set)
+
+    # ----------------- опрос одного агрегата -----------------
+    async def _poll_asset(self, a: AssetConfig, drv: AsyncDriver) -> None:
+        assert self._stop is not None
+        loop = asyncio.get_running_loop()
+        timeout_s = float(a.extra.get("timeout_s", 2.0))
+        period = 1.0 / max(0.001, self.poll_hz)
+
+        link = Reconnector(Backoff(base_s=min(1.0, period), cap_s=30.0))
+        next_t = loop.time()
+        while not self._stop.is_set():
+            rr: Optional[ReadResult] = None
+            if not link.connected and link.due():
+                try:
+                    await asyncio.wait_for(drv.connect(), timeout_s)
+                    link.on_connect(None)
+                except asyncio.TimeoutError:
+                    rr = ReadResult(ok=False, values={}, error="connect timed out")
+                except Exception as e:
+                    rr = ReadResult(ok=False, values={}, error=str(e) or type(e).__name__)
+                if rr is not None:
+                    link.on_connect(rr.error)
+                    await self._close(drv)
+
+            if link.connected:
+                try:
+                    rr = await asyncio.wait_for(drv.read_once(), timeout_s)
+                except asyncio.TimeoutError:
+                    rr = ReadResult(ok=False, values={}, error="read timed out")
+                except Exception as e:
+                    rr = ReadResult(ok=False, values={}, error=str(e) or type(e).__name__)
+
+                if link.on_read(rr.ok, rr.error):
+                    await self._close(drv)
+
+            if rr is not None:
+                self._emit(a.id, time.time(), rr)
+            if link.finished:
+                return
+
+            next_t += period
+            delay = next_t - loop.time()
+            if not link.connected:
+                # связи нет — ждём паузу backoff, а не такт опроса
+                delay = link.wait_s()
+                next_t = loop.time() + delay
+            elif delay < 0:
+                next_t = loop.time()
+                delay = 0.0
+            try:
+                await asyncio.wait_for(self._stop.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _close(self, drv: AsyncDriver) -> None:
+        try:
+            await drv.close()
+        except Exception:
+            pass
+
+    def _emit(self, asset_id: str, ts: float, rr: ReadResult) -> None:
+        self.latest[asset_id] = (ts, rr)
+        if self.on_result is not None:
+            try:
+                self.on_result(asset_id, ts, rr)
+            except Exception:
+                pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """python -m nord_skc.fleet_poller [config.yaml] — печать результатов опроса всего флота."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    cfg = load_config(argv[0] if argv else "config.yaml")
+
+    def show(asset_id: str, ts: float, rr: ReadResult) -> None:
+        state = f"OK ({len(rr.values)} параметров)" if rr.ok else f"ERR {rr.error}"
+        print(f"{time.strftime('%H:%M:%S', time.localtime(ts))} {asset_id}: {state}", flush=True)
+
+    try:
+        asyncio.run(FleetPoller(cfg, on_result=show).run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
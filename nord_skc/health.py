@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from nord_skc.config import AssetConfig
+from nord_skc.drivers.base import BaseDriver
+from nord_skc.drivers.factory import make_driver
+
+# проверяются только сетевые агрегаты (у replay и т.п. «связи» нет)
+PROBE_TYPES = ("serva_tcp", "siemens_s7")
+
+
+@dataclass
+class ProbeResult:
+    asset_id: str
+    ok: bool
+    rtt_ms: float = float("nan")   # время подключения (TCP / S7 connect)
+    error: Optional[str] = None
+    checked_at: float = 0.0
+
+
+class HealthChecker:
+    """
+    Проверка связи со всеми агрегатами сразу, с общим бюджетом времени.
+
+    - каждый агрегат проверяется настоящим connect() своего драйвера
+      (SERVA — TCP connect к порту, JEREH — S7 connect) в пуле потоков
+    - check_all() возвращается не позже чем через budget_s; кто не успел — "timeout"
+    - удачное подключение не закрывается: драйвер остаётся «тёплым», и окно агрегата
+      забирает его через take() — второго подключения при открытии нет
+    - тёплые подключения старше max_idle_s закрываются (агрегат мог их оборвать)
+    - агрегат уже открыт окном (hold()) — проверка, закончившаяся позже, своё
+      подключение закрывает: второе соединение к агрегату держать незачем
+    """
+
+    def __init__(
+        self,
+        budget_s: float = 2.0,
+        max_workers: int = 32,
+        max_idle_s: float = 60.0,
+        factory: Callable[[AssetConfig], BaseDriver] = make_driver,
+    ):
+        self.budget_s = float(budget_s)
+        self.max_idle_s = float(max_idle_s)
+        self.factory = factory
+        self.results: Dict[str, ProbeResult] = {}
+
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="health")
+        self._lock = threading.Lock()
+        self._warm: Dict[str, Tuple[BaseDriver, float]] = {}
+        self._busy: set = set()  # агрегаты, проверка которых ещё идёт (в т.ч. после бюджета)
+        self._held: set = set()  # агрегаты с открытым окном — у них своё подключение
+        self._closed = False
+
+    # ----------------- проверка -----------------
+    def _probe(self, a: AssetConfig) -> ProbeResult:
+        d = self.factory(a)
+        t = time.perf_counter()
+        try:
+            d.connect()
+        except Exception as e:
+            try:
+                d.close()
+            except Exception:
+                pass
+            return ProbeResult(a.id, False, error=str(e) or type(e).__name__, checked_at=time.time())
+        rtt = (time.perf_counter() - t) * 1e3
+        self._keep_warm(a.id, d)
+        return ProbeResult(a.id, True, rtt_ms=rtt, checked_at=time.time())
+
+    def _run_probe(self, a: AssetConfig) -> ProbeResult:
+        try:
+            return self._probe(a)
+        finally:
+            with self._lock:
+                self._busy.discard(a.id)
+
+    def check_all(
+        self,
+        assets: Iterable[AssetConfig],
+        on_result: Optional[Callable[[ProbeResult], None]] = None,
+        skip: Iterable[str] = (),
+    ) -> Dict[str, ProbeResult]:
+        """
+        Проверяет все агрегаты параллельно. on_result вызывается по мере готовности
+        (из этого потока). skip — агрегаты, которые сейчас открыты и опрашиваются.
+        """
+        skip = set(skip)
+        futures: Dict[Future, str] = {}
+        with self._lock:
+            for a in assets:
+                if a.type not in PROBE_TYPES or a.id in skip or a.id in self._busy:
+                    continue
+                # старое тёплое подключение не используем — проверяем заново
+                self._drop_warm(a.id)
+                self._busy.add(a.id)
+                futures[self._pool.submit(self._run_probe, a)] = a.id
+
+        out: Dict[str, ProbeResult] = {}
+        deadline = time.monotonic() + self.budget_s
+        pending = set(futures)
+        while pending:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            done, pending = wait(pending, timeout=left, return_when=FIRST_COMPLETED)
+            for f in done:
+                r = f.result()
+                out[r.asset_id] = r
+                if on_result is not None:
+                    on_result(r)
+
+        # не уложились в бюджет: для UI это «нет связи»; сам connect доработает в фоне
+        for f in pending:
+            r = ProbeResult(futures[f], False, error="timed out (health check budget)", checked_at=time.time())
+            out[r.asset_id] = r
+            if on_result is not None:
+                on_result(r)
+
+        self.results.update(out)
+        return out
+
+    # ----------------- тёплые подключения -----------------
+    def _keep_warm(self, asset_id: str, d: BaseDriver) -> None:
+        with self._lock:
+            if self._closed or asset_id in self._held:
+                d.close()
+                return
+            self._drop_warm(asset_id)
+            self._warm[asset_id] = (d, time.monotonic())
+
+    def _drop_warm(self, asset_id: str) -> None:
+        item = self._warm.pop(asset_id, None)
+        if item is not None:
+            try:
+                item[0].close()
+            except Exception:
+                pass
+
+    def hold(self, asset_id: str) -> None:
+        """Агрегат открыт окном: тёплое подключение закрыть, новых не держать."""
+        with self._lock:
+            self._held.add(asset_id)
+            self._drop_warm(asset_id)
+
+    def discard(self, asset_id: str) -> None:
+        """Закрывает тёплое подключение агрегата, если оно есть."""
+        with self._lock:
+            self._drop_warm(asset_id)
+
+    def take(self, asset_id: str) -> Optional[BaseDriver]:
+        """Подключённый драйвер после проверки (владение переходит вызывающему) или None."""
+        with self._lock:
+            item = self._warm.pop(asset_id, None)
+        if item is None:
+            return None
+        d, t = item
+        if time.monotonic() - t > self.max_idle_s or not d.is_connected():
+            try:
+                d.close()
+            except Exception:
+                pass
+            return None
+        return d
+
+    def expire(self) -> List[str]:
+        """Закрывает тёплые подключения старше max_idle_s."""
+        now = time.monotonic()
+        with self._lock:
+            old = [k for k, (_, t) in self._warm.items() if now - t > self.max_idle_s]
+            for k in old:
+                self._drop_warm(k)
+        return old
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for k in list(self._warm):
+                self._drop_warm(k)
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,195 @@
+"""
+Встроенная диагностика: гистограммы длительностей и счётчики по каждому агрегату.
+
+Задумано «всегда включено»: запись в гистограмму — целочисленный индекс корзины
+и инкремент в списке (без блокировок и выделений памяти), поэтому стоимость
+замера — доли микросекунды на фоне миллисекунд сети и отрисовки.
+
+Каждую гистограмму/счётчик пишет один поток (connect/read/parse — поток опроса,
+tick/redraw — GUI), читать снимок можно из любого потока: он может отстать
+на одно измерение, но не бывает «порванным».
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Корзины в стиле HDR: по SUB корзин на каждую степень двойки (значения в мкс).
+# Относительная ошибка <= 1/SUB (~3%), диапазон — от 1 мкс до ~1 часа.
+SUB_BITS = 5
+SUB = 1 << SUB_BITS
+MAX_US = 3_600_000_000
+_N_BUCKETS = (MAX_US.bit_length() - SUB_BITS + 1) * SUB
+
+HISTOGRAMS = ("connect", "read", "parse", "tick", "redraw")
+COUNTERS = (
+    "frames", "errors", "reconnects", "bytes_rx", "dropped", "missed_polls", "ticks", "missed_ticks",
+    "unrecorded",   # значения каналов, которых нет в столбцах текущей записи
+)
+
+
+def _index(us: int) -> int:
+    if us < SUB:
+        return us
+    shift = us.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB + (us >> shift) - SUB
+
+
+def _upper(i: int) -> int:
+    """Наибольшее значение (мкс), попадающее в корзину i."""
+    if i < SUB:
+        return i
+    shift = i // SUB - 1
+    return (((i % SUB) + SUB) << shift) + (1 << shift) - 1
+
+
+class Histogram:
+    """Гистограмма длительностей с логарифмическими корзинами (секунды на входе)."""
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self._counts: List[int] = [0] * _N_BUCKETS
+        self.reset()
+
+    def reset(self) -> None:
+        for i in range(_N_BUCKETS):
+            self._counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        us = int(seconds * 1e6)
+        if us < 0:
+            us = 0
+        elif us > MAX_US:
+            us = MAX_US
+        self._counts[_index(us)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """q-й перцентиль в секундах (верхняя граница корзины, не больше max)."""
+        n = self.count
+        if not n:
+            return float("nan")
+        rank = max(1, int(q / 100.0 * n + 0.5))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                return min(_upper(i) / 1e6, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Сводка в миллисекундах."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1e3,
+            "min_ms": self.min * 1e3,
+            "p50_ms": self.percentile(50) * 1e3,
+            "p90_ms": self.percentile(90) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+            "p999_ms": self.percentile(99.9) * 1e3,
+            "max_ms": self.max * 1e3,
+        }
+
+
+class AssetMetrics:
+    """Гистограммы (HISTOGRAMS) и счётчики (COUNTERS) одного агрегата."""
+
+    def __init__(self, asset_id: str):
+        self.asset_id = asset_id
+        self.hist: Dict[str, Histogram] = {name: Histogram() for name in HISTOGRAMS}
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.started = time.time()
+        self._rate_t = time.monotonic()
+        self._rate_frames = 0
+        self._rate_ticks = 0
+        self._rates = {"frames_per_s": 0.0, "ticks_per_s": 0.0}
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.hist[name].record(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.hist[name].record(time.perf_counter() - t)
+
+    def reset(self) -> None:
+        for h in self.hist.values():
+            h.reset()
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.started = time.time()
+        self._rate_t = time.monotonic()
+        self._rate_frames = self._rate_ticks = 0
+
+    def rates(self) -> Dict[str, float]:
+        """Кадров данных и кадров окна в секунду с прошлого вызова (не чаще раза в 0.5 с)."""
+        now = time.monotonic()
+        dt = now - self._rate_t
+        if dt >= 0.5:
+            frames, ticks = self.frames, self.ticks
+            self._rates = {
+                "frames_per_s": (frames - self._rate_frames) / dt,
+                "ticks_per_s": (ticks - self._rate_ticks) / dt,
+            }
+            self._rate_t, self._rate_frames, self._rate_ticks = now, frames, ticks
+        return dict(self._rates)
+
+    def snapshot(self) -> dict:
+        return {
+            "asset_id": self.asset_id,
+            "started": self.started,
+            "uptime_s": time.time() - self.started,
+            "counters": {name: getattr(self, name) for name in COUNTERS},
+            "rates": self.rates(),
+            "histograms": {name: h.summary() for name, h in self.hist.items()},
+        }
+
+
+# ----------------- реестр процесса -----------------
+_registry: Dict[str, AssetMetrics] = {}
+
+
+def for_asset(asset_id: str) -> AssetMetrics:
+    """Метрики агрегата (создаются при первом обращении, живут до конца процесса)."""
+    m = _registry.get(asset_id)
+    if m is None:
+        m = _registry[asset_id] = AssetMetrics(asset_id)
+    return m
+
+
+def snapshot_all() -> Dict[str, dict]:
+    return {k: m.snapshot() for k, m in list(_registry.items())}
+
+
+def export_json(path: str, asset_ids: Optional[List[str]] = None) -> str:
+    """Записывает снимок метрик (всех или выбранных агрегатов) в JSON."""
+    ids = asset_ids if asset_ids is not None else list(_registry)
+    data = {
+        "created": time.time(),
+        "assets": {k: _registry[k].snapshot() for k in ids if k in _registry},
+    }
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return path
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 @dataclass
@@ -7,3 +7,5 @@ class ReadResult:
     ok: bool
     values: Dict[str, float]
     error: Optional[str] = None
+    # текстовые значения (S7 STRING): в графики и запись не идут, только на экран
+    texts: Dict[str, str] = field(default_factory=dict)
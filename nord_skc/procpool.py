@@ -0,0 +1,379 @@
+"""
+Опрос агрегатов в отдельных процессах (app.acquisition_processes > 0).
+
+Разбор кадров и декодирование S7 на Python держат GIL — при высокой частоте
+и многих агрегатах они отнимают время у отрисовки Qt. Здесь агрегаты
+распределяются по N процессам опроса:
+
+- в процессе — тот же AcquisitionWorker (поток на агрегат, Reconnector, метрики),
+  только результаты пишутся не в очередь, а в ShmRing (nord_skc/shmring.py)
+- GUI создаёт и владеет блоками shared memory, читает их только на чтение
+  через ShmAcquisition — с тем же интерфейсом start/stop/drain, что у AcquisitionWorker
+- процесс упал или завис (нет heartbeat hang_s секунд) — он перезапускается
+  с паузой backoff, агрегаты группы открываются заново в тех же блоках,
+  окно получает ошибку «процесс опроса перезапущен» и продолжает работать
+
+Процессы запускаются через spawn (одинаково на Windows и Linux; fork после
+старта Qt-потоков небезопасен) и стартуют лениво — при первом открытом агрегате группы.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import signal
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from nord_skc.acquisition import AcquisitionWorker, Batch
+from nord_skc.config import AssetConfig
+from nord_skc.metrics import AssetMetrics
+from nord_skc.model import ReadResult
+from nord_skc.reconnect import Backoff
+from nord_skc.shmring import ShmRing
+from nord_skc.tsstore import TimeSeriesStore
+
+DEFAULT_MAX_CHANNELS = 64
+HEARTBEAT_S = 0.5
+
+
+def channel_layout(a: AssetConfig) -> Tuple[List[str], int]:
+    """
+    Раскладка каналов агрегата: известные заранее имена и число слотов.
+    S7 — теги из config.yaml, SERVA — field_names; остальное занимает
+    свободные слоты по мере появления (до extra.max_channels).
+    """
+    if a.type == "siemens_s7":
+        names = [str(k) for k in (a.extra.get("tags") or {})]
+    else:
+        names = [str(k) for k in (a.extra.get("field_names") or [])]
+    nslots = max(len(names), int(a.extra.get("max_channels", DEFAULT_MAX_CHANNELS)))
+    return names, nslots
+
+
+# ----------------- процесс опроса -----------------
+class _ShmWorker(AcquisitionWorker):
+    """AcquisitionWorker, который пишет результаты в ShmRing вместо очереди."""
+
+    def __init__(self, driver, poll_hz: float, ring: ShmRing, name: str):
+        super().__init__(driver, poll_hz, maxsize=1, name=name)
+        self.ring = ring
+        self._texts: Dict[str, str] = {}   # последние записанные в кольцо тексты
+        # после перезапуска процесса счётчики продолжаются, а не начинаются с нуля
+        c = ring.counters()
+        m = self.metrics
+        m.frames, m.errors, m.reconnects, m.missed_polls = (
+            c["frames"], c["errors"], c["reconnects"], c["missed_polls"]
+        )
+
+    def _put(self, item: Tuple[float, ReadResult]) -> None:
+        ts, rr = item
+        if rr.ok:
+            if rr.values:
+                self.ring.write(ts, rr.values)
+        else:
+            self.ring.write_error(ts, rr.error or "")
+        # тексты S7 STRING — только последние значения, и только когда изменились
+        if rr.texts and rr.texts != self._texts:
+            self._texts = dict(rr.texts)
+            self.ring.write_texts(ts, self._texts)
+        m = self.metrics
+        self.ring.set_counters(m.frames, m.errors, m.reconnects, m.missed_polls)
+
+
+def _process_main(cmd_q, heartbeat, stop_evt) -> None:
+    """Точка входа процесса опроса: команды ("open", asset, shm, poll_hz) / ("close", id) / ("stop",)."""
+    # Ctrl+C в консоли получает вся группа процессов — останавливает нас только GUI
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from nord_skc.drivers.factory import make_driver
+
+    workers: Dict[str, Tuple[_ShmWorker, ShmRing]] = {}
+
+    def close(asset_id: str) -> None:
+        item = workers.pop(asset_id, None)
+        if item is not None:
+            item[0].stop(timeout=2.0)
+            item[1].close()
+
+    try:
+        while not stop_evt.is_set():
+            heartbeat.value = time.time()
+            try:
+                cmd = cmd_q.get(timeout=HEARTBEAT_S)
+            except queue.Empty:
+                continue
+            if cmd[0] == "stop":
+                break
+            if cmd[0] == "close":
+                close(cmd[1])
+            elif cmd[0] == "open":
+                a, shm_name, poll_hz = cmd[1], cmd[2], cmd[3]
+                close(a.id)
+                try:
+                    ring = ShmRing.attach(shm_name)
+                except (OSError, ValueError):
+                    continue  # GUI уже закрыл агрегат и удалил блок
+                try:
+                    w = _ShmWorker(make_driver(a), poll_hz, ring, name=a.id)
+                except Exception as e:
+                    ring.write_error(time.time(), str(e) or type(e).__name__)
+                    ring.close()
+                    continue
+                workers[a.id] = (w, ring)
+                w.start()
+    finally:
+        for k in list(workers):
+            close(k)
+
+
+# ----------------- сторона GUI -----------------
+class ShmAcquisition:
+    """
+    Чтение одного агрегата из процесса опроса. Интерфейс — как у AcquisitionWorker:
+    start()/stop()/drain(); drain() отдаёт новые точки и ошибки, кладёт точки в store.
+    """
+
+    def __init__(
+        self,
+        pool: "AcquisitionPool",
+        asset: AssetConfig,
+        poll_hz: float,
+        ring: ShmRing,
+        metrics: Optional[AssetMetrics] = None,
+        store: Optional[TimeSeriesStore] = None,
+    ):
+        self.pool = pool
+        self.asset = asset
+        self.name = asset.id
+        self.poll_hz = float(poll_hz)
+        self.ring = ring
+        self.metrics = metrics if metrics is not None else AssetMetrics(asset.id)
+        self.series = store.series(asset.id) if store is not None else None
+        self.dropped: int = 0
+
+        self._seq = ring.seq
+        self._err_seq = 0
+        self._text_seq = 0
+        self._notes: List[Tuple[float, ReadResult]] = []  # сообщения пула (перезапуск процесса)
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self) -> None:
+        if not self._running:
+            self._running = True
+            self.pool._open(self)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        if self._running:
+            self._running = False
+            self.pool._close(self)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _note(self, text: str) -> None:
+        with self._lock:
+            self._notes.append((time.time(), ReadResult(ok=False, values={}, error=text)))
+
+    def drain(self) -> Batch:
+        ring = self.ring
+        if ring.closed or not self._running:
+            return []
+        seq, lost, ts, data = ring.read_since(self._seq)
+        self._seq = seq
+        out: Batch = []
+        if len(ts):
+            names = ring.channels
+            n = min(len(names), data.shape[0])
+            have = (~np.isnan(data[:n])).tolist()
+            vals = data[:n].tolist()
+            series = self.series
+            for j, t in enumerate(ts.tolist()):
+                values = {names[r]: vals[r][j] for r in range(n) if have[r][j]}
+                if series is not None and values:
+                    series.append(t, values)
+                out.append((t, ReadResult(ok=True, values=values)))
+
+        self._text_seq, texts = ring.read_texts(self._text_seq)
+        if texts is not None:
+            if out:
+                out[-1][1].texts = texts[1]
+            else:
+                out.append((texts[0], ReadResult(ok=True, values={}, texts=texts[1])))
+
+        self._err_seq, err = ring.read_error(self._err_seq)
+        if err is not None:
+            out.append((err[0], ReadResult(ok=False, values={}, error=err[1])))
+        with self._lock:
+            if self._notes:
+                out.extend(self._notes)
+                self._notes = []
+
+        m = self.metrics
+        if lost:
+            self.dropped += lost
+            m.dropped += lost
+        c = ring.counters()
+        m.frames, m.errors, m.reconnects, m.missed_polls = (
+            c["frames"], c["errors"], c["reconnects"], c["missed_polls"]
+        )
+        # ошибки и сообщения пула — по времени среди точек: последним идёт самое свежее
+        if len(out) > len(ts):
+            out.sort(key=lambda item: item[0])
+        return out
+
+
+class _Group:
+    """Один процесс опроса и открытые в нём агрегаты."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.proc: Optional[mp.Process] = None
+        self.cmd_q = None
+        self.heartbeat = None
+        self.stop_evt = None
+        self.started_at = 0.0
+        self.restart_at = 0.0
+        self.backoff = Backoff(base_s=0.5, cap_s=30.0)
+        self.readers: Dict[str, ShmAcquisition] = {}
+
+
+class AcquisitionPool:
+    """
+    N процессов опроса. Агрегат попадает в наименее загруженную группу
+    и остаётся в ней до stop(). Следит за процессами фоновый поток (монитор).
+    """
+
+    def __init__(self, processes: int, hang_s: float = 10.0, capacity_s: float = 10.0):
+        self.hang_s = float(hang_s)
+        self.capacity_s = float(capacity_s)   # запас кольца: столько секунд без drain() без потерь
+        self._ctx = mp.get_context("spawn")
+        self._groups = [_Group(i) for i in range(max(1, int(processes)))]
+        self._where: Dict[str, _Group] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    # ----------------- агрегаты -----------------
+    def open(
+        self,
+        asset: AssetConfig,
+        poll_hz: float,
+        metrics: Optional[AssetMetrics] = None,
+        store: Optional[TimeSeriesStore] = None,
+    ) -> ShmAcquisition:
+        """Читатель агрегата (ещё не запущен: опрос начнётся с start())."""
+        names, nslots = channel_layout(asset)
+        # потоковый SERVA шлёт чаще poll_hz — запас по кольцу не меньше 4096 точек
+        capacity = max(4096, int(self.capacity_s * float(poll_hz)))
+        ring = ShmRing.create(capacity, nslots, names)
+        return ShmAcquisition(self, asset, poll_hz, ring, metrics=metrics, store=store)
+
+    def _open(self, r: ShmAcquisition) -> None:
+        with self._lock:
+            g = min(self._groups, key=lambda g: len(g.readers))
+            g.readers[r.name] = r
+            self._where[r.name] = g
+            if g.proc is None:
+                self._spawn(g)
+            else:
+                g.cmd_q.put(("open", r.asset, r.ring.name, r.poll_hz))
+            self._ensure_monitor()
+
+    def _close(self, r: ShmAcquisition) -> None:
+        with self._lock:
+            g = self._where.pop(r.name, None)
+            if g is not None:
+                g.readers.pop(r.name, None)
+                if g.proc is not None and g.proc.is_alive():
+                    g.cmd_q.put(("close", r.name))
+        # у процесса опроса остаётся своё отображение — удалить имя блока можно сразу
+        r.ring.close()
+
+    # ----------------- процессы -----------------
+    def _spawn(self, g: _Group) -> None:
+        # очередь — новая: упавший процесс мог оставить старую в неконсистентном состоянии
+        g.cmd_q = self._ctx.Queue()
+        g.heartbeat = self._ctx.Value("d", time.time(), lock=False)
+        g.stop_evt = self._ctx.Event()
+        g.proc = self._ctx.Process(
+            target=_process_main,
+            args=(g.cmd_q, g.heartbeat, g.stop_evt),
+            name=f"nskc-acq-{g.index}",
+            daemon=True,
+        )
+        g.proc.start()
+        g.started_at = time.monotonic()
+        g.heartbeat.value = time.time()
+        for r in g.readers.values():
+            g.cmd_q.put(("open", r.asset, r.ring.name, r.poll_hz))
+
+    def _ensure_monitor(self) -> None:
+        if self._monitor is None:
+            self._monitor = threading.Thread(target=self._watch, name="acq-pool-monitor", daemon=True)
+            self._monitor.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(HEARTBEAT_S):
+            with self._lock:
+                for g in self._groups:
+                    self._check(g)
+
+    def _check(self, g: _Group) -> None:
+        now = time.monotonic()
+        if g.proc is None:
+            # ждём паузу перед перезапуском (только если в группе есть агрегаты)
+            if g.readers and g.restart_at and now >= g.restart_at:
+                g.restart_at = 0.0
+                self._spawn(g)
+            return
+
+        if g.proc.is_alive():
+            if time.time() - g.heartbeat.value < self.hang_s:
+                # проработал дольше максимальной паузы — следующий сбой снова с короткой паузы
+                if now - g.started_at > g.backoff.cap_s:
+                    g.backoff.reset()
+                return
+            # завис (GIL занят C-кодом драйвера / deadlock) — снимаем
+            g.proc.terminate()
+            g.proc.join(1.0)
+            if g.proc.is_alive():
+                g.proc.kill()
+                g.proc.join(1.0)
+            reason = f"acquisition process not responding for {self.hang_s:.0f} s"
+        else:
+            reason = f"acquisition process exited (code {g.proc.exitcode})"
+
+        g.proc = None
+        delay = g.backoff.next_delay()
+        g.restart_at = now + delay
+        for r in g.readers.values():
+            r._note(f"{reason}, restart in {delay:.1f} s")
+
+    def shutdown(self, timeout: float = 3.0) -> None:
+        """Останавливает все процессы (драйверы закрываются в них) и удаляет блоки."""
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout)
+            self._monitor = None
+        with self._lock:
+            for g in self._groups:
+                if g.proc is not None:
+                    g.stop_evt.set()
+                    g.cmd_q.put(("stop",))
+            deadline = time.monotonic() + timeout
+            for g in self._groups:
+                p = g.proc
+                if p is not None:
+                    p.join(max(0.0, deadline - time.monotonic()))
+                    if p.is_alive():
+                        p.terminate()
+                        p.join(1.0)
+                    g.proc = None
+                for r in list(g.readers.values()):
+                    r._running = False
+                    r.ring.close()
+                g.readers.clear()
+            self._where.clear()
@@ -0,0 +1,287 @@
+"""
+Бинарный столбцовый формат записи сессии (.nskc), little-endian:
+
+    b"NSKCREC1"                       8 байт
+    u32 длина заголовка + JSON        {"version", "channels", "dtype", "created", "meta"}
+    выравнивание до 8 байт
+    чанки:
+      b"CHNK" + u32 n                 8 байт
+      float64 ts[n]
+      dtype   data[n_channels][n]     по каналам подряд (каждый канал — непрерывный блок)
+      выравнивание до 8 байт
+
+Чанк пишется целиком одной операцией; недописанный последний чанк
+(падение во время записи) читатель просто не видит, truncate_partial() его отрезает.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAGIC = b"NSKCREC1"
+CHUNK_MAGIC = b"CHNK"
+EXT = ".nskc"
+VERSION = 1
+
+_U32 = struct.Struct("<I")
+_CHUNK_HDR = struct.Struct("<4sI")
+
+
+def _pad8(n: int) -> int:
+    return (-n) % 8
+
+
+@dataclass
+class _Chunk:
+    n: int
+    ts_off: int
+    data_off: int
+    t_first: float
+    t_last: float
+
+
+class RecFileWriter:
+    """Запись .nskc чанками. Набор каналов фиксируется в заголовке."""
+
+    def __init__(
+        self,
+        path: str,
+        channels: Sequence[str],
+        dtype: str = "float64",
+        meta: Optional[dict] = None,
+    ):
+        self.path = path
+        self.channels = list(channels)
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        if self.dtype.kind != "f":
+            raise ValueError(f"Unsupported channel dtype: {dtype}")
+
+        header = json.dumps(
+            {
+                "version": VERSION,
+                "channels": self.channels,
+                "dtype": self.dtype.name,
+                "created": time.time(),
+                "meta": meta or {},
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        self._f = open(path, "wb")
+        head = MAGIC + _U32.pack(len(header)) + header
+        self._f.write(head + b"\0" * _pad8(len(head)))
+        self._f.flush()
+
+    def write_chunk(self, ts: np.ndarray, data: np.ndarray) -> None:
+        """ts: (n,), data: (n_channels, n)."""
+        ts = np.ascontiguousarray(ts, dtype="<f8")
+        data = np.ascontiguousarray(data, dtype=self.dtype)
+        n = len(ts)
+        if n == 0:
+            return
+        if data.shape != (len(self.channels), n):
+            raise ValueError(f"chunk shape {data.shape} != {(len(self.channels), n)}")
+
+        body = data.tobytes()
+        buf = _CHUNK_HDR.pack(CHUNK_MAGIC, n) + ts.tobytes() + body + b"\0" * _pad8(len(body))
+        self._f.write(buf)
+        self._f.flush()
+
+    def write_rows(self, rows: Sequence[Tuple[float, Dict[str, float]]]) -> None:
+        """Чанк из точек вида (ts, {канал: значение}); отсутствующие каналы — NaN."""
+        n = len(rows)
+        if not n:
+            return
+        ts = np.fromiter((r[0] for r in rows), dtype=np.float64, count=n)
+        data = np.full((len(self.channels), n), np.nan, dtype=self.dtype)
+        for ci, name in enumerate(self.channels):
+            data[ci] = [vals.get(name, np.nan) for _, vals in rows]
+        self.write_chunk(ts, data)
+
+    def fileno(self) -> int:
+        return self._f.fileno()
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class RecFileReader:
+    """
+    Чтение .nskc через mmap: данные не копируются, range()/chunks() отдают
+    NumPy views прямо в отображённый файл.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        size = os.fstat(self._f.fileno()).st_size
+        if size < len(MAGIC) + _U32.size:
+            self._f.close()
+            raise ValueError(f"not a recording: {path}")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._f.close()
+            raise
+        self._buf = memoryview(self._mm)
+        try:
+            if self._buf[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"not a recording: {path}")
+            (hlen,) = _U32.unpack_from(self._buf, len(MAGIC))
+            pos = len(MAGIC) + _U32.size
+            header = json.loads(bytes(self._buf[pos: pos + hlen]).decode("utf-8"))
+            pos += hlen
+            pos += _pad8(pos)
+
+            self.header = header
+            self.channels: List[str] = list(header["channels"])
+            self.dtype = np.dtype(header["dtype"]).newbyteorder("<")
+            self.index: Dict[str, int] = {c: i for i, c in enumerate(self.channels)}
+
+            self._chunks: List[_Chunk] = []
+            self.valid_size = self._scan(pos, size)
+        except BaseException:
+            # битый заголовок: mmap и файл не должны остаться открытыми
+            self.close()
+            raise
+
+    def _scan(self, pos: int, size: int) -> int:
+        n_ch = len(self.channels)
+        item = self.dtype.itemsize
+        while pos + _CHUNK_HDR.size <= size:
+            magic, n = _CHUNK_HDR.unpack_from(self._buf, pos)
+            if magic != CHUNK_MAGIC:
+                break
+            ts_off = pos + _CHUNK_HDR.size
+            data_off = ts_off + 8 * n
+            body = n_ch * n * item
+            end = data_off + body + _pad8(body)
+            if end > size:
+                break  # недописанный чанк
+            ts = np.frombuffer(self._buf, dtype="<f8", count=n, offset=ts_off)
+            self._chunks.append(_Chunk(n, ts_off, data_off, float(ts[0]), float(ts[-1])))
+            pos = end
+        return pos
+
+    # ----------------- чтение -----------------
+    def __len__(self) -> int:
+        return sum(c.n for c in self._chunks)
+
+    def time_span(self) -> Tuple[float, float]:
+        if not self._chunks:
+            return (float("nan"), float("nan"))
+        return (self._chunks[0].t_first, self._chunks[-1].t_last)
+
+    def _views(self, c: _Chunk) -> Tuple[np.ndarray, np.ndarray]:
+        ts = np.frombuffer(self._buf, dtype="<f8", count=c.n, offset=c.ts_off)
+        data = np.frombuffer(
+            self._buf, dtype=self.dtype, count=c.n * len(self.channels), offset=c.data_off
+        ).reshape(len(self.channels), c.n)
+        return ts, data
+
+    def chunks(
+        self, t0: Optional[float] = None, t1: Optional[float] = None
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Чанки (ts, data[n_channels, n]) в диапазоне [t0, t1] — views без копий."""
+        for c in self._chunks:
+            if t0 is not None and c.t_last < t0:
+                continue
+            if t1 is not None and c.t_first > t1:
+                break
+            ts, data = self._views(c)
+            i0 = 0 if t0 is None else int(np.searchsorted(ts, t0, side="left"))
+            i1 = c.n if t1 is None else int(np.searchsorted(ts, t1, side="right"))
+            if i1 > i0:
+                yield ts[i0:i1], data[:, i0:i1]
+
+    def range(
+        self,
+        t0: Optional[float] = None,
+        t1: Optional[float] = None,
+        channels: Optional[Sequence[str]] = None,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Время и каналы за [t0, t1]. Если диапазон внутри одного чанка — views,
+        иначе чанки склеиваются (одна копия).
+        """
+        names = list(channels) if channels is not None else self.channels
+        parts = list(self.chunks(t0, t1))
+        if not parts:
+            return np.empty(0), {k: np.empty(0, dtype=self.dtype) for k in names}
+        if len(parts) == 1:
+            ts, data = parts[0]
+            return ts, {k: data[self.index[k]] for k in names}
+        ts = np.concatenate([p[0] for p in parts])
+        return ts, {k: np.concatenate([p[1][self.index[k]] for p in parts]) for k in names}
+
+    def close(self) -> None:
+        try:
+            self._buf.release()
+            self._mm.close()
+        except (BufferError, ValueError):
+            # на файл ещё смотрят views — mmap закроется сборщиком мусора
+            pass
+        self._f.close()
+
+    def __enter__(self) -> "RecFileReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def to_csv(src: str, dst: Optional[str] = None) -> str:
+    """
+    Конвертирует .nskc в CSV того же вида, что пишет запись в CSV
+    (ts с точностью 0.001 + каналы, пропуски — пустые ячейки).
+    """
+    if dst is None:
+        dst = (src[: -len(EXT)] if src.endswith(EXT) else src) + ".csv"
+
+    with RecFileReader(src) as r, open(dst, "w", newline="", encoding="utf-8") as f:
+        f.write(",".join(["ts"] + r.channels) + "\r\n")
+        # float64 — кратчайший repr (как str() в csv.writer), float32 — 7 значащих цифр
+        row_fmt = None if r.dtype.itemsize == 8 else ",".join(["%.7g"] * len(r.channels))
+        for ts, data in r.chunks():
+            rows = data.T.tolist()
+            if row_fmt is None:
+                lines = ["%.3f,%s" % (t, ",".join(map(repr, row))) for t, row in zip(ts.tolist(), rows)]
+            else:
+                lines = ["%.3f,%s" % (t, row_fmt % tuple(row)) for t, row in zip(ts.tolist(), rows)]
+            f.write(("\r\n".join(lines) + "\r\n").replace("nan", ""))
+    return dst
+
+
+def truncate_partial(path: str) -> int:
+    """Отрезает недописанный последний чанк (после падения). Возвращает новый размер."""
+    with RecFileReader(path) as r:
+        valid = r.valid_size
+    if valid < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(valid)
+    return valid
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """python -m nord_skc.recfile file.nskc [out.csv] — конвертация записи в CSV."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv:
+        print("usage: python -m nord_skc.recfile <file.nskc> [out.csv]")
+        return 2
+    print(to_csv(argv[0], argv[1] if len(argv) > 1 else None))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+"""
+Классификация ошибок связи и переподключение с экспоненциальной паузой.
+
+Модуль без Qt: им пользуются поток опроса (AcquisitionWorker), FleetPoller
+и тексты ошибок для оператора (ui/errors.py).
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, Optional
+
+# ошибки, после которых соединению верить нельзя — закрываем и подключаемся заново
+LINK_ERRORS = ("timeout", "reset", "refused", "unreachable", "closed")
+# конец данных (replay без loop): не ошибка связи — не переподключаемся и не ждём
+END_OF_STREAM = "end of recording"
+
+
+def classify_error(text: str) -> str:
+    """
+    Грубая классификация текста ошибки:
+    timeout | reset | refused | unreachable | closed | protocol | end | other.
+    """
+    s = (text or "").lower()
+
+    # источник кончился (replay без loop) — окончательно
+    if END_OF_STREAM in s or "end of stream" in s:
+        return "end"
+
+    # timeout / нет ответа (Windows: WinError 10060)
+    if "timed out" in s or "timeout" in s or "10060" in s or "errno 110]" in s:
+        return "timeout"
+
+    # Windows: удалённый хост принудительно разорвал (WinError 10054)
+    if "10054" in s or "forcibly closed" in s or "connection reset" in s:
+        return "reset"
+
+    # отказ в подключении (порт закрыт / сервис не запущен)
+    # (asyncio на Linux: "[Errno 111] Connect call failed")
+    if "refused" in s or "10061" in s or "errno 111]" in s:
+        return "refused"
+
+    # нет маршрута / сеть недоступна / unreachable peer
+    if "unreachable" in s or "no route" in s or "errno 101]" in s or "errno 113]" in s:
+        return "unreachable"
+
+    # соединения нет или оно закрыто с той стороны
+    if (
+        "not connected" in s
+        or "closed" in s
+        or "broken pipe" in s
+        or "10053" in s
+        or "bad file descriptor" in s
+    ):
+        return "closed"
+
+    # связь есть, но ответ не разобрать (агрегат жив)
+    if "bad reply" in s or "cannot parse" in s or "unexpected float count" in s or "empty reply" in s:
+        return "protocol"
+
+    return "other"
+
+
+class Backoff:
+    """
+    Экспоненциальная пауза с джиттером: base, 2·base, 4·base … до cap,
+    каждая пауза случайна в [d/2, d] — агрегаты за одним роутером
+    не переподключаются одновременно.
+    """
+
+    def __init__(
+        self,
+        base_s: float = 0.5,
+        cap_s: float = 30.0,
+        factor: float = 2.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.base_s = float(base_s)
+        self.cap_s = float(cap_s)
+        self.factor = float(factor)
+        self.attempt = 0
+        self._rng = rng or random.Random()
+
+    def reset(self) -> None:
+        self.attempt = 0
+
+    def next_delay(self) -> float:
+        d = min(self.cap_s, self.base_s * self.factor ** self.attempt)
+        self.attempt += 1
+        return d / 2 + self._rng.uniform(0, d / 2)
+
+
+class Reconnector:
+    """
+    Состояние связи одного агрегата.
+
+      connected --ошибка связи / max_soft_errors прочих подряд--> down
+      down --пауза backoff--> due() --connect ok--> connected
+                                    --connect fail--> down (пауза длиннее)
+      connected --конец данных (kind "end")--> finished: больше не читаем и не подключаемся
+
+    Пауза сбрасывается только удачным чтением, не подключением: агрегат, который
+    принимает соединение и сразу его рвёт, переподключается с нарастающей паузой,
+    а не в цикле. Сразу (без паузы) переподключаемся только после обрыва связи,
+    которая уже отдавала данные.
+
+    Сам ничего не подключает: опросчик спрашивает due()/wait_s() и сообщает
+    результаты через on_read()/on_connect(). Так одна машина состояний работает
+    и в потоке опроса, и в asyncio.
+    """
+
+    def __init__(
+        self,
+        backoff: Optional[Backoff] = None,
+        max_soft_errors: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backoff = backoff or Backoff()
+        self.max_soft_errors = max(1, int(max_soft_errors))
+        self._clock = clock
+
+        self.connected = False
+        self.next_attempt = 0.0      # по clock(): когда можно пробовать подключиться
+        self.soft_errors = 0         # прочие ошибки подряд при живом соединении
+        self.proven = False          # с последнего подключения было хоть одно удачное чтение
+        self.finished = False        # источник кончился — опрос больше не нужен
+        self.last_error: Optional[str] = None
+        self.last_kind: Optional[str] = None
+
+    # ----------------- подключение -----------------
+    def due(self) -> bool:
+        return not self.connected and not self.finished and self._clock() >= self.next_attempt
+
+    def wait_s(self) -> float:
+        """Сколько ждать до следующей попытки подключения (0 — можно сейчас)."""
+        if self.connected:
+            return 0.0
+        return max(0.0, self.next_attempt - self._clock())
+
+    def on_connect(self, error: Optional[str] = None) -> None:
+        """Итог попытки подключения: error=None — успех."""
+        if error is None:
+            self.connected = True
+            self.soft_errors = 0
+            self.proven = False
+            return
+        self.connected = False
+        self.last_error = error
+        self.last_kind = classify_error(error)
+        self.next_attempt = self._clock() + self.backoff.next_delay()
+
+    # ----------------- чтение -----------------
+    def on_read(self, ok: bool, error: Optional[str] = None) -> bool:
+        """
+        Итог чтения. Возвращает True, если соединение надо закрыть
+        (дальше — переподключение после паузы). Конец данных соединение
+        не закрывает: ставит finished, опросчик перестаёт читать.
+        """
+        if ok:
+            self.soft_errors = 0
+            if not self.proven:
+                self.proven = True
+                self.backoff.reset()
+            return False
+        self.last_error = error
+        self.last_kind = kind = classify_error(error or "")
+        if kind == "end":
+            self.finished = True
+            self.soft_errors = 0
+            return False
+        if kind in LINK_ERRORS:
+            self._down()
+            return True
+        self.soft_errors += 1
+        if self.soft_errors >= self.max_soft_errors:
+            self._down()
+            return True
+        return False
+
+    def _down(self) -> None:
+        self.connected = False
+        self.soft_errors = 0
+        if self.proven:
+            # связь работала — первая попытка сразу: часто это разовый обрыв
+            self.next_attempt = self._clock()
+        else:
+            # подключились, но не прочитали ничего — дальше только с паузой
+            self.next_attempt = self._clock() + self.backoff.next_delay()
+        self.proven = False
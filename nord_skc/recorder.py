@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import csv
+import os
+import queue
+import threading
+import time
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+
+PART_SUFFIX = ".part"
+# <файл>.part.lock: заблокирован, пока запись идёт (GUI и collector могут писать в одну папку)
+LOCK_SUFFIX = ".lock"
+FORMATS = ("csv", "nskc")
+
+
+def _try_lock(path: str) -> Optional[IO[bytes]]:
+    """Открывает файл-замок и берёт блокировку без ожидания. None — её держит другой процесс."""
+    f = open(path, "a+b")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+def _unlock(f: IO[bytes], path: str) -> None:
+    # закрытие снимает блокировку; удалить можно только закрытый (Windows)
+    f.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _CsvSink:
+    def __init__(self, path: str, columns: List[str]):
+        self.columns = columns
+        self._f = open(path, "w", newline="", encoding="utf-8")
+        self._w = csv.writer(self._f)
+        self._w.writerow(["ts"] + columns)
+
+    def write_rows(self, rows: List[Tuple[float, Dict[str, float]]]) -> None:
+        cols = self.columns
+        self._w.writerows([f"{ts:.3f}"] + [vals.get(k, "") for k in cols] for ts, vals in rows)
+        self._f.flush()
+
+    def fileno(self) -> int:
+        return self._f.fileno()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def _open_sink(fmt: str, path: str, columns: List[str]):
+    if fmt == "csv":
+        return _CsvSink(path, columns)
+    if fmt == "nskc":
+        from nord_skc.recfile import RecFileWriter
+        return RecFileWriter(path, columns)
+    raise ValueError(f"Unknown record format: {fmt}")
+
+
+class SessionRecorder:
+    """
+    Потоковая запись сессии в файл: CSV (ts + каналы) или бинарный .nskc (recfile.py).
+
+    - append() только кладёт точку в очередь — не блокирует ни GUI, ни опрос
+    - фоновый поток пишет пачками в <path>.part, fsync не реже чем раз в fsync_s
+    - finalize() дописывает хвост и переименовывает .part -> <path>
+    После падения .part — валидный CSV до последней целой строки, см. recover_partial().
+    Пока запись жива, процесс держит блокировку <path>.part.lock — recover_all()
+    другого процесса такой .part не тронет.
+
+    Набор столбцов фиксируется при создании (обычно по первой точке сессии):
+    каналы, появившиеся позже, в файл не попадают — но не молча: их имена
+    копятся в dropped_keys, число потерянных значений — в metrics.unrecorded.
+    Кому важны все каналы, начинает новый файл (см. AssetRecorder в collector.py).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: List[str],
+        batch_size: int = 256,
+        flush_s: float = 0.5,
+        fsync_s: float = 2.0,
+        fmt: str = "csv",
+        metrics: Any = None,
+    ):
+        self.path = path
+        self.part_path = path + PART_SUFFIX
+        self.columns = list(columns)
+        self._colset = frozenset(self.columns)
+        self.metrics = metrics            # nord_skc.metrics.AssetMetrics или None
+        self.dropped_keys: Set[str] = set()
+        self.batch_size = max(1, int(batch_size))
+        self.flush_s = float(flush_s)
+        self.fsync_s = float(fsync_s)
+
+        self.count: int = 0
+        self.error: Optional[str] = None
+
+        self._q: "queue.Queue[Optional[Tuple[float, Dict[str, float]]]]" = queue.Queue()
+        self._closed = False     # append() больше не принимает точки
+        self._finished = False   # поток остановлен, файл закрыт
+
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self.fmt = fmt
+        self._lock_path = self.part_path + LOCK_SUFFIX
+        lock = _try_lock(self._lock_path)
+        if lock is None:
+            raise OSError(f"recording in use: {self.part_path}")
+        self._lock: Optional[IO[bytes]] = lock
+        try:
+            self._sink = _open_sink(fmt, self.part_path, self.columns)
+        except BaseException:
+            self._release()
+            raise
+
+        self._thread = threading.Thread(target=self._run, name=f"rec-{os.path.basename(path)}", daemon=True)
+        self._thread.start()
+
+    # ----------------- API -----------------
+    def append(self, ts: float, values: Dict[str, float]) -> None:
+        if self._closed:
+            return
+        if not self._colset.issuperset(values):
+            extra = values.keys() - self._colset
+            self.dropped_keys |= extra
+            if self.metrics is not None:
+                self.metrics.unrecorded += len(extra)
+        self.count += 1
+        self._q.put((ts, values))
+
+    def finalize(self) -> str:
+        """Дописывает всё из очереди, fsync, переименовывает .part в итоговый файл."""
+        try:
+            self._shutdown()
+            os.replace(self.part_path, self.path)
+        finally:
+            # при ошибке .part остаётся — его подберёт recover_all()
+            self._release()
+        return self.path
+
+    def discard(self) -> None:
+        """Останавливает запись и удаляет незавершённый файл."""
+        try:
+            self._shutdown()
+            try:
+                os.remove(self.part_path)
+            except OSError:
+                pass
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        if self._lock is not None:
+            _unlock(self._lock, self._lock_path)
+            self._lock = None
+
+    # ----------------- фоновая запись -----------------
+    def _shutdown(self) -> None:
+        if not self._finished:
+            self._finished = True
+            self._closed = True
+            self._q.put(None)
+            self._thread.join()
+            self._sink.close()
+        if self.error:
+            raise OSError(self.error)
+
+    def _sync(self) -> None:
+        os.fsync(self._sink.fileno())
+
+    def _run(self) -> None:
+        last_sync = time.monotonic()
+        done = False
+        while not done:
+            rows: List[Tuple[float, Dict[str, float]]] = []
+            try:
+                item = self._q.get(timeout=self.flush_s)
+                while True:
+                    if item is None:
+                        done = True
+                        break
+                    rows.append(item)
+                    if len(rows) >= self.batch_size:
+                        break
+                    item = self._q.get_nowait()
+            except queue.Empty:
+                pass
+
+            try:
+                if rows:
+                    self._sink.write_rows(rows)
+                if done or time.monotonic() - last_sync >= self.fsync_s:
+                    self._sync()
+                    last_sync = time.monotonic()
+            except Exception as e:
+                # диск полон / нет прав: запоминаем, сообщим при finalize()
+                self.error = str(e)
+                self._closed = True
+                return
+
+
+def recover_partial(part_path: str) -> str:
+    """
+    Восстанавливает файл, оставшийся после падения: отрезает недописанную
+    последнюю строку (CSV) или чанк (.nskc) и переименовывает .part -> итоговое имя.
+    """
+    final = part_path[: -len(PART_SUFFIX)] if part_path.endswith(PART_SUFFIX) else part_path
+    if final.endswith(".nskc"):
+        from nord_skc.recfile import truncate_partial
+        try:
+            truncate_partial(part_path)
+        except ValueError:
+            # не успели записать даже заголовок — восстанавливать нечего
+            os.remove(part_path)
+            raise OSError(f"empty recording: {part_path}")
+        os.replace(part_path, final)
+        return final
+
+    with open(part_path, "r+b") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+    os.replace(part_path, final)
+    return final
+
+
+def recover_all(directory: str = "records") -> List[str]:
+    """
+    Восстанавливает незавершённые записи в папке (вызывается при старте).
+    .part, чью блокировку держит живой процесс (окно агрегата, collector), пропускается.
+    """
+    out: List[str] = []
+    if not os.path.isdir(directory):
+        return out
+    names = sorted(os.listdir(directory))
+    for name in names:
+        path = os.path.join(directory, name)
+        if name.endswith(PART_SUFFIX):
+            lock = _try_lock(path + LOCK_SUFFIX)
+            if lock is None:
+                continue  # запись идёт прямо сейчас
+            try:
+                out.append(recover_partial(path))
+            except OSError:
+                pass
+            finally:
+                _unlock(lock, path + LOCK_SUFFIX)
+        elif name.endswith(PART_SUFFIX + LOCK_SUFFIX) and name[: -len(LOCK_SUFFIX)] not in names:
+            # замок без .part: процесс упал между finalize и удалением замка
+            lock = _try_lock(path)
+            if lock is not None:
+                _unlock(lock, path)
+    return out
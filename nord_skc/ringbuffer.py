@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер истории на NumPy: общий столбец времени + по строке на канал.
+
+    Память выделяется один раз и удвоена (2 × capacity): каждая точка пишется
+    по двум адресам (i и i + capacity), поэтому последние n точек всегда лежат
+    непрерывно и отдаются как view — без копий и без Python-объектов на точку.
+    Каналы можно добавлять на лету; для точек до появления канала — NaN.
+    """
+
+    def __init__(self, capacity: int, channels: Iterable[str] = (), dtype=np.float64):
+        self.capacity = max(1, int(capacity))
+        self.dtype = np.dtype(dtype)
+
+        self.channels: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        self._ts = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._data = np.full((0, 2 * self.capacity), np.nan, dtype=self.dtype)
+        self._pos = 0    # куда пишем следующую точку, [0, capacity)
+        self._count = 0  # сколько точек реально есть, <= capacity
+
+        for name in channels:
+            self.add_channel(name)
+
+    # ----------------- каналы -----------------
+    def add_channel(self, name: str) -> int:
+        if name in self.index:
+            return self.index[name]
+        row = np.full((1, 2 * self.capacity), np.nan, dtype=self.dtype)
+        self._data = np.vstack([self._data, row])
+        self.index[name] = len(self.channels)
+        self.channels.append(name)
+        return self.index[name]
+
+    # ----------------- запись -----------------
+    def append(self, ts: float, values: Mapping[str, float]) -> None:
+        """Добавляет точку. Каналы, которых нет в values, получают NaN."""
+        i = self._pos
+        j = i + self.capacity
+
+        self._ts[i] = self._ts[j] = ts
+        col = self._data[:, i]
+        col.fill(np.nan)
+        for name, v in values.items():
+            r = self.index.get(name)
+            if r is None:
+                r = self.add_channel(name)
+                col = self._data[:, i]
+            col[r] = v
+        self._data[:, j] = col
+
+        self._pos = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._count = 0
+        self._data.fill(np.nan)
+
+    # ----------------- чтение (views) -----------------
+    def __len__(self) -> int:
+        return self._count
+
+    def _window(self) -> slice:
+        end = self._pos + self.capacity
+        return slice(end - self._count, end)
+
+    def times(self) -> np.ndarray:
+        """Время точек, от старых к новым (view)."""
+        return self._ts[self._window()]
+
+    def column(self, name: str) -> np.ndarray:
+        """Значения канала, от старых к новым (view, выровнено с times())."""
+        return self._data[self.index[name], self._window()]
+
+    def last(self, name: str) -> float:
+        if not self._count:
+            return float("nan")
+        return float(self._data[self.index[name], self._pos + self.capacity - 1])
@@ -0,0 +1,280 @@
+"""
+Кольцевой буфер точек одного агрегата в multiprocessing.shared_memory.
+
+Один писатель (процесс опроса), один читатель (GUI). Раскладка фиксирована
+при создании: capacity точек × nslots каналов, у каждого канала — свой слот,
+который не меняется до конца жизни буфера. Имена каналов лежат в заголовке:
+заданы заранее (теги S7, field_names SERVA) или занимают свободный слот
+при первом появлении.
+
+Блок памяти:
+    int64[_N_HDR]        заголовок (см. H_*)
+    float64              heartbeat писателя (time.time())
+    float64              время последней ошибки
+    bytes[ERR_BYTES]     текст последней ошибки
+    float64              время последних текстов
+    bytes[TEXT_BYTES]    последние текстовые показания (S7 STRING): имя\0текст\0…
+    bytes[nslots × NAME_BYTES]  имена каналов (utf-8)
+    float64[capacity]    время точек
+    float64[nslots, capacity]   значения (NaN — нет значения)
+
+Писатель пишет точку и только потом увеличивает H_SEQ (одно выровненное
+8-байтовое слово), читатель сверяет H_SEQ до и после копирования и отбрасывает
+то, что писатель успел перезаписать, — без блокировок между процессами.
+Тексты — одно последнее значение на канал, не история: писатель меняет H_TEXT_SEQ
+до и после записи (нечётный — пишет), читатель берёт копию только при чётном и неизменном.
+"""
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# поля заголовка
+H_MAGIC = 0
+H_CAPACITY = 1
+H_NSLOTS = 2
+H_SEQ = 3          # сколько точек записано всего
+H_NCHAN = 4        # сколько слотов занято именами
+H_ERR_SEQ = 5      # сколько ошибок записано всего
+H_FRAMES = 6
+H_ERRORS = 7
+H_RECONNECTS = 8
+H_MISSED = 9
+H_TEXT_SEQ = 10    # чётный — тексты целые
+H_TEXT_LEN = 11    # байт в области текстов
+_N_HDR = 16
+
+MAGIC = 0x4E534B43524E4731  # "NSKCRNG1"
+NAME_BYTES = 48
+ERR_BYTES = 256
+TEXT_BYTES = 4096
+
+
+def _open_shm(name: str) -> shared_memory.SharedMemory:
+    """
+    Открывает существующий блок. Удаляет блок только создатель (GUI):
+    в 3.13+ отказываемся от resource_tracker явно, в старых версиях процесс опроса
+    (spawn из GUI) делит трекер с создателем — повторная регистрация ничего не меняет.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class ShmRing:
+    """Вид на блок shared memory. create() — в процессе-владельце, attach() — в процессе опроса."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        buf = shm.buf
+
+        hdr = np.ndarray((_N_HDR,), dtype=np.int64, buffer=buf)
+        if int(hdr[H_MAGIC]) != MAGIC:
+            raise ValueError(f"not a ShmRing block: {shm.name}")
+        self.capacity = int(hdr[H_CAPACITY])
+        self.nslots = int(hdr[H_NSLOTS])
+
+        off = _N_HDR * 8
+        self._hdr = hdr
+        self._hb = np.ndarray((2,), dtype=np.float64, buffer=buf, offset=off)
+        off += 16
+        self._err = np.ndarray((ERR_BYTES,), dtype=np.uint8, buffer=buf, offset=off)
+        off += ERR_BYTES
+        self._text_ts = np.ndarray((1,), dtype=np.float64, buffer=buf, offset=off)
+        off += 8
+        self._text = np.ndarray((TEXT_BYTES,), dtype=np.uint8, buffer=buf, offset=off)
+        off += TEXT_BYTES
+        self._names = np.ndarray((self.nslots, NAME_BYTES), dtype=np.uint8, buffer=buf, offset=off)
+        off += self.nslots * NAME_BYTES
+        self._ts = np.ndarray((self.capacity,), dtype=np.float64, buffer=buf, offset=off)
+        off += self.capacity * 8
+        self._data = np.ndarray((self.nslots, self.capacity), dtype=np.float64, buffer=buf, offset=off)
+
+        # кэш имён: писатель — name -> слот, читатель — список по слотам
+        self.index: Dict[str, int] = {}
+        self.channels: List[str] = []
+        self._refresh_names()
+
+    # ----------------- создание / открытие -----------------
+    @staticmethod
+    def nbytes(capacity: int, nslots: int) -> int:
+        return _N_HDR * 8 + 16 + ERR_BYTES + 8 + TEXT_BYTES + nslots * NAME_BYTES + capacity * 8 * (1 + nslots)
+
+    @classmethod
+    def create(cls, capacity: int, nslots: int, channels: Iterable[str] = ()) -> "ShmRing":
+        capacity, nslots = max(1, int(capacity)), max(1, int(nslots))
+        shm = shared_memory.SharedMemory(create=True, size=cls.nbytes(capacity, nslots))
+        hdr = np.ndarray((_N_HDR,), dtype=np.int64, buffer=shm.buf)
+        hdr[:] = 0
+        hdr[H_CAPACITY] = capacity
+        hdr[H_NSLOTS] = nslots
+        hdr[H_MAGIC] = MAGIC
+        del hdr
+        ring = cls(shm, owner=True)
+        ring._data.fill(np.nan)
+        for name in channels:
+            ring.slot(name)
+        # владелец — читатель: данные и имена пишет только процесс опроса
+        for a in (ring._names, ring._ts, ring._data, ring._err, ring._text):
+            a.flags.writeable = False
+        return ring
+
+    @classmethod
+    def attach(cls, name: str) -> "ShmRing":
+        return cls(_open_shm(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def closed(self) -> bool:
+        return self._hdr is None
+
+    def close(self) -> None:
+        """Отпускает отображение; владелец ещё и удаляет блок."""
+        # views на буфер должны исчезнуть до shm.close()
+        self._hdr = self._hb = self._err = None  # type: ignore[assignment]
+        self._text_ts = self._text = self._names = self._ts = self._data = None  # type: ignore[assignment]
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ----------------- каналы -----------------
+    def _refresh_names(self) -> None:
+        n = int(self._hdr[H_NCHAN])
+        for i in range(len(self.channels), n):
+            name = bytes(self._names[i]).rstrip(b"\0").decode("utf-8", "replace")
+            self.channels.append(name)
+            self.index[name] = i
+
+    def slot(self, name: str) -> Optional[int]:
+        """Слот канала; новый канал занимает свободный слот (None — слоты кончились)."""
+        i = self.index.get(name)
+        if i is not None:
+            return i
+        n = int(self._hdr[H_NCHAN])
+        if n >= self.nslots:
+            return None
+        raw = name.encode("utf-8")[:NAME_BYTES]
+        self._names[n, :] = 0
+        self._names[n, : len(raw)] = np.frombuffer(raw, dtype=np.uint8)
+        self._hdr[H_NCHAN] = n + 1   # имя записано — теперь слот виден читателю
+        self.channels.append(name)
+        self.index[name] = n
+        return n
+
+    # ----------------- писатель -----------------
+    def write(self, ts: float, values: Mapping[str, float]) -> None:
+        seq = int(self._hdr[H_SEQ])
+        i = seq % self.capacity
+        col = self._data[:, i]
+        col.fill(np.nan)
+        index = self.index
+        for name, v in values.items():
+            r = index.get(name)
+            if r is None:
+                r = self.slot(name)
+                if r is None:
+                    continue
+            col[r] = v
+        self._ts[i] = ts
+        self._hdr[H_SEQ] = seq + 1
+
+    def write_error(self, ts: float, text: str) -> None:
+        raw = (text or "").encode("utf-8")[:ERR_BYTES]
+        self._err[:] = 0
+        self._err[: len(raw)] = np.frombuffer(raw, dtype=np.uint8)
+        self._hb[1] = ts
+        self._hdr[H_ERR_SEQ] += 1
+
+    def write_texts(self, ts: float, texts: Mapping[str, str]) -> None:
+        """Последние тексты каналов; что не влезло в TEXT_BYTES — отбрасывается целиком."""
+        raw = bytearray()
+        for name, text in texts.items():
+            item = name.encode("utf-8") + b"\0" + text.replace("\0", "").encode("utf-8") + b"\0"
+            if len(raw) + len(item) > TEXT_BYTES:
+                continue
+            raw += item
+        h = self._hdr
+        h[H_TEXT_SEQ] += 1
+        self._text[: len(raw)] = np.frombuffer(bytes(raw), dtype=np.uint8)
+        self._text_ts[0] = ts
+        h[H_TEXT_LEN] = len(raw)
+        h[H_TEXT_SEQ] += 1
+
+    def set_counters(self, frames: int, errors: int, reconnects: int, missed: int) -> None:
+        h = self._hdr
+        h[H_FRAMES], h[H_ERRORS], h[H_RECONNECTS], h[H_MISSED] = frames, errors, reconnects, missed
+
+    def heartbeat(self, now: float) -> None:
+        self._hb[0] = now
+
+    # ----------------- читатель -----------------
+    @property
+    def seq(self) -> int:
+        return int(self._hdr[H_SEQ])
+
+    def counters(self) -> Dict[str, int]:
+        h = self._hdr
+        return {
+            "frames": int(h[H_FRAMES]),
+            "errors": int(h[H_ERRORS]),
+            "reconnects": int(h[H_RECONNECTS]),
+            "missed_polls": int(h[H_MISSED]),
+        }
+
+    def last_heartbeat(self) -> float:
+        return float(self._hb[0])
+
+    def read_error(self, last_err_seq: int) -> Tuple[int, Optional[Tuple[float, str]]]:
+        """Новая ошибка с прошлого вызова: (err_seq, (время, текст) | None)."""
+        n = int(self._hdr[H_ERR_SEQ])
+        if n == last_err_seq:
+            return n, None
+        text = bytes(self._err).rstrip(b"\0").decode("utf-8", "replace")
+        return n, (float(self._hb[1]), text)
+
+    def read_texts(self, last_text_seq: int) -> Tuple[int, Optional[Tuple[float, Dict[str, str]]]]:
+        """Новые тексты с прошлого вызова: (text_seq, (время, {канал: текст}) | None)."""
+        h = self._hdr
+        n = int(h[H_TEXT_SEQ])
+        if n == last_text_seq or n % 2:
+            return last_text_seq, None
+        raw = bytes(self._text[: int(h[H_TEXT_LEN])])
+        ts = float(self._text_ts[0])
+        if int(h[H_TEXT_SEQ]) != n:
+            # писатель как раз обновляет — заберём на следующем drain()
+            return last_text_seq, None
+        parts = raw.decode("utf-8", "replace").split("\0")
+        return n, (ts, dict(zip(parts[0:-1:2], parts[1::2])))
+
+    def read_since(self, last_seq: int) -> Tuple[int, int, np.ndarray, np.ndarray]:
+        """
+        Копирует точки, записанные после last_seq.
+        Возвращает (новый seq, сколько точек потеряно, ts[n], values[nslots, n]).
+        """
+        seq = int(self._hdr[H_SEQ])
+        cap = self.capacity
+        start = max(last_seq, seq - cap)
+        idx = np.arange(start, seq) % cap
+        ts = self._ts[idx]
+        data = self._data[:, idx]
+        # пока копировали, писатель мог уйти вперёд и перезаписать самые старые точки
+        seq2 = int(self._hdr[H_SEQ])
+        valid = max(start, seq2 - cap + 1)
+        if valid > start:
+            ts, data = ts[valid - start:], data[:, valid - start:]
+        if int(self._hdr[H_NCHAN]) != len(self.channels):
+            self._refresh_names()
+        return seq, max(0, valid - last_seq), ts, data
@@ -0,0 +1,70 @@
+"""
+Отчёт о времени запуска: от импорта этого модуля (первая строка app.py)
+до первой отрисовки сетки флотов.
+
+    запуск 412 мс: импорт 265, конфиг 3, восстановление 0, Qt 58, главное окно 71, первый кадр 15
+
+NSKC_STARTUP_REPORT=<путь.json> — ещё и сохранить отчёт в JSON и выйти после
+первого кадра (так его снимает benchmarks/bench_startup.py).
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+_TITLES = {
+    "imports": "импорт",
+    "config": "конфиг",
+    "recover": "восстановление",
+    "qt": "Qt",
+    "main_window": "главное окно",
+    "first_paint": "первый кадр",
+}
+
+ENV_REPORT = "NSKC_STARTUP_REPORT"
+
+
+class StartupReport:
+    def __init__(self, t0: Optional[float] = None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        self.marks.append((name, time.perf_counter()))
+
+    def as_dict(self) -> Dict[str, object]:
+        steps: Dict[str, float] = {}
+        prev = self.t0
+        for name, t in self.marks:
+            steps[f"{name}_ms"] = (t - prev) * 1e3
+            prev = t
+        return {
+            "created": time.time(),
+            "total_ms": (prev - self.t0) * 1e3,
+            "steps": steps,
+        }
+
+    def summary(self) -> str:
+        d = self.as_dict()
+        parts = [
+            f"{_TITLES.get(k[:-3], k[:-3])} {v:.0f}" for k, v in d["steps"].items()  # type: ignore[union-attr]
+        ]
+        return f"запуск {d['total_ms']:.0f} мс: " + ", ".join(parts)
+
+    def export_json(self, path: str) -> str:
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+
+# отсчёт — с импорта модуля: app.py импортирует его первым
+report = StartupReport()
+
+
+def mark(name: str) -> None:
+    report.mark(name)
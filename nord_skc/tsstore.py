@@ -0,0 +1,272 @@
+"""
+Общее для процесса хранилище временных рядов: агрегат -> каналы.
+
+- сырые точки — в ограниченном кольце (RingBuffer)
+- на лету поддерживаются свёртки 1 с и 1 мин (min/max/mean/last) для длинных горизонтов
+- query() отдаёт NumPy views прямо в хранилище: окна, запись и экспорт читают
+  одни и те же данные, без копии на каждого потребителя
+
+Пишет поток опроса (AcquisitionWorker), читают GUI и остальные — append/query
+под замком ряда. View, полученный до следующих append, остаётся корректным,
+кроме самой старой точки, которую кольцо может перезаписать.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from nord_skc.ringbuffer import RingBuffer
+
+STATS = ("min", "max", "mean", "last")
+
+# (шаг свёртки, сколько корзин хранить): 1 с — час, 1 мин — сутки
+DEFAULT_TIERS: Tuple[Tuple[float, int], ...] = ((1.0, 3600), (60.0, 1440))
+DEFAULT_RAW_CAPACITY = 3600
+
+
+class RollupRing:
+    """
+    Свёртка с фиксированным шагом: на корзину — время начала и min/max/mean/last
+    по каждому каналу. Текущая корзина копится в маленьком аккумуляторе
+    и переносится в кольцо при смене корзины или при чтении (flush), так что
+    запросы видят и её. Хранение удвоенное, как у RingBuffer: окно всегда непрерывно.
+    """
+
+    def __init__(self, step_s: float, capacity: int):
+        self.step_s = float(step_s)
+        self.capacity = max(1, int(capacity))
+        self.channels: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        self._ts = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._stats = np.full((len(STATS), 0, 2 * self.capacity), np.nan)
+        # текущая корзина: min, max, sum, n, last
+        self._acc = np.zeros((5, 0))
+        self._pos = 0
+        self._count = 0
+        self._bucket = -np.inf   # начало текущей корзины
+        self._dirty = False
+
+    def add_channel(self, name: str) -> int:
+        if name in self.index:
+            return self.index[name]
+        row = np.full((len(STATS), 1, 2 * self.capacity), np.nan)
+        self._stats = np.concatenate([self._stats, row], axis=1)
+        acc = np.array([[np.nan], [np.nan], [0.0], [0.0], [np.nan]])
+        self._acc = np.concatenate([self._acc, acc], axis=1)
+        self.index[name] = len(self.channels)
+        self.channels.append(name)
+        return self.index[name]
+
+    def add(self, ts: float, v: np.ndarray, have: Optional[np.ndarray] = None) -> None:
+        """v — значения по каналам в порядке channels (NaN — нет значения)."""
+        bucket = ts - ts % self.step_s
+        if have is None:
+            have = ~np.isnan(v)
+        acc = self._acc
+        if bucket > self._bucket:
+            # новая корзина: прошлую — в кольцо, аккумулятор — с нуля
+            self.flush()
+            self._bucket = bucket
+            i = self._pos
+            self._pos = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._ts[i] = self._ts[i + self.capacity] = bucket
+            acc[0] = v
+            acc[1] = v
+            np.copyto(acc[2], 0.0)
+            np.add(acc[2], v, out=acc[2], where=have)
+            acc[3] = have
+            acc[4] = v
+        else:
+            np.fmin(acc[0], v, out=acc[0])
+            np.fmax(acc[1], v, out=acc[1])
+            np.add(acc[2], v, out=acc[2], where=have)
+            np.add(acc[3], have, out=acc[3])
+            np.copyto(acc[4], v, where=have)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Переносит текущую корзину в кольцо."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        i = (self._pos - 1) % self.capacity
+        acc = self._acc
+        st = self._stats
+        st[0, :, i] = acc[0]
+        st[1, :, i] = acc[1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            st[2, :, i] = np.where(acc[3] > 0, acc[2] / acc[3], np.nan)
+        st[3, :, i] = acc[4]
+        st[:, :, i + self.capacity] = st[:, :, i]
+
+    def window(self) -> slice:
+        end = self._pos + self.capacity
+        return slice(end - self._count, end)
+
+    def times(self) -> np.ndarray:
+        return self._ts[self.window()]
+
+    def column(self, name: str, stat: str = "mean") -> np.ndarray:
+        self.flush()
+        return self._stats[STATS.index(stat), self.index[name], self.window()]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+@dataclass
+class Series:
+    """Результат query(): ts и views на столбцы (resolution 0 — сырые точки)."""
+    resolution: float
+    ts: np.ndarray
+    # (канал, stat) -> view; у сырых точек stat всегда "last"
+    cols: Dict[Tuple[str, str], np.ndarray] = field(default_factory=dict)
+    channels: List[str] = field(default_factory=list)
+
+    def column(self, name: str, stat: str = "mean") -> np.ndarray:
+        """Значения канала (view). Для свёрток stat — min/max/mean/last, у сырых игнорируется."""
+        if self.resolution == 0:
+            stat = "last"
+        v = self.cols.get((name, stat))
+        if v is None:
+            return np.full(len(self.ts), np.nan)
+        return v
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+class AssetSeries:
+    """Все ряды одного агрегата: сырое кольцо + свёртки."""
+
+    def __init__(self, asset_id: str, raw_capacity: int, tiers: Sequence[Tuple[float, int]]):
+        self.asset_id = asset_id
+        self.raw = RingBuffer(raw_capacity)
+        self.tiers: List[RollupRing] = [RollupRing(step, cap) for step, cap in sorted(tiers)]
+        self.lock = threading.Lock()
+        self.last_ts = -np.inf
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self.raw.channels)
+
+    def append(self, ts: float, values: Mapping[str, float]) -> None:
+        with self.lock:
+            # время не убывает: иначе поиск по диапазону в кольцах сломается
+            ts = max(float(ts), self.last_ts)
+            self.last_ts = ts
+            for name in values:
+                if name not in self.raw.index:
+                    self.raw.add_channel(name)
+                    for t in self.tiers:
+                        t.add_channel(name)
+            self.raw.append(ts, values)
+            if self.tiers:
+                v = np.full(len(self.raw.channels), np.nan)
+                idx = self.raw.index
+                for name, x in values.items():
+                    v[idx[name]] = x
+                have = ~np.isnan(v)
+                for t in self.tiers:
+                    t.add(ts, v, have)
+
+    def query(
+        self,
+        t0: Optional[float] = None,
+        t1: Optional[float] = None,
+        resolution: float = 0.0,
+        channels: Optional[Sequence[str]] = None,
+    ) -> Series:
+        """
+        Точки за [t0, t1] с шагом не мельче resolution (секунды):
+        0 — сырые, если они ещё покрывают t0 (с точностью до шага самой мелкой свёртки),
+        иначе самая мелкая свёртка, которая покрывает.
+        """
+        with self.lock:
+            names = [c for c in (channels if channels is not None else self.raw.channels) if c in self.raw.index]
+            src = self._pick(t0, resolution)
+            ts = src.times()
+            i0 = 0 if t0 is None else int(np.searchsorted(ts, t0, side="left"))
+            i1 = len(ts) if t1 is None else int(np.searchsorted(ts, t1, side="right"))
+            if isinstance(src, RingBuffer):
+                cols = {(k, "last"): src.column(k)[i0:i1] for k in names}
+                return Series(0.0, ts[i0:i1], cols, names)
+            cols = {(k, st): src.column(k, st)[i0:i1] for k in names for st in STATS}
+            return Series(src.step_s, ts[i0:i1], cols, names)
+
+    def _pick(self, t0: Optional[float], resolution: float):
+        candidates: List[object] = []
+        if resolution <= 0:
+            candidates.append(self.raw)
+        candidates += [t for t in self.tiers if t.step_s >= resolution]
+        if not candidates:
+            candidates = [self.tiers[-1]] if self.tiers else [self.raw]
+        for src in candidates:
+            ts = src.times()
+            # сырым точкам прощаем недостачу меньше шага свёртки: иначе кольцо «ровно на окно»
+            # из-за дрожания опроса то и дело уступало бы секундным средним
+            slack = self.tiers[0].step_s if src is self.raw and self.tiers else 0.0
+            if t0 is None or not len(ts) or ts[0] <= t0 + slack or len(src) < src.capacity:
+                return src
+        return candidates[-1]
+
+
+class TimeSeriesStore:
+    """Реестр рядов по агрегатам. Один на процесс: get_store()."""
+
+    def __init__(
+        self,
+        raw_capacity: int = DEFAULT_RAW_CAPACITY,
+        tiers: Sequence[Tuple[float, int]] = DEFAULT_TIERS,
+    ):
+        self.raw_capacity = int(raw_capacity)
+        self.tiers = tuple(tiers)
+        self._series: Dict[str, AssetSeries] = {}
+        self._lock = threading.Lock()
+
+    def series(self, asset_id: str, raw_capacity: Optional[int] = None) -> AssetSeries:
+        """Ряды агрегата; создаются при первом обращении (размер сырого кольца — тогда же)."""
+        s = self._series.get(asset_id)
+        if s is None:
+            with self._lock:
+                s = self._series.get(asset_id)
+                if s is None:
+                    cap = max(self.raw_capacity if raw_capacity is None else int(raw_capacity), 1)
+                    s = self._series[asset_id] = AssetSeries(asset_id, cap, self.tiers)
+        return s
+
+    def append(self, asset_id: str, ts: float, values: Mapping[str, float]) -> None:
+        self.series(asset_id).append(ts, values)
+
+    def query(
+        self,
+        asset_id: str,
+        t0: Optional[float] = None,
+        t1: Optional[float] = None,
+        resolution: float = 0.0,
+        channels: Optional[Sequence[str]] = None,
+    ) -> Series:
+        return self.series(asset_id).query(t0, t1, resolution, channels)
+
+    def assets(self) -> List[str]:
+        return list(self._series)
+
+    def drop(self, asset_id: str) -> None:
+        with self._lock:
+            self._series.pop(asset_id, None)
+
+
+_store: Optional[TimeSeriesStore] = None
+
+
+def get_store() -> TimeSeriesStore:
+    global _store
+    if _store is None:
+        _store = TimeSeriesStore()
+    return _store
@@ -1,21 +1,16 @@
 from __future__ import annotations
 
-import csv
 import os
 import time
-from collections import deque
-from dataclasses import dataclass
-from typing import Deque, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-import yaml
+import numpy as np
 import pyqtgraph as pg
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
     QColorDialog,
-    QFrame,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -24,44 +19,19 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from nord_skc.config import AppConfig, AssetConfig
+from nord_skc import metrics
+from nord_skc.acquisition import AcquisitionWorker, Batch
+from nord_skc.config import AppConfig, AssetConfig, config_service
+from nord_skc.decimate import clip_to_range, decimate
 from nord_skc.drivers import BaseDriver
 from nord_skc.model import ReadResult
+from nord_skc.recorder import SessionRecorder
+from nord_skc.tsstore import AssetSeries, get_store
+from nord_skc.ui.diagnostics import DiagnosticsPanel
+from nord_skc.ui.value_grid import ValueGridArea
 
-
-@dataclass
-class Sample:
-    ts: float
-    values: Dict[str, float]
-
-
-class ValueTile(QFrame):
-    def __init__(self, name: str):
-        super().__init__()
-        self.setStyleSheet(
-            """
-            QFrame {
-                border: 1px solid #2b2b2b;
-                border-radius: 14px;
-                padding: 8px;
-            }
-            """
-        )
-        l = QVBoxLayout(self)
-        l.setContentsMargins(10, 10, 10, 10)
-        l.setSpacing(2)
-
-        self.name_lbl = QLabel(name)
-        self.name_lbl.setStyleSheet("color: #aaa;")
-
-        self.val_lbl = QLabel("—")
-        self.val_lbl.setStyleSheet("font-size: 18px; font-weight: 700;")
-
-        l.addWidget(self.name_lbl)
-        l.addWidget(self.val_lbl)
-
-    def set_value(self, v: float):
-        self.val_lbl.setText(f"{v:.3f}")
+if TYPE_CHECKING:
+    from nord_skc.procpool import AcquisitionPool
 
 
 class ColorSwatch(QLabel):
@@ -90,8 +60,9 @@ class AssetWindow(QWidget):
         self,
         app_cfg: AppConfig,
         asset: AssetConfig,
-        driver: BaseDriver,
+        driver: Optional[BaseDriver],
         config_path: str = "config.yaml",
+        pool: Optional["AcquisitionPool"] = None,
     ):
         super().__init__()
         self.app_cfg = app_cfg
@@ -104,35 +75,51 @@ class AssetWindow(QWidget):
         # --- state ---
         self.series_visible: Dict[str, bool] = {}
         self.series_color: Dict[str, QColor] = {}
-        self.buffers: Dict[str, Deque[Tuple[float, float]]] = {}
         self.curves: Dict[str, pg.PlotDataItem] = {}
 
-        self.tiles: Dict[str, ValueTile] = {}
+        # что изменилось с прошлого кадра (перерисовывается только это)
+        self._dirty_series: set = set()
+        self._pending_tiles: Dict[str, float] = {}
+        self._pending_texts: Dict[str, str] = {}
 
         # UI controls per series
         self.checkboxes: Dict[str, QCheckBox] = {}
         self.swatches: Dict[str, ColorSwatch] = {}
 
-        self.maxlen = max(60, int(self.app_cfg.history_seconds * self.app_cfg.poll_hz))
+        # запас в пару секунд: кольцо «впритык» перестаёт покрывать окно при малейшем дрожании опроса,
+        # и график уходит на свёртку
+        hz = max(1, self.app_cfg.poll_hz)
+        self.maxlen = max(60, int(self.app_cfg.history_seconds * hz) + 2 * hz)
+        # история — ряды агрегата в общем хранилище (nord_skc/tsstore.py): пишет поток опроса,
+        # окно читает views; после закрытия окна данные остаются
+        self.store = get_store()
+        self.history = self._live_history = self.store.series(asset.id, raw_capacity=self.maxlen)
+        # «Очистить график» не стирает общие данные — только прячет всё до этого момента
+        self._cleared_at = -np.inf
 
         self.recording: bool = False
-        self.session: List[Sample] = []
+        self.recorder: SessionRecorder | None = None
 
         self.test_mode: bool = False
         self._test_t0 = time.time()
 
+        # диагностика: гистограммы времени и счётчики (новая сессия — с нуля)
+        self.metrics = metrics.for_asset(asset.id)
+        self.metrics.reset()
+        self._last_tick = 0.0
+
         # Предзагрузка UI-настроек из config.yaml
         self.saved_ui = self._load_ui_settings_for_asset()
 
         # --- UI ---
         self.status = QLabel("—")
 
-        # tiles
-        self.tiles_host = QWidget()
-        self.tiles_grid = QGridLayout(self.tiles_host)
-        self.tiles_grid.setContentsMargins(0, 0, 0, 0)
-        self.tiles_grid.setHorizontalSpacing(10)
-        self.tiles_grid.setVerticalSpacing(10)
+        # tiles: все значения рисует один виджет (закрепление/сортировка — правой кнопкой)
+        self.tiles_host = ValueGridArea(max_rows=3)
+        self.tiles = self.tiles_host.grid
+        for k, ui in self.saved_ui.items():
+            if isinstance(ui, dict) and ui.get("pinned"):
+                self.tiles.set_pinned(k)
 
         # plot
         self.plot = pg.PlotWidget()
@@ -141,10 +128,12 @@ class AssetWindow(QWidget):
         # buttons row
         self.btn_start = QPushButton("Старт записи")
         self.btn_stop = QPushButton("Стоп")
-        self.btn_save = QPushButton("Сохранить CSV")
+        self.btn_save = QPushButton("Сохранить CSV" if self.app_cfg.record_format == "csv" else "Сохранить запись")
         self.btn_clear = QPushButton("Очистить график")
         self.btn_save_ui = QPushButton("Сохранить настройки")
         self.btn_test = QPushButton("Тест")
+        self.btn_diag = QPushButton("Диагностика")
+        self.btn_diag.setCheckable(True)
 
         self.btn_stop.setEnabled(False)
         self.btn_save.setEnabled(False)
@@ -155,6 +144,7 @@ class AssetWindow(QWidget):
         self.btn_clear.clicked.connect(self.clear_plot)
         self.btn_save_ui.clicked.connect(self.save_ui_settings_to_yaml)
         self.btn_test.clicked.connect(self.toggle_test_mode)
+        self.btn_diag.toggled.connect(self._toggle_diagnostics)
 
         btn_row = QHBoxLayout()
         btn_row.addWidget(self.btn_start)
@@ -163,8 +153,15 @@ class AssetWindow(QWidget):
         btn_row.addWidget(self.btn_clear)
         btn_row.addWidget(self.btn_save_ui)
         btn_row.addStretch(1)
+        btn_row.addWidget(self.btn_diag)
         btn_row.addWidget(self.btn_test)
 
+        self.diag = DiagnosticsPanel(self.metrics)
+        self.diag.exported.connect(lambda path: self.status.setText(f"{self.asset.id}: диагностика -> {path}"))
+        self.diag.setVisible(False)
+        self.diag_timer = QTimer(self)
+        self.diag_timer.timeout.connect(self.diag.refresh)
+
         # param list
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
@@ -177,71 +174,69 @@ class AssetWindow(QWidget):
         root.addWidget(self.tiles_host)
         root.addWidget(self.plot, 1)
         root.addLayout(btn_row)
+        root.addWidget(self.diag)
         root.addWidget(self.scroll, 1)
 
-        # timer
+        # опрос агрегата — в отдельном потоке (connect тоже там), GUI только забирает результаты;
+        # с пулом процессов — в процессе опроса, окно читает его кольцо в shared memory
+        if pool is not None:
+            self.worker = pool.open(self.asset, self.app_cfg.poll_hz, metrics=self.metrics, store=self.store)
+        else:
+            self.worker = AcquisitionWorker(
+                self.driver, self.app_cfg.poll_hz, name=self.asset.id, metrics=self.metrics, store=self.store
+            )
+        self.worker.start()
+
+        # перерисовка при ручном зуме/сдвиге графика
+        self.plot.getViewBox().sigRangeChanged.connect(self._on_view_changed)
+
+        # timer: кадры не чаще render_fps и не чаще опроса (новых данных всё равно нет)
+        fps = max(1, min(self.app_cfg.render_fps, self.app_cfg.poll_hz))
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.tick)
-        self.timer.start(int(1000 / max(1, self.app_cfg.poll_hz)))
-
-        # try connect
-        try:
-            self.driver.connect()
-        except Exception:
-            pass
+        self.timer.start(int(1000 / fps))
+        self._tick_period = self.timer.interval() / 1000.0
+
+    def stop_acquisition(self):
+        """Останавливает опрос и закрывает драйвер (при выходе из приложения)."""
+        self.timer.stop()
+        self.diag_timer.stop()
+        self.worker.stop(timeout=1.0)
+        # идущую/несохранённую запись не теряем — сохраняем файл
+        if self.recorder is not None:
+            try:
+                self.recorder.finalize()
+            except OSError:
+                pass
+            self.recorder = None
 
     # ----------------- настройки UI в YAML -----------------
     def _load_ui_settings_for_asset(self) -> Dict[str, Dict]:
         """
-        Читает config.yaml и возвращает словарь:
+        Настройки линий агрегата из кэша ConfigService (файл уже разобран при старте):
         {
-          "pressure": {"visible": True, "color": "#ff00aa"},
+          "pressure": {"visible": True, "color": "#ff00aa", "pinned": True},
           ...
         }
         """
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
-            for a in raw.get("assets", []) or []:
-                if str(a.get("id")) == self.asset.id:
-                    ui = a.get("ui", {}) or {}
-                    series = ui.get("series", {}) or {}
-                    # series: {key: {visible: bool, color: str}}
-                    return {str(k): dict(v or {}) for k, v in series.items()}
+            return config_service(self.config_path).ui_series(self.asset.id)
         except Exception:
-            pass
-        return {}
+            return {}
 
     def save_ui_settings_to_yaml(self):
-        """Сохраняет видимость/цвета линий в config.yaml -> assets[].ui.series"""
+        """Сохраняет видимость/цвета линий в config.yaml -> assets[].ui.series (отложенно и атомарно)."""
+        series: Dict[str, Dict] = {}
+        for key in self.series_visible.keys():
+            series[key] = {
+                "visible": bool(self.series_visible.get(key, True)),
+                "pinned": key in self.tiles.pinned,
+            }
+            c = self.series_color.get(key)
+            if c is not None:
+                series[key]["color"] = c.name()
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
-
-            assets = raw.get("assets", []) or []
-            for a in assets:
-                if str(a.get("id")) != self.asset.id:
-                    continue
-
-                ui = a.get("ui", {}) or {}
-                series = ui.get("series", {}) or {}
-
-                # записываем текущие настройки
-                for key in self.series_visible.keys():
-                    series.setdefault(key, {})
-                    series[key]["visible"] = bool(self.series_visible.get(key, True))
-                    c = self.series_color.get(key)
-                    if c is not None:
-                        series[key]["color"] = c.name()
-
-                ui["series"] = series
-                a["ui"] = ui
-                break
-
-            raw["assets"] = assets
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(raw, f, allow_unicode=True, sort_keys=False)
-
+            config_service(self.config_path).set_ui_series(self.asset.id, series)
             self.status.setText(f"{self.asset.id}: настройки сохранены в {self.config_path}")
         except Exception as e:
             self.status.setText(f"{self.asset.id}: ошибка сохранения настроек: {e}")
@@ -264,7 +259,19 @@ class AssetWindow(QWidget):
 
     # ----------------- серии/контролы -----------------
     def _toggle(self, key: str, state: int):
-        self.series_visible[key] = bool(state)
+        visible = bool(state)
+        self.series_visible[key] = visible
+        curve = self.curves.get(key)
+        if curve is not None:
+            # скрытые линии не трогаем вообще, при показе — дорисуем в следующем кадре
+            curve.setVisible(visible)
+            if visible:
+                self._dirty_series.add(key)
+
+    def _on_view_changed(self, *_):
+        # в автомасштабе диапазон меняется вслед за данными — лишняя перерисовка не нужна
+        if not self.plot.getViewBox().state["autoRange"][0]:
+            self._dirty_series.update(self.curves.keys())
 
     def _apply_saved_ui_for_series(self, key: str, default_color: QColor) -> Tuple[bool, QColor]:
         """
@@ -282,22 +289,10 @@ class AssetWindow(QWidget):
 
     def _ensure_series(self, values: Dict[str, float]):
         for k in values.keys():
-            # tile
-            if k not in self.tiles:
-                tile = ValueTile(k)
-                idx = len(self.tiles)
-                r = idx // 4
-                c = idx % 4
-                self.tiles_grid.addWidget(tile, r, c)
-                self.tiles[k] = tile
-
             # series already exists
             if k in self.series_visible:
                 continue
 
-            # buffer
-            self.buffers[k] = deque(maxlen=self.maxlen)
-
             # default color + apply saved
             default_color = self._default_color(len(self.series_color))
             visible, color = self._apply_saved_ui_for_series(k, default_color)
@@ -330,6 +325,7 @@ class AssetWindow(QWidget):
             # curve
             curve = self.plot.plot([], [])
             curve.setPen(color)
+            curve.setVisible(visible)
             self.curves[k] = curve
 
         # spacer один раз
@@ -338,8 +334,14 @@ class AssetWindow(QWidget):
 
     # ----------------- запись -----------------
     def start_recording(self):
+        # несохранённая прошлая запись отбрасывается (как и раньше)
+        if self.recorder is not None:
+            try:
+                self.recorder.discard()
+            except OSError:
+                pass
+            self.recorder = None
         self.recording = True
-        self.session = []
         self.btn_start.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.btn_save.setEnabled(False)
@@ -350,65 +352,73 @@ class AssetWindow(QWidget):
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.btn_save.setEnabled(True)
-        self.status.setText(f"{self.asset.id}: запись остановлена ({len(self.session)} точек)")
+        n = self.recorder.count if self.recorder is not None else 0
+        self.status.setText(f"{self.asset.id}: запись остановлена ({n} точек)")
+
+    def _record(self, ts: float, values: Dict[str, float]):
+        # файл создаётся по первой точке: имя — по её времени, столбцы — по её каналам
+        if self.recorder is None:
+            fmt = self.app_cfg.record_format
+            path = os.path.join("records", f"{self.asset.id}_fleet{self.asset.fleet_no:02d}_{int(ts)}.{fmt}")
+            self.recorder = SessionRecorder(path, sorted(values.keys()), fmt=fmt, metrics=self.metrics)
+        rec = self.recorder
+        n = len(rec.dropped_keys)
+        rec.append(ts, {k: float(v) for k, v in values.items()})
+        if len(rec.dropped_keys) != n:
+            # столбцы файла заданы первой точкой: новый канал в эту запись не попадёт
+            self.status.setText(
+                f"{self.asset.id}: не записываются новые каналы: {', '.join(sorted(rec.dropped_keys))} "
+                f"(начните запись заново)"
+            )
 
     def save_recording(self):
-        if not self.session:
+        """Данные уже на диске — остаётся дописать хвост и переименовать .part."""
+        rec = self.recorder
+        if rec is None or not rec.count:
             self.status.setText(f"{self.asset.id}: нечего сохранять")
             return
 
-        os.makedirs("records", exist_ok=True)
-        ts0 = int(self.session[0].ts)
-        path = os.path.join("records", f"{self.asset.id}_fleet{self.asset.fleet_no:02d}_{ts0}.csv")
-
-        keys = sorted({k for s in self.session for k in s.values.keys()})
-
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["ts"] + keys)
-            for s in self.session:
-                row = [f"{s.ts:.3f}"] + [s.values.get(k, "") for k in keys]
-                w.writerow(row)
+        self.recorder = None
+        try:
+            path = rec.finalize()
+        except OSError as e:
+            self.status.setText(f"{self.asset.id}: ошибка записи: {e}")
+            return
 
         self.status.setText(f"{self.asset.id}: сохранено -> {path}")
         self.btn_save.setEnabled(False)
 
     # ----------------- очистка графика -----------------
     def clear_plot(self):
-        for k in self.buffers.keys():
-            self.buffers[k].clear()
+        self._cleared_at = self.history.last_ts
+        self._dirty_series.clear()
         for k in self.curves.keys():
             self.curves[k].setData([], [])
         self.status.setText(f"{self.asset.id}: график очищен")
 
+    # ----------------- диагностика -----------------
+    def _toggle_diagnostics(self, on: bool):
+        self.diag.setVisible(on)
+        if on:
+            self.diag.refresh()
+            self.diag_timer.start(1000)
+        else:
+            self.diag_timer.stop()
+
     # ----------------- тест -----------------
     def toggle_test_mode(self):
         self.test_mode = not self.test_mode
         self.btn_test.setText("Тест: ВКЛ" if self.test_mode else "Тест")
         if self.test_mode:
             self._test_t0 = time.time()
-
-    def _read_values(self) -> ReadResult:
-        if not self.test_mode:
-            try:
-                rr = self.driver.read_once()
-            except Exception as e:
-                rr = ReadResult(ok=False, values={}, error=str(e))
-
-            # Если связи нет/оборвалась — пробуем переподключиться один раз
-            if (not rr.ok) and (rr.error or "").lower().find("not connected") >= 0:
-                try:
-                    self.driver.close()
-                except Exception:
-                    pass
-                try:
-                    self.driver.connect()
-                    rr = self.driver.read_once()
-                except Exception as e:
-                    rr = ReadResult(ok=False, values={}, error=str(e))
-
-            return rr
-
+            # тестовые точки — в свой ряд вне общего хранилища: поток опроса пишет туда
+            # настоящие данные агрегата, и их видят другие окна/потребители
+            self.history = AssetSeries(f"test:{self.asset.id}", self.maxlen, self.store.tiers)
+        else:
+            self.history = self._live_history
+        self._dirty_series.update(self.curves.keys())
+
+    def _test_values(self) -> ReadResult:
         import math
 
         t = time.time() - self._test_t0
@@ -419,43 +429,125 @@ class AssetWindow(QWidget):
         }
         return ReadResult(ok=True, values=vals)
 
+    def _read_values(self) -> Batch:
+        """Все результаты, накопленные потоком опроса с прошлого тика."""
+        batch = self.worker.drain()
+        if self.test_mode:
+            # тестовые значения идут мимо потока опроса — в свой ряд кладём сами
+            ts, rr = time.time(), self._test_values()
+            self.history.append(ts, rr.values)
+            return [(ts, rr)]
+        return batch
+
+    # ----------------- отрисовка -----------------
+    def _redraw(self, keys):
+        """
+        Хранилище -> (видимый диапазон) -> прореживание под ширину графика -> setData.
+        Стоимость отрисовки ограничена шириной графика в пикселях, а не длиной истории.
+        Если сырые точки уже не покрывают диапазон (сдвиг/зум в прошлое) — рисуется
+        коридор min/max секундной/минутной свёртки: пики не пропадают.
+        В setData уходят копии: query() отдаёт views в кольцо, куда поток опроса пишет дальше,
+        а pyqtgraph держит переданные массивы до следующего setData.
+        """
+        vb = self.plot.getViewBox()
+        width_px = max(100, int(vb.width()))
+
+        # пока X в автомасштабе — показываем последние history_seconds, иначе только видимое окно
+        x_auto = bool(vb.state["autoRange"][0])
+        x0, x1 = vb.viewRange()[0]
+        t0 = self.history.last_ts - self.app_cfg.history_seconds if x_auto else x0
+        t0 = max(t0, np.nextafter(self._cleared_at, np.inf))
+
+        s = self.history.query(t0=t0, channels=[k for k in keys if k in self.curves])
+        if s.resolution > 0:
+            # на корзину две точки: min в начале, max в середине
+            xr = np.repeat(s.ts, 2)
+            xr[1::2] += s.resolution / 2
+        for k in keys:
+            curve = self.curves.get(k)
+            if curve is None or not self.series_visible.get(k, True):
+                continue
+            if s.resolution > 0:
+                x, y = xr, np.empty(len(xr))
+                y[0::2] = s.column(k, "min")
+                y[1::2] = s.column(k, "max")
+            else:
+                x, y = s.ts, s.column(k)
+            if not x_auto:
+                x, y = clip_to_range(x, y, x0, x1)
+            x, y = decimate(x, y, width_px, self.app_cfg.decimation)
+            # прореживание обычно уже вернуло свои массивы; короткая история и "off" — ещё views
+            curve.setData(x if x.base is None else x.copy(), y if y.base is None else y.copy())
+
+    def _render(self):
+        """Один кадр: только изменившиеся плитки и видимые линии с новыми данными."""
+        if self._pending_tiles:
+            self.tiles.set_values(self._pending_tiles)
+            self._pending_tiles.clear()
+        if self._pending_texts:
+            self.tiles.set_texts(self._pending_texts)
+            self._pending_texts.clear()
+
+        if self._dirty_series:
+            keys = self._dirty_series
+            self._dirty_series = set()
+            t = time.perf_counter()
+            self._redraw(keys)
+            self.metrics.observe("redraw", time.perf_counter() - t)
+
     # ----------------- loop -----------------
     def tick(self):
-        rr = self._read_values()
-        if not rr.ok:
+        """Кадр окна: забрать всё, что накопил поток опроса, и перерисовать изменившееся."""
+        t = time.perf_counter()
+        m = self.metrics
+        m.ticks += 1
+        # таймер не смог сработать вовремя (GUI был занят) — считаем пропущенные кадры
+        if self._last_tick:
+            late = int((t - self._last_tick) / self._tick_period - 0.5)
+            if late > 0:
+                m.missed_ticks += late
+        self._last_tick = t
+
+        batch = self._read_values()
+        if batch:
+            self._ingest(batch)
+        self._render()
+        m.observe("tick", time.perf_counter() - t)
+
+    def _ingest(self, batch: Batch):
+        _, last = batch[-1]
+        if not last.ok:
             from nord_skc.ui.errors import humanize_runtime_error
-            self.status.setText(humanize_runtime_error(self.asset.id, rr.error or ""))
-            return
+            self.status.setText(humanize_runtime_error(self.asset.id, last.error or ""))
 
-        if not rr.values:
-            self.status.setText(f"{self.asset.id}: ОК (нет данных)")
-            return
+        updated = False
+        for ts, rr in batch:
+            if rr.texts:
+                self._pending_texts.update(rr.texts)
+            if not rr.ok or not rr.values:
+                continue
+            updated = True
 
-        self._ensure_series(rr.values)
-        ts = time.time()
+            self._ensure_series(rr.values)
 
-        # tiles
-        for k, v in rr.values.items():
-            if k in self.tiles:
-                self.tiles[k].set_value(float(v))
+            # tiles: в кадре покажем только последнее значение
+            for k, v in rr.values.items():
+                self._pending_tiles[k] = float(v)
 
-        # buffers
-        for k, v in rr.values.items():
-            if k in self.buffers:
-                self.buffers[k].append((ts, float(v)))
+            # recording
+            if self.recording:
+                self._record(ts, rr.values)
 
-        # recording
-        if self.recording:
-            self.session.append(Sample(ts=ts, values={k: float(v) for k, v in rr.values.items()}))
+        # общая ось времени: новая точка сдвигает все линии
+        if updated:
+            self._dirty_series.update(self.curves.keys())
 
-        # draw
-        for k, buf in self.buffers.items():
-            if not self.series_visible.get(k, True):
-                self.curves[k].setData([], [])
-                continue
-            xs = [p[0] for p in buf]
-            ys = [p[1] for p in buf]
-            self.curves[k].setData(xs, ys)
+        if not last.ok:
+            return
+
+        if not last.values:
+            self.status.setText(f"{self.asset.id}: ОК (нет данных)")
+            return
 
         if not self.recording:
-            self.status.setText(f"{self.asset.id}: ОК ({len(rr.values)} параметров)")
+            self.status.setText(f"{self.asset.id}: ОК ({len(last.values)} параметров)")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import time
+
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
+
+from nord_skc import metrics
+from nord_skc.metrics import AssetMetrics
+
+_TITLES = {
+    "connect": "подключение",
+    "read": "чтение",
+    "parse": "разбор",
+    "tick": "кадр окна",
+    "redraw": "перерисовка",
+}
+
+
+class DiagnosticsPanel(QFrame):
+    """
+    Панель диагностики окна агрегата: время операций (p50/p99/max),
+    частоты и счётчики. Обновляется только пока видна, не чаще раза в секунду.
+    """
+
+    exported = Signal(str)  # путь к JSON
+
+    def __init__(self, m: AssetMetrics):
+        super().__init__()
+        self.m = m
+        self.setStyleSheet("QFrame { border: 1px solid #2b2b2b; border-radius: 10px; }")
+
+        self.text = QLabel("—")
+        self.text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+
+        btn_export = QPushButton("Экспорт JSON")
+        btn_reset = QPushButton("Сбросить")
+        btn_export.clicked.connect(self.export)
+        btn_reset.clicked.connect(self._reset)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        buttons.addWidget(btn_reset)
+        buttons.addWidget(btn_export)
+
+        l = QVBoxLayout(self)
+        l.setContentsMargins(10, 8, 10, 8)
+        l.addWidget(self.text)
+        l.addLayout(buttons)
+
+    def refresh(self) -> None:
+        snap = self.m.snapshot()
+        lines = [f"{'':14s}{'n':>8s}{'p50 мс':>10s}{'p99 мс':>10s}{'max мс':>10s}"]
+        for name, h in snap["histograms"].items():
+            if not h["count"]:
+                lines.append(f"{_TITLES.get(name, name):14s}{0:>8d}{'—':>10s}{'—':>10s}{'—':>10s}")
+                continue
+            lines.append(
+                f"{_TITLES.get(name, name):14s}{h['count']:>8d}"
+                f"{h['p50_ms']:>10.2f}{h['p99_ms']:>10.2f}{h['max_ms']:>10.2f}"
+            )
+        c, r = snap["counters"], snap["rates"]
+        lines.append("")
+        lines.append(
+            f"данные {r['frames_per_s']:.1f}/с   кадры окна {r['ticks_per_s']:.1f}/с   "
+            f"принято {c['bytes_rx'] / 1024:.1f} КиБ"
+        )
+        lines.append(
+            f"ошибки {c['errors']}   переподключения {c['reconnects']}   "
+            f"пропуски опроса {c['missed_polls']}   пропуски кадров {c['missed_ticks']}   "
+            f"отброшено {c['dropped']}   не записано {c['unrecorded']}"
+        )
+        self.text.setText("\n".join(lines))
+
+    def export(self) -> None:
+        path = os.path.join("diagnostics", f"{self.m.asset_id}_{int(time.time())}.json")
+        metrics.export_json(path, [self.m.asset_id])
+        self.exported.emit(path)
+
+    def _reset(self) -> None:
+        self.m.reset()
+        self.refresh()
@@ -2,34 +2,12 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import QMessageBox
 from nord_skc.config import AssetConfig
+from nord_skc.reconnect import classify_error
 
 
 def _classify_net_error(e: Exception) -> str:
     """Грубая классификация сетевых ошибок для понятных сообщений оператору."""
-    s = str(e).lower()
-
-    # timeout / нет ответа
-    if "timed out" in s or "timeout" in s:
-        return "timeout"
-
-    # Windows: удалённый хост принудительно разорвал (WinError 10054)
-    if "10054" in s or "forcibly closed" in s or "connection reset" in s:
-        return "reset"
-
-    # Windows: нет ответа (WinError 10060)
-    if "10060" in s:
-        return "timeout"
-
-    # отказ в подключении (порт закрыт / сервис не запущен)
-    if "refused" in s or "10061" in s:
-        return "refused"
-
-    # нет маршрута / сеть недоступна / unreachable peer
-    if "unreachable" in s or "no route" in s or "network is unreachable" in s:
-        return "unreachable"
-
-    # прочее
-    return "other"
+    return classify_error(str(e))
 
 
 def make_connect_error_box(parent, a: AssetConfig, e: Exception) -> QMessageBox:
@@ -119,13 +97,15 @@ def humanize_runtime_error(asset_id: str, error_text: str) -> str:
     """
     Для статуса в AssetWindow (коротко, без TCP и WinError).
     """
-    s = (error_text or "").lower()
-    if "timed out" in s or "timeout" in s or "10060" in s:
+    kind = classify_error(error_text)
+    if kind == "timeout":
         return f"{asset_id}: НЕТ СВЯЗИ (агрегат не отвечает)"
-    if "10054" in s or "forcibly closed" in s or "connection reset" in s:
+    if kind == "reset":
         return f"{asset_id}: СВЯЗЬ ПРЕРВАНА (попробуйте ещё раз)"
-    if "unreachable" in s or "no route" in s or "network is unreachable" in s:
+    if kind == "unreachable":
         return f"{asset_id}: АГРЕГАТ НЕДОСТУПЕН (проблема сети)"
-    if "refused" in s or "10061" in s:
+    if kind == "refused":
         return f"{asset_id}: ОТКАЗ В ПОДКЛЮЧЕНИИ (сервис не запущен)"
+    if kind == "end":
+        return f"{asset_id}: ЗАПИСЬ ЗАКОНЧИЛАСЬ"
     return f"{asset_id}: ОШИБКА СВЯЗИ"
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, QSortFilterProxyModel, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from nord_skc.config import AssetConfig
+from nord_skc.ui.widgets import ASSETS_DIR, cached_pixmap, vendor_logo
+
+AssetRole = Qt.UserRole + 1     # AssetConfig
+HealthRole = Qt.UserRole + 2    # None | "checking" | (ok, rtt_ms)
+SearchRole = Qt.UserRole + 3    # строка для поиска: номер флота, госномер, производитель, id
+
+CARD_W, CARD_H = 300, 135
+TRUCK = f"{ASSETS_DIR}/fleet_truck.png"
+
+
+class FleetModel(QAbstractListModel):
+    """Агрегаты флота (по номеру флота) и состояние связи по каждому."""
+
+    def __init__(self, assets: List[AssetConfig], parent=None):
+        super().__init__(parent)
+        self.assets = sorted(assets, key=lambda a: a.fleet_no)
+        self._row: Dict[str, int] = {a.id: i for i, a in enumerate(self.assets)}
+        self._health: Dict[str, object] = {}
+        self._search = [self._search_text(a) for a in self.assets]
+
+    @staticmethod
+    def _search_text(a: AssetConfig) -> str:
+        vendor = str(a.extra.get("vendor", ""))
+        return f"{a.fleet_no} {a.fleet_no:02d} флот {a.fleet_no:02d} {a.plate} {vendor} {a.id}".lower()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.assets)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        a = self.assets[index.row()]
+        if role == Qt.DisplayRole:
+            return f"Флот {a.fleet_no:02d}"
+        if role == AssetRole:
+            return a
+        if role == HealthRole:
+            return self._health.get(a.id)
+        if role == SearchRole:
+            return self._search[index.row()]
+        if role == Qt.ToolTipRole:
+            return a.plate or None
+        return None
+
+    # ----------------- связь -----------------
+    def _changed(self, asset_id: str) -> None:
+        row = self._row.get(asset_id)
+        if row is not None:
+            ix = self.index(row)
+            self.dataChanged.emit(ix, ix, [HealthRole])
+
+    def set_checking(self, asset_id: str) -> None:
+        self._health[asset_id] = "checking"
+        self._changed(asset_id)
+
+    def set_health(self, asset_id: str, ok: bool, rtt_ms: float = 0.0) -> None:
+        self._health[asset_id] = (bool(ok), rtt_ms)
+        self._changed(asset_id)
+
+
+class FleetFilter(QSortFilterProxyModel):
+    """Поиск по номеру флота, госномеру, производителю (подстрока, без учёта регистра)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterRole(SearchRole)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def set_query(self, text: str) -> None:
+        self.setFilterFixedString(text.strip())
+
+
+def _health_text(h) -> Tuple[str, QColor]:
+    if h == "checking":
+        return "● проверка связи…", QColor("#777")
+    if isinstance(h, tuple):
+        ok, rtt = h
+        if ok:
+            rtt_s = f", {rtt:.0f} мс" if not math.isnan(rtt) else ""
+            return f"● на связи{rtt_s}", QColor("#4caf50")
+        return "● нет связи", QColor("#e57373")
+    return "", QColor("#777")
+
+
+class FleetDelegate(QStyledItemDelegate):
+    """
+    Рисует карточку агрегата целиком (без виджетов на карточку): рамка, грузовик,
+    «Флот NN», логотип производителя, госномер, связь. Картинки — из cached_pixmap:
+    загружаются и масштабируются один раз на процесс, а не на карточку.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPointSize(12)
+        self.title_font.setBold(True)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(CARD_W, CARD_H)
+
+    def paint(self, p: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        a: Optional[AssetConfig] = index.data(AssetRole)
+        if a is None:
+            return
+        p.save()
+        p.setRenderHint(QPainter.Antialiasing)
+        r = option.rect.adjusted(4, 4, -4, -4)
+
+        hover = bool(option.state & QStyle.State_MouseOver)
+        p.setPen(QPen(QColor("#4a4a4a" if hover else "#2b2b2b"), 1))
+        p.setBrush(Qt.NoBrush)
+        p.drawRoundedRect(r, 16, 16)
+
+        # иконка агрегата
+        icon = QRect(r.left() + 14, r.top() + 14, 72, 72)
+        p.setPen(QPen(QColor("#3a3a3a"), 1))
+        p.drawRoundedRect(icon, 14, 14)
+        truck = cached_pixmap(TRUCK, 56, 56)
+        if truck is not None:
+            p.drawPixmap(icon.center().x() - truck.width() // 2, icon.center().y() - truck.height() // 2, truck)
+        else:
+            p.setPen(option.palette.text().color())
+            p.setFont(self.title_font)
+            p.drawText(icon, Qt.AlignCenter, "F")
+
+        # правый столбец
+        x = icon.right() + 12
+        w = r.right() - 14 - x
+        y = r.top() + 14
+
+        p.setFont(self.title_font)
+        p.setPen(option.palette.text().color())
+        fm = p.fontMetrics()
+        p.drawText(QRect(x, y, w, fm.height()), Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
+        y += fm.height() + 6
+
+        p.setFont(option.font)
+        fm = p.fontMetrics()
+        logo = vendor_logo(str(a.extra.get("vendor", "")))
+        if logo is not None:
+            p.drawPixmap(x, y + (18 - logo.height()) // 2, logo)
+        y += 18 + 6
+
+        p.setPen(QColor("#aaa"))
+        plate = fm.elidedText(f"Госномер: {a.plate}", Qt.ElideRight, w)
+        p.drawText(QRect(x, y, w, fm.height()), Qt.AlignLeft | Qt.AlignVCenter, plate)
+        y += fm.height() + 6
+
+        text, color = _health_text(index.data(HealthRole))
+        if text:
+            p.setPen(color)
+            p.drawText(QRect(x, y, w, fm.height()), Qt.AlignLeft | Qt.AlignVCenter, text)
+        p.restore()
+
+
+class FleetView(QListView):
+    """
+    Сетка карточек флота на model/view: рисуются только видимые карточки,
+    виджетов на агрегат нет — время запуска и память не растут с размером флота.
+    """
+
+    asset_clicked = Signal(object)   # AssetConfig
+
+    def __init__(self, assets: List[AssetConfig], parent=None):
+        super().__init__(parent)
+        self.fleet = FleetModel(assets, self)
+        self.proxy = FleetFilter(self)
+        self.proxy.setSourceModel(self.fleet)
+        self.setModel(self.proxy)
+        self.setItemDelegate(FleetDelegate(self))
+
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(6)
+        self.setMouseTracking(True)            # подсветка карточки под курсором
+        self.setSelectionMode(QListView.NoSelection)
+        self.setFrameShape(QListView.NoFrame)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+
+        self.clicked.connect(self._emit_asset)
+
+    def set_query(self, text: str) -> None:
+        self.proxy.set_query(text)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter) and self.currentIndex().isValid():
+            self._emit_asset(self.currentIndex())
+            return
+        super().keyPressEvent(event)
+
+    def _emit_asset(self, index: QModelIndex) -> None:
+        a = index.data(AssetRole)
+        if a is not None:
+            self.asset_clicked.emit(a)
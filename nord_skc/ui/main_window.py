@@ -1,25 +1,30 @@
 from __future__ import annotations
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QObject, Signal, QThread, QTimer
 from PySide6.QtWidgets import QProgressDialog
-from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
-    QGridLayout,
     QLabel,
-    QScrollArea,
+    QLineEdit,
     QHBoxLayout,
     QSizePolicy,
     QMessageBox,
 )
 
 from nord_skc.config import Config, AssetConfig
-from nord_skc.drivers import SiemensS7Driver, ServaTcpDriver, BaseDriver
-from nord_skc.ui.widgets import AssetCard
-from nord_skc.ui.asset_window import AssetWindow
+from nord_skc.drivers import BaseDriver, make_driver
+from nord_skc.health import PROBE_TYPES, HealthChecker, ProbeResult
+from nord_skc.ui.fleet_view import FleetView
+from nord_skc.ui.widgets import ASSETS_DIR, cached_pixmap
+
+# окно агрегата тянет pyqtgraph, пул — multiprocessing/NumPy: импорт при первом использовании,
+# чтобы сетка флотов появлялась без них
+if TYPE_CHECKING:
+    from nord_skc.procpool import AcquisitionPool
+    from nord_skc.ui.asset_window import AssetWindow
 
 
 class ConnectWorker(QObject):
@@ -38,14 +43,33 @@ class ConnectWorker(QObject):
             self.failed.emit(e)
 
 
+class HealthWorker(QObject):
+    probed = Signal(object)            # ProbeResult, по мере готовности
+    finished = Signal()
+
+    def __init__(self, checker: HealthChecker, assets, skip):
+        super().__init__()
+        self._checker = checker
+        self._assets = list(assets)
+        self._skip = set(skip)
+
+    def run(self):
+        try:
+            self._checker.check_all(self._assets, on_result=self.probed.emit, skip=self._skip)
+        finally:
+            self.finished.emit()
+
+
 class MainWindow(QMainWindow):
+    first_painted = Signal()           # первая отрисовка окна (для отчёта о запуске)
+
     def __init__(self, cfg: Config):
         super().__init__()
         self.cfg = cfg
         self.setWindowTitle(cfg.app.name)
+        self._painted = False
 
-        self.asset_windows: Dict[str, AssetWindow] = {}
-        self.cards: Dict[str, AssetCard] = {}
+        self.asset_windows: Dict[str, "AssetWindow"] = {}
         self.drivers: Dict[str, BaseDriver] = {}
 
         self._connect_thread: QThread | None = None
@@ -53,6 +77,20 @@ class MainWindow(QMainWindow):
         self._connect_dialog: QProgressDialog | None = None
         self._pending_asset: AssetConfig | None = None
 
+        # проверка связи: все агрегаты параллельно, удачные подключения остаются «тёплыми»
+        self.health = HealthChecker(
+            budget_s=cfg.app.health_budget_s,
+            max_idle_s=max(30.0, float(cfg.app.health_check_s or 60)),
+        )
+        self._health_thread: QThread | None = None
+        self._health_worker: HealthWorker | None = None
+
+        # опрос в отдельных процессах (app.acquisition_processes > 0): подключается процесс опроса
+        self.pool: "AcquisitionPool | None" = None
+        if cfg.app.acquisition_processes > 0:
+            from nord_skc.procpool import AcquisitionPool
+            self.pool = AcquisitionPool(cfg.app.acquisition_processes)
+
         root = QWidget()
         self.setCentralWidget(root)
         v = QVBoxLayout(root)
@@ -68,12 +106,9 @@ class MainWindow(QMainWindow):
 
         # Logo (optional). If file is missing, it will just be empty.
         logo = QLabel()
-        try:
-            pix = QPixmap("nord_skc/assets/logo.png")
-            if not pix.isNull():
-                logo.setPixmap(pix.scaledToHeight(36, Qt.SmoothTransformation))
-        except Exception:
-            pass
+        pix = cached_pixmap(f"{ASSETS_DIR}/logo.png", height=36)
+        if pix is not None:
+            logo.setPixmap(pix)
         logo.setFixedHeight(40)
         hb.addWidget(logo, 0, Qt.AlignVCenter)
 
@@ -97,35 +132,71 @@ class MainWindow(QMainWindow):
         sep.setStyleSheet("background: #2f2f2f;")
         v.addWidget(sep)
 
-        # ===== Scroll with cards =====
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QScrollArea.NoFrame)
-        v.addWidget(scroll, 1)
-
-        grid_host = QWidget()
-        scroll.setWidget(grid_host)
-        grid = QGridLayout(grid_host)
-        grid.setContentsMargins(16, 16, 16, 16)
-        grid.setHorizontalSpacing(16)
-        grid.setVerticalSpacing(16)
-
-        cols = 4
-        row = col = 0
-        for a in sorted(cfg.assets, key=lambda x: x.fleet_no):
-            title = f"Флот {a.fleet_no:02d}"
-            vendor = a.extra.get("vendor", "")
-            plate = a.plate or ""
-
-            card = AssetCard(title=title, plate=plate, vendor=vendor)
-            card.clicked.connect(lambda _=None, asset=a: self.open_asset(asset))
-            grid.addWidget(card, row, col)
-            self.cards[a.id] = card
-
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
+        # ===== Поиск + сетка флота (model/view: карточки рисует делегат) =====
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Поиск: номер флота, госномер, производитель")
+        self.search.setClearButtonEnabled(True)
+        search_row = QHBoxLayout()
+        search_row.setContentsMargins(16, 12, 16, 0)
+        search_row.addWidget(self.search)
+        v.addLayout(search_row)
+
+        self.fleet_view = FleetView(cfg.assets)
+        self.fleet_view.setContentsMargins(10, 10, 10, 10)
+        self.fleet_view.asset_clicked.connect(self.open_asset)
+        self.search.textChanged.connect(self.fleet_view.set_query)
+        v.addWidget(self.fleet_view, 1)
+
+        self.fleet = self.fleet_view.fleet
+        for a in cfg.assets:
+            if a.type in PROBE_TYPES:
+                self.fleet.set_checking(a.id)
+
+        QTimer.singleShot(0, self.check_health)
+        self.health_timer = QTimer(self)
+        self.health_timer.timeout.connect(self.check_health)
+        if cfg.app.health_check_s > 0:
+            self.health_timer.start(int(cfg.app.health_check_s * 1000))
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.first_painted.emit()
+
+    # ---------- Проверка связи ----------
+    def check_health(self):
+        """Фоновая проверка всех агрегатов (открытые окна не трогаем — там идёт опрос)."""
+        if self._health_thread is not None:
+            return
+        self.health.expire()
+
+        skip = set(self.asset_windows)
+        if self._pending_asset is not None:
+            skip.add(self._pending_asset.id)
+
+        t = QThread(self)
+        w = HealthWorker(self.health, self.cfg.assets, skip)
+        w.moveToThread(t)
+        t.started.connect(w.run)
+        w.probed.connect(self._on_probed)
+        w.finished.connect(t.quit)
+        t.finished.connect(w.deleteLater)
+        t.finished.connect(t.deleteLater)
+        t.finished.connect(self._on_health_thread_finished)
+        self._health_thread = t
+        self._health_worker = w
+        t.start()
+
+    def _on_probed(self, r: ProbeResult):
+        self.fleet.set_health(r.asset_id, r.ok, r.rtt_ms)
+        # проверка закончилась, когда окно уже открыли через ConnectWorker — лишнее подключение закрываем
+        if r.ok and r.asset_id in self.asset_windows:
+            self.health.discard(r.asset_id)
+
+    def _on_health_thread_finished(self):
+        self._health_thread = None
+        self._health_worker = None
 
     # ---------- Драйверы ----------
     def _make_driver(self, a: AssetConfig) -> BaseDriver:
@@ -133,24 +204,7 @@ class MainWindow(QMainWindow):
         if a.id in self.drivers:
             return self.drivers[a.id]
 
-        if a.type == "siemens_s7":
-            tags = a.extra.get("tags") or {}
-            d = SiemensS7Driver(
-                ip=a.ip,
-                rack=int(a.extra.get("rack", 0)),
-                slot=int(a.extra.get("slot", 1)),
-                tags=tags,
-            )
-        elif a.type == "serva_tcp":
-            d = ServaTcpDriver(
-                ip=a.ip,
-                port=int(a.extra.get("port", 6565)),
-                timeout_s=float(a.extra.get("timeout_s", 2.0)),
-                field_names=list(a.extra.get("field_names") or []),
-            )
-        else:
-            raise ValueError(f"Unknown asset type: {a.type}")
-
+        d = make_driver(a)
         self.drivers[a.id] = d
         return d
 
@@ -160,6 +214,29 @@ class MainWindow(QMainWindow):
         if self._connect_dialog is not None:
             return
 
+        # окно уже открыто — драйвер занят опросом, подключать заново нечего
+        if a.id in self.asset_windows:
+            self._pending_asset = a
+            self._on_connect_ok(self.drivers.get(a.id))
+            return
+
+        # с пулом процессов подключение — дело процесса опроса, ошибки окно покажет само
+        if self.pool is not None:
+            warm = self.health.take(a.id)
+            if warm is not None:
+                warm.close()
+            self._pending_asset = a
+            self._on_connect_ok(None)
+            return
+
+        # проверка связи уже подключилась — открываем окно сразу, без второго handshake
+        warm = self.health.take(a.id)
+        if warm is not None:
+            self.drivers[a.id] = warm
+            self._pending_asset = a
+            self._on_connect_ok(warm)
+            return
+
         d = self._make_driver(a)
         self._pending_asset = a
 
@@ -233,8 +310,10 @@ class MainWindow(QMainWindow):
             return
 
         if a.id not in self.asset_windows:
-            w = AssetWindow(self.cfg.app, a, driver, config_path="config.yaml")
+            from nord_skc.ui.asset_window import AssetWindow
+            w = AssetWindow(self.cfg.app, a, driver, config_path="config.yaml", pool=self.pool)
             self.asset_windows[a.id] = w
+            self.health.hold(a.id)
 
         self.asset_windows[a.id].show()
         self.asset_windows[a.id].raise_()
@@ -253,6 +332,8 @@ class MainWindow(QMainWindow):
         if a is None:
             return
 
+        self.fleet.set_health(a.id, False)
+
         from nord_skc.ui.errors import make_connect_error_box
         make_connect_error_box(self, a, e).exec()
 
@@ -260,3 +341,19 @@ class MainWindow(QMainWindow):
         # поток завершился — ссылки больше невалидны
         self._connect_thread = None
         self._connect_worker = None
+
+    def closeEvent(self, event):
+        # проверка связи укладывается в бюджет — дожидаемся и закрываем тёплые подключения
+        self.health_timer.stop()
+        if self._health_thread is not None:
+            self._health_thread.quit()
+            self._health_thread.wait(int(self.health.budget_s * 1000) + 1000)
+        self.health.close()
+
+        # останавливаем фоновый опрос всех открытых агрегатов и закрываем соединения
+        for w in self.asset_windows.values():
+            w.stop_acquisition()
+            w.close()
+        if self.pool is not None:
+            self.pool.shutdown()
+        super().closeEvent(event)
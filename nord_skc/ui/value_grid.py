@@ -0,0 +1,275 @@
+"""
+Плитки значений окна агрегата — один виджет, все ячейки рисуются в одном paintEvent.
+
+На кадр: значение форматируется, и если текст не изменился — ничего не происходит;
+изменился — перерисовывается только прямоугольник этой ячейки. Никаких QLabel
+и setStyleSheet на канал.
+
+Порядок: закреплённые каналы первыми, дальше — по порядку появления, по имени
+или по значению (контекстное меню на плитке).
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from PySide6.QtCore import QEvent, QPoint, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QFrame, QMenu, QScrollArea, QSizePolicy, QToolTip, QWidget
+
+# режимы сортировки: код -> подпись в меню
+SORT_MODES = {
+    "order": "По порядку опроса",
+    "name": "По имени",
+    "value": "По значению",
+}
+
+CELL_MIN_W, CELL_H, GAP = 170, 62, 10
+EMPTY = "—"
+
+_BORDER = QColor("#2b2b2b")
+_PINNED = QColor("#4a7bd0")
+_NAME = QColor("#aaaaaa")
+
+
+def format_value(v: float) -> str:
+    return EMPTY if math.isnan(v) else f"{v:.3f}"
+
+
+class ValueGrid(QWidget):
+    """
+    Сетка плиток «имя / значение». Число столбцов — по ширине виджета,
+    высота — по числу строк (для QScrollArea с widgetResizable).
+    """
+
+    height_changed = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        self.channels: List[str] = []          # в порядке появления
+        self.pinned: Set[str] = set()          # могут быть заданы до появления канала
+        self.sort_mode = "order"
+
+        self._raw: Dict[str, float] = {}
+        self._text: Dict[str, str] = {}
+        self._order: List[str] = []            # порядок отрисовки
+        self._pos: Dict[str, int] = {}         # канал -> индекс ячейки
+        self._cols = 1
+        self._cell_w = CELL_MIN_W
+
+        self._value_font = QFont(self.font())
+        self._value_font.setPixelSize(18)
+        self._value_font.setBold(True)
+        self._name_fm = QFontMetrics(self.font())
+
+    # ----------------- данные -----------------
+    def set_values(self, values: Mapping[str, float]) -> None:
+        """Новые значения; перерисовываются только ячейки с изменившимся текстом."""
+        self._apply((k, float(v), format_value(float(v))) for k, v in values.items())
+
+    def set_texts(self, texts: Mapping[str, str]) -> None:
+        """Текстовые показания (S7 STRING); при сортировке по значению — в конце."""
+        self._apply((k, math.nan, t) for k, t in texts.items())
+
+    def _apply(self, items: Iterable[Tuple[str, float, str]]) -> None:
+        added = False
+        changed: List[str] = []
+        for k, v, text in items:
+            self._raw[k] = v
+            old = self._text.get(k)
+            if old is None:
+                self.channels.append(k)
+                added = True
+            elif old == text:
+                continue
+            self._text[k] = text
+            changed.append(k)
+
+        if added or (changed and self.sort_mode == "value"):
+            if self._relayout():
+                self.update()
+                return
+        for k in changed:
+            self.update(self.cell_rect(self._pos[k]))
+
+    def value_text(self, name: str) -> Optional[str]:
+        return self._text.get(name)
+
+    def clear(self) -> None:
+        self.channels.clear()
+        self._raw.clear()
+        self._text.clear()
+        self._relayout()
+        self.update()
+
+    # ----------------- порядок -----------------
+    def set_sort_mode(self, mode: str) -> None:
+        if mode not in SORT_MODES:
+            raise ValueError(f"Unknown sort mode: {mode}")
+        self.sort_mode = mode
+        if self._relayout():
+            self.update()
+
+    def set_pinned(self, name: str, pinned: bool = True) -> None:
+        if pinned:
+            self.pinned.add(name)
+        else:
+            self.pinned.discard(name)
+        self._relayout()
+        self.update()
+
+    def _sorted(self, names: Iterable[str]) -> List[str]:
+        names = list(names)
+        if self.sort_mode == "name":
+            return sorted(names, key=str.lower)
+        if self.sort_mode == "value":
+            raw = self._raw
+            # по убыванию, NaN — в конец; sorted устойчив: среди равных — порядок появления
+            return sorted(names, key=lambda k: (math.isnan(raw[k]), -raw[k]))
+        return names
+
+    def _relayout(self) -> bool:
+        """Пересчитывает порядок и высоту. True — порядок ячеек изменился."""
+        pinned = [k for k in self.channels if k in self.pinned]
+        rest = [k for k in self.channels if k not in self.pinned]
+        order = self._sorted(pinned) + self._sorted(rest)
+        moved = order != self._order
+        if moved:
+            self._order = order
+            self._pos = {k: i for i, k in enumerate(order)}
+        self._update_height()
+        return moved
+
+    # ----------------- геометрия -----------------
+    def _columns_for(self, width: int) -> int:
+        return max(1, (width + GAP) // (CELL_MIN_W + GAP))
+
+    def _update_height(self) -> None:
+        rows = -(-len(self._order) // self._cols) if self._order else 0
+        h = max(0, rows * (CELL_H + GAP) - GAP)
+        if h != self.minimumHeight():
+            self.setMinimumHeight(h)
+            self.updateGeometry()
+            self.height_changed.emit(h)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        w = self.width()
+        self._cols = self._columns_for(w)
+        self._cell_w = max(CELL_MIN_W, (w - GAP * (self._cols - 1)) // self._cols)
+        self._update_height()
+
+    def sizeHint(self) -> QSize:
+        return QSize(4 * (CELL_MIN_W + GAP) - GAP, self.minimumHeight())
+
+    def cell_rect(self, i: int) -> QRect:
+        r, c = divmod(i, self._cols)
+        return QRect(c * (self._cell_w + GAP), r * (CELL_H + GAP), self._cell_w, CELL_H)
+
+    def cell_at(self, pos: QPoint) -> Optional[str]:
+        c = pos.x() // (self._cell_w + GAP)
+        r = pos.y() // (CELL_H + GAP)
+        if c >= self._cols:
+            return None
+        i = r * self._cols + c
+        if 0 <= i < len(self._order) and self.cell_rect(i).contains(pos):
+            return self._order[i]
+        return None
+
+    # ----------------- отрисовка -----------------
+    def paintEvent(self, event):
+        if not self._order:
+            return
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        region = event.region()
+        area = region.boundingRect()
+        # только строки, попавшие в перерисовываемую область
+        r0 = max(0, area.top() // (CELL_H + GAP))
+        r1 = area.bottom() // (CELL_H + GAP)
+        first = r0 * self._cols
+        last = min(len(self._order), (r1 + 1) * self._cols)
+
+        name_font, value_font = self.font(), self._value_font
+        fm = self._name_fm
+        for i in range(first, last):
+            rect = self.cell_rect(i)
+            if not region.intersects(rect):
+                continue
+            k = self._order[i]
+            pinned = k in self.pinned
+
+            p.setPen(QPen(_PINNED if pinned else _BORDER, 1))
+            p.setBrush(Qt.NoBrush)
+            p.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 14, 14)
+
+            inner = rect.adjusted(14, 8, -14, -8)
+            p.setFont(name_font)
+            p.setPen(_NAME)
+            name = ("● " if pinned else "") + k
+            p.drawText(
+                QRect(inner.left(), inner.top(), inner.width(), fm.height()),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                fm.elidedText(name, Qt.ElideRight, inner.width()),
+            )
+            p.setFont(value_font)
+            p.setPen(self.palette().text().color())
+            p.drawText(
+                QRect(inner.left(), inner.top() + fm.height() + 2, inner.width(), inner.height() - fm.height() - 2),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                self._text.get(k, EMPTY),
+            )
+        p.end()
+
+    # ----------------- мышь -----------------
+    def event(self, e):
+        if e.type() == QEvent.ToolTip:
+            k = self.cell_at(e.pos())
+            if k is not None:
+                QToolTip.showText(e.globalPos(), k, self)
+            else:
+                QToolTip.hideText()
+                e.ignore()
+            return True
+        return super().event(e)
+
+    def mouseDoubleClickEvent(self, e):
+        k = self.cell_at(e.position().toPoint())
+        if k is not None:
+            self.set_pinned(k, k not in self.pinned)
+
+    def contextMenuEvent(self, e):
+        k = self.cell_at(e.pos())
+        menu = QMenu(self)
+        if k is not None:
+            pinned = k in self.pinned
+            act = menu.addAction("Открепить" if pinned else "Закрепить сверху")
+            act.triggered.connect(lambda _=False, key=k, on=not pinned: self.set_pinned(key, on))
+            menu.addSeparator()
+        for mode, title in SORT_MODES.items():
+            act = menu.addAction(title)
+            act.setCheckable(True)
+            act.setChecked(mode == self.sort_mode)
+            act.triggered.connect(lambda _=False, m=mode: self.set_sort_mode(m))
+        menu.exec(e.globalPos())
+
+
+class ValueGridArea(QScrollArea):
+    """ValueGrid с прокруткой: по высоте — по содержимому, но не больше max_rows строк."""
+
+    def __init__(self, max_rows: int = 3, parent=None):
+        super().__init__(parent)
+        self.max_rows = max(1, int(max_rows))
+        self.grid = ValueGrid()
+        self.setWidget(self.grid)
+        self.setWidgetResizable(True)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.grid.height_changed.connect(self._fit)
+        self._fit(0)
+
+    def _fit(self, h: int) -> None:
+        cap = self.max_rows * (CELL_H + GAP) - GAP
+        self.setFixedHeight(min(h, cap))
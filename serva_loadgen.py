@@ -0,0 +1,231 @@
+"""
+Нагрузочный симулятор SERVA: сотни агрегатов в одном asyncio-процессе.
+
+Протокол как у serva_fake.py: клиент шлёт $HELLO, агрегат, пока $HELLO
+приходил не позже HELLO_TTL секунд назад, шлёт CSV-строки с частотой --rate.
+
+Примеры:
+    # 200 агрегатов на портах 7000..7199, 50 Гц, и config для приложения
+    python serva_loadgen.py --units 200 --base-port 7000 --rate 50 --write-config config_load.yaml
+
+    # 100 агрегатов на 127.0.1.1..127.0.1.100, все на порту 6565 (Linux: весь 127/8 — loopback)
+    python serva_loadgen.py --units 100 --loopback 127.0.1.1 --rate 10
+
+При сотнях клиентов может понадобиться поднять лимит файлов: ulimit -n 4096
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ipaddress
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import yaml
+
+HELLO = b"$HELLO"
+HELLO_TTL = 2.0  # секунды: столько агрегат шлёт данные после последнего $HELLO
+N_CHANNELS = 12
+WAVES = ("sine", "square", "ramp", "noise", "const")
+
+
+def log(msg):
+    print(f"[SERVA LOADGEN] {msg}", flush=True)
+
+
+@dataclass
+class Channel:
+    wave: str
+    offset: float
+    amplitude: float
+    period_s: float
+    phase: float
+    rng: random.Random
+
+    def value(self, t: float) -> float:
+        x = (t / self.period_s + self.phase) % 1.0
+        if self.wave == "sine":
+            return self.offset + self.amplitude * math.sin(2 * math.pi * x)
+        if self.wave == "square":
+            return self.offset + (self.amplitude if x < 0.5 else -self.amplitude)
+        if self.wave == "ramp":
+            return self.offset + self.amplitude * (2 * x - 1)
+        if self.wave == "noise":
+            return self.offset + self.rng.gauss(0.0, self.amplitude / 3)
+        return self.offset
+
+
+@dataclass
+class Unit:
+    no: int
+    host: str
+    port: int
+    seed: int
+    waves: List[str]
+    channels: List[Channel] = field(default_factory=list)
+    clients: int = 0
+    frames: int = 0
+
+    def __post_init__(self):
+        rng = random.Random(self.seed)
+        for i in range(N_CHANNELS):
+            self.channels.append(
+                Channel(
+                    wave=self.waves[i % len(self.waves)],
+                    offset=rng.uniform(0, 100),
+                    amplitude=rng.uniform(1, 20),
+                    period_s=rng.uniform(2, 60),
+                    phase=rng.random(),
+                    rng=random.Random(self.seed * 1000 + i),
+                )
+            )
+
+    def frame(self, t: float) -> bytes:
+        ts = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+        vals = ",".join(f"{c.value(t):.3f}" for c in self.channels)
+        return f"R{self.no:05d},J65,{ts},{vals},07\r\n".encode("ascii")
+
+
+async def handle_client(unit: Unit, rate_hz: float, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    unit.clients += 1
+    last_hello = 0.0
+
+    async def read_hello():
+        nonlocal last_hello
+        while True:
+            data = await reader.read(1024)
+            if not data:
+                return
+            if HELLO in data:
+                last_hello = time.monotonic()
+
+    rx = asyncio.create_task(read_hello())
+    period = 1.0 / rate_hz
+    next_t = time.monotonic()
+    try:
+        while not rx.done():
+            now = time.monotonic()
+            if now - last_hello < HELLO_TTL:
+                writer.write(unit.frame(time.time()))
+                unit.frames += 1
+                await writer.drain()
+            next_t += period
+            delay = next_t - time.monotonic()
+            if delay < 0:
+                next_t = time.monotonic()
+                delay = 0
+            await asyncio.sleep(delay)
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        rx.cancel()
+        unit.clients -= 1
+        writer.close()
+
+
+def make_units(args) -> List[Unit]:
+    waves = [w.strip() for w in args.waves.split(",") if w.strip()]
+    for w in waves:
+        if w not in WAVES:
+            raise SystemExit(f"unknown wave: {w} (доступны: {', '.join(WAVES)})")
+
+    units: List[Unit] = []
+    for i in range(args.units):
+        if args.loopback:
+            host = str(ipaddress.IPv4Address(args.loopback) + i)
+            port = args.base_port
+        else:
+            host = args.host
+            port = args.base_port + i
+        units.append(Unit(no=i + 1, host=host, port=port, seed=args.seed + i, waves=waves))
+    return units
+
+
+def write_config(path: str, units: List[Unit], rate_hz: float, connect_host: Optional[str]) -> None:
+    """config.yaml для приложения: один serva_tcp-агрегат на каждый симулятор."""
+    cfg = {
+        "app": {"name": "NORD SKC (load test)", "poll_hz": max(1, int(rate_hz)), "history_seconds": 900},
+        "assets": [
+            {
+                "id": f"L-{u.no:03d}",
+                "fleet_no": u.no,
+                "plate": "",
+                "type": "serva_tcp",
+                "ip": connect_host or ("127.0.0.1" if u.host in ("0.0.0.0", "") else u.host),
+                "port": u.port,
+                "vendor": "SERVA",
+                "field_names": [],
+            }
+            for u in units
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(cfg, f, allow_unicode=True, sort_keys=False)
+    log(f"config written: {path} ({len(units)} assets)")
+
+
+async def report(units: List[Unit], every_s: float):
+    last = sum(u.frames for u in units)
+    t0 = time.monotonic()
+    while True:
+        await asyncio.sleep(every_s)
+        total = sum(u.frames for u in units)
+        t1 = time.monotonic()
+        clients = sum(u.clients for u in units)
+        log(f"clients={clients} frames/s={(total - last) / (t1 - t0):.0f} total={total}")
+        last, t0 = total, t1
+
+
+async def serve(args) -> None:
+    units = make_units(args)
+    if args.write_config:
+        write_config(args.write_config, units, args.rate, args.connect_host)
+
+    servers = []
+    for u in units:
+        srv = await asyncio.start_server(
+            lambda r, w, u=u: handle_client(u, args.rate, r, w), host=u.host, port=u.port, reuse_address=True
+        )
+        servers.append(srv)
+    log(f"{len(units)} units listening ({units[0].host}:{units[0].port} … {units[-1].host}:{units[-1].port}), "
+        f"rate={args.rate} Hz")
+
+    tasks = [asyncio.create_task(s.serve_forever()) for s in servers]
+    if args.report_s > 0:
+        tasks.append(asyncio.create_task(report(units, args.report_s)))
+    await asyncio.gather(*tasks)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Нагрузочный симулятор SERVA (много агрегатов, один процесс)")
+    p.add_argument("--units", type=int, default=10, help="сколько агрегатов поднять")
+    p.add_argument("--host", default="0.0.0.0", help="адрес для режима диапазона портов")
+    p.add_argument("--base-port", type=int, default=None,
+                   help="первый порт (по умолчанию 7000) или общий порт при --loopback (по умолчанию 6565)")
+    p.add_argument("--loopback", default="", help="первый loopback-адрес (127.0.1.1): по адресу на агрегат")
+    p.add_argument("--rate", type=float, default=1.0, help="строк в секунду на агрегат (до 100)")
+    p.add_argument("--waves", default="sine,ramp,square,noise", help=f"формы сигналов по каналам: {','.join(WAVES)}")
+    p.add_argument("--seed", type=int, default=1, help="зерно; у агрегата i — seed + i")
+    p.add_argument("--write-config", default="", help="записать config.yaml для этих агрегатов")
+    p.add_argument("--connect-host", default="", help="адрес агрегатов в config (по умолчанию 127.0.0.1)")
+    p.add_argument("--report-s", type=float, default=5.0, help="период вывода статистики, 0 — не выводить")
+    args = p.parse_args(argv)
+
+    if not (0 < args.rate <= 100):
+        raise SystemExit("--rate должен быть в диапазоне (0, 100]")
+    if args.base_port is None:
+        args.base_port = 6565 if args.loopback else 7000
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())